@@ -1,6 +1,9 @@
 """Database backend implementations."""
 
-from typing import TYPE_CHECKING, Type
+from functools import cache, lru_cache
+from importlib import import_module
+from importlib.metadata import EntryPoint, entry_points
+from typing import TYPE_CHECKING, Mapping, Optional, Type
 
 from ..exceptions import BackendNotAvailableError, ConfigurationError
 
@@ -8,71 +11,79 @@ if TYPE_CHECKING:
     from ..base import BaseConnection
     from ..config import ScraperConfig
 
+# Entry point group for third-party backends, e.g. in a plugin's pyproject.toml:
+#   [project.entry-points."schema_scraper.backends"]
+#   mydb = "mydb_scraper.backend:MyDBConnection"
+# The entry point names the connection class; its module must provide get_extractors().
+ENTRY_POINT_GROUP = "schema_scraper.backends"
 
-def get_backend(db_type: str) -> tuple[Type["BaseConnection"], dict]:
+# db_type -> (module, connection class, display name, driver package or None if stdlib)
+_BACKENDS: dict[str, tuple[str, str, str, Optional[str]]] = {
+    "mssql": (".mssql", "MSSQLConnection", "MSSQL", "pyodbc"),
+    "postgresql": (".postgresql", "PostgreSQLConnection", "PostgreSQL", "psycopg"),
+    "mysql": (".mysql", "MySQLConnection", "MySQL", "mysql-connector-python"),
+    "oracle": (".oracle", "OracleConnection", "Oracle", "oracledb"),
+    "sqlite": (".sqlite", "SQLiteConnection", "SQLite", None),
+    "snowflake": (".snowflake", "SnowflakeConnection", "Snowflake", "snowflake-connector-python"),
+}
+
+
+def get_backend(db_type: str) -> tuple[Type["BaseConnection"], Mapping[str, Optional[type]]]:
     """
     Get the connection class and extractors for a database type.
 
     Returns:
         Tuple of (ConnectionClass, extractors_dict)
     """
-    if db_type == "mssql":
-        try:
-            from .mssql import MSSQLConnection, get_extractors
-            return MSSQLConnection, get_extractors()
-        except ImportError as e:
-            raise BackendNotAvailableError(
-                f"MSSQL backend requires pyodbc. Install with: pip install schema-scraper[mssql]\n"
-                f"Error: {e}"
-            )
+    return _load_backend(db_type.lower())
 
-    elif db_type == "postgresql":
-        try:
-            from .postgresql import PostgreSQLConnection, get_extractors
-            return PostgreSQLConnection, get_extractors()
-        except ImportError as e:
-            raise BackendNotAvailableError(
-                f"PostgreSQL backend requires psycopg. Install with: pip install schema-scraper[postgresql]\n"
-                f"Error: {e}"
-            )
 
-    elif db_type == "mysql":
-        try:
-            from .mysql import MySQLConnection, get_extractors
-            return MySQLConnection, get_extractors()
-        except ImportError as e:
-            raise BackendNotAvailableError(
-                f"MySQL backend requires mysql-connector-python. Install with: pip install schema-scraper[mysql]\n"
-                f"Error: {e}"
+@lru_cache(maxsize=8)
+def _load_backend(db_type: str) -> tuple[Type["BaseConnection"], Mapping[str, Optional[type]]]:
+    """Resolve a backend once; the returned extractors mapping is shared and read-only."""
+    entry = _BACKENDS.get(db_type)
+    if entry is None:
+        plugin = _plugin_backends().get(db_type)
+        if plugin is None:
+            supported = ", ".join([*_BACKENDS, *_plugin_backends()])
+            raise ConfigurationError(
+                f"Unknown database type: {db_type}. "
+                f"Supported types: {supported}"
             )
+        return _load_plugin(plugin)
 
-    elif db_type == "oracle":
-        try:
-            from .oracle import OracleConnection, get_extractors
-            return OracleConnection, get_extractors()
-        except ImportError as e:
-            raise BackendNotAvailableError(
-                f"Oracle backend requires oracledb. Install with: pip install schema-scraper[oracle]\n"
-                f"Error: {e}"
-            )
+    module_name, class_name, label, requirement = entry
+    try:
+        module = import_module(module_name, __name__)
+    except ImportError as e:
+        if requirement is None:
+            raise
+        raise BackendNotAvailableError(
+            f"{label} backend requires {requirement}. "
+            f"Install with: pip install schema-scraper[{db_type}]\n"
+            f"Error: {e}"
+        )
+    return getattr(module, class_name), module.get_extractors()
 
-    elif db_type == "sqlite":
-        from .sqlite import SQLiteConnection, get_extractors
-        return SQLiteConnection, get_extractors()
 
-    elif db_type == "snowflake":
-        try:
-            from .snowflake import SnowflakeConnection, get_extractors
-            return SnowflakeConnection, get_extractors()
-        except ImportError as e:
-            raise BackendNotAvailableError(
-                f"Snowflake backend requires snowflake-connector-python. "
-                f"Install with: pip install schema-scraper[snowflake]\n"
-                f"Error: {e}"
-            )
+@cache
+def _plugin_backends() -> dict[str, EntryPoint]:
+    """Read the registered backend entry points once; modules load on demand."""
+    return {
+        ep.name: ep
+        for ep in entry_points(group=ENTRY_POINT_GROUP)
+        if ep.name not in _BACKENDS
+    }
+
 
-    else:
-        raise ConfigurationError(
-            f"Unknown database type: {db_type}. "
-            f"Supported types: mssql, postgresql, mysql, oracle, sqlite, snowflake"
+def _load_plugin(ep: EntryPoint) -> tuple[Type["BaseConnection"], Mapping[str, Optional[type]]]:
+    """Import a third-party backend registered via entry points."""
+    try:
+        connection_class = ep.load()
+        module = import_module(ep.module)
+    except ImportError as e:
+        raise BackendNotAvailableError(
+            f"Backend '{ep.name}' ({ep.value}) could not be loaded.\n"
+            f"Error: {e}"
         )
+    return connection_class, module.get_extractors()
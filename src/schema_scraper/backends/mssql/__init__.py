@@ -1,32 +1,57 @@
 """MS SQL Server backend."""
 
+from functools import cache
+from importlib import import_module
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+
 from .connection import MSSQLConnection
-from .extractors import (
-    FunctionExtractor,
-    ProcedureExtractor,
-    SecurityExtractor,
-    SequenceExtractor,
-    SynonymExtractor,
-    TableExtractor,
-    TriggerExtractor,
-    TypeExtractor,
-    ViewExtractor,
-)
-
-
-def get_extractors() -> dict:
+
+if TYPE_CHECKING:
+    from .extractors import (
+        FunctionExtractor,
+        ProcedureExtractor,
+        SecurityExtractor,
+        SequenceExtractor,
+        SynonymExtractor,
+        TableExtractor,
+        TriggerExtractor,
+        TypeExtractor,
+        ViewExtractor,
+    )
+
+# Extractor classes are resolved on first access (PEP 562) so that importing
+# MSSQLConnection alone does not load the extractors module.
+_EXTRACTOR_NAMES = {
+    "tables": "TableExtractor",
+    "views": "ViewExtractor",
+    "procedures": "ProcedureExtractor",
+    "functions": "FunctionExtractor",
+    "triggers": "TriggerExtractor",
+    "types": "TypeExtractor",
+    "sequences": "SequenceExtractor",
+    "synonyms": "SynonymExtractor",
+    "security": "SecurityExtractor",
+}
+
+_LAZY = frozenset(_EXTRACTOR_NAMES.values())
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(".extractors", __name__), name)
+    globals()[name] = value
+    return value
+
+
+@cache
+def get_extractors() -> Mapping[str, Optional[type]]:
     """Get all extractors for MSSQL."""
-    return {
-        "tables": TableExtractor,
-        "views": ViewExtractor,
-        "procedures": ProcedureExtractor,
-        "functions": FunctionExtractor,
-        "triggers": TriggerExtractor,
-        "types": TypeExtractor,
-        "sequences": SequenceExtractor,
-        "synonyms": SynonymExtractor,
-        "security": SecurityExtractor,
-    }
+    return MappingProxyType({
+        obj_type: __getattr__(class_name)
+        for obj_type, class_name in _EXTRACTOR_NAMES.items()
+    })
 
 
 __all__ = [
@@ -40,4 +65,5 @@ __all__ = [
     "TypeExtractor",
     "SequenceExtractor",
     "SynonymExtractor",
+    "SecurityExtractor",
 ]
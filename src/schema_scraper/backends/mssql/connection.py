@@ -2,96 +2,165 @@
 
 import logging
 import re
-from typing import Any, Optional
-
-import pyodbc
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Generator, NamedTuple, Optional, Sequence
 
 from ...base.connection import BaseConnection
 from ...config import ScraperConfig
-from ...exceptions import ConfigurationError, ConnectionError
+from ...exceptions import BackendNotAvailableError, ConfigurationError, ConnectionError
+
+if TYPE_CHECKING:
+    import pyodbc
 
 logger = logging.getLogger(__name__)
 
+# User-supplied connection strings may spell the keyword in any case
+_PWD_RE = re.compile(r"(PWD=)[^;]+", re.IGNORECASE)
+
+_PREFERRED_DRIVERS = (
+    "ODBC Driver 18 for SQL Server",
+    "ODBC Driver 17 for SQL Server",
+    "SQL Server Native Client 11.0",
+    "SQL Server",
+)
+
+
+def _import_pyodbc():
+    """Import pyodbc on first use so loading this module doesn't pull in ODBC."""
+    try:
+        import pyodbc
+    except ImportError as e:
+        raise BackendNotAvailableError(
+            f"MSSQL backend requires pyodbc. Install with: pip install schema-scraper[mssql]\n"
+            f"Error: {e}"
+        ) from e
+    return pyodbc
+
+
+class DriverInfo(NamedTuple):
+    """An ODBC driver name and whether it needs TrustServerCertificate."""
+
+    name: str
+    trust_cert: bool
+
+
+@lru_cache(maxsize=16)
+def _driver_info(name: str) -> DriverInfo:
+    """Parse a driver name once; ODBC Driver 18+ encrypts by default."""
+    return DriverInfo(name, "18" in name or "19" in name)
+
+
+@lru_cache(maxsize=1)
+def _detect_odbc_driver() -> DriverInfo:
+    """Detect available ODBC driver for SQL Server (once per process)."""
+    drivers = _import_pyodbc().drivers()
+    available = frozenset(drivers)
+    for driver in _PREFERRED_DRIVERS:
+        if driver in available:
+            return _driver_info(driver)
+
+    # Scan the original list so the fallback choice stays deterministic
+    fallback = next((d for d in drivers if "SQL Server" in d), None)
+    if fallback:
+        return _driver_info(fallback)
+
+    raise ConfigurationError(
+        f"No SQL Server ODBC driver found. Available drivers: {drivers}"
+    )
+
+
+def invalidate_driver_cache() -> None:
+    """Forget the detected ODBC driver, e.g. after installing a new one."""
+    _detect_odbc_driver.cache_clear()
+    _driver_info.cache_clear()
+
 
 class MSSQLConnection(BaseConnection):
     """MS SQL Server connection using pyodbc."""
 
     def __init__(self, config: ScraperConfig):
         super().__init__(config)
-        self._connection: Optional[pyodbc.Connection] = None
+        self._connection: "Optional[pyodbc.Connection]" = None
+        # One cursor per connection, reused by every execute_* call
+        self._cursor: "Optional[pyodbc.Cursor]" = None
 
     def connect(self) -> None:
-        """Establish database connection."""
+        """Establish database connection, reusing one that is already open."""
+        if self.is_connected():
+            return
+
+        pyodbc = _import_pyodbc()
         try:
             connection_string = self._build_connection_string()
-            logger.debug(f"Connecting with: {self._mask_connection_string(connection_string)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Connecting with: %s", self._mask_connection_string(connection_string))
             self._connection = pyodbc.connect(connection_string, timeout=30)
             logger.info(f"Connected to {self.config.database}")
         except pyodbc.Error as e:
+            self._connection = None
             raise ConnectionError(f"Failed to connect to database: {e}") from e
 
     def disconnect(self) -> None:
         """Close database connection."""
+        if self._cursor is not None:
+            self._cursor.close()
+            self._cursor = None
         if self._connection:
             self._connection.close()
             self._connection = None
             logger.info("Disconnected from database")
 
     @property
-    def connection(self) -> pyodbc.Connection:
+    def connection(self) -> "pyodbc.Connection":
         """Get the active connection."""
         if not self._connection:
             raise ConnectionError("Not connected to database")
         return self._connection
 
+    @contextmanager
+    def cursor(self) -> Generator["pyodbc.Cursor", None, None]:
+        """Get the connection's shared cursor, creating it on first use."""
+        if self._cursor is None:
+            self._cursor = self.connection.cursor()
+        yield self._cursor
+
     def _build_connection_string(self) -> str:
         """Build a connection string from config."""
-        if self.config.connection_string:
-            return self.config.connection_string
-
-        driver = self.config.driver or self._detect_driver()
-        parts = [
-            f"Driver={{{driver}}}",
-            f"Server={self.config.host}" + (f",{self.config.port}" if self.config.port != 1433 else ""),
-            f"Database={self.config.database}",
-        ]
-
-        if self.config.trusted_connection:
-            parts.append("Trusted_Connection=yes")
+        config = self.config
+        if config.connection_string:
+            return config.connection_string
+
+        driver = _driver_info(config.driver) if config.driver else _detect_odbc_driver()
+        server = config.host if config.port == 1433 else f"{config.host},{config.port}"
+        if config.trusted_connection:
+            auth = "Trusted_Connection=yes"
         else:
-            parts.append(f"UID={self.config.username}")
-            parts.append(f"PWD={self.config.password}")
-
-        # Trust server certificate for ODBC Driver 18+
-        if "18" in driver or "19" in driver:
-            parts.append("TrustServerCertificate=yes")
-
-        return ";".join(parts)
-
-    def _detect_driver(self) -> str:
-        """Detect available ODBC driver for SQL Server."""
-        drivers = pyodbc.drivers()
-        preferred_drivers = [
-            "ODBC Driver 18 for SQL Server",
-            "ODBC Driver 17 for SQL Server",
-            "SQL Server Native Client 11.0",
-            "SQL Server",
-        ]
-        for driver in preferred_drivers:
-            if driver in drivers:
-                return driver
-
-        sql_drivers = [d for d in drivers if "SQL Server" in d]
-        if sql_drivers:
-            return sql_drivers[0]
-
-        raise ConfigurationError(
-            f"No SQL Server ODBC driver found. Available drivers: {drivers}"
-        )
+            auth = f"UID={config.username};PWD={config.password}"
+
+        tsc = ";TrustServerCertificate=yes" if driver.trust_cert else ""
+
+        return f"Driver={{{driver.name}}};Server={server};Database={config.database};{auth}{tsc}"
 
     def _mask_connection_string(self, conn_str: str) -> str:
         """Mask sensitive parts of connection string for logging."""
-        return re.sub(r"(PWD=)[^;]+", r"\1***", conn_str)
+        return _PWD_RE.sub(r"\1***", conn_str)
+
+    def execute_multi(
+        self, queries: Sequence[tuple[str, tuple]]
+    ) -> list[list[dict[str, Any]]]:
+        """Execute several queries as one batch, reading each result set in turn."""
+        batch = ";\n".join(query for query, _ in queries)
+        params = tuple(param for _, query_params in queries for param in query_params)
+        results = []
+        with self.cursor() as cur:
+            cur.execute(batch, params)
+            while True:
+                columns = [column[0] for column in cur.description]
+                results.append([dict(zip(columns, row)) for row in cur.fetchall()])
+                if not cur.nextset():
+                    break
+        return results
 
     def get_version(self) -> str:
         """Get SQL Server version."""
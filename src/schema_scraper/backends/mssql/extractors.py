@@ -2,9 +2,11 @@
 
 import logging
 import re
+from collections import defaultdict
+from functools import lru_cache
 from typing import Any, Optional
 
-from ...base import BaseExtractor
+from ...base import BaseConnection, BaseExtractor
 from ...base.models import (
     CheckConstraint,
     Column,
@@ -34,17 +36,112 @@ from ...base.models import (
 
 logger = logging.getLogger(__name__)
 
+_SCHEMAS_QUERY = "SELECT schema_id, name FROM sys.schemas"
+_TYPES_QUERY = "SELECT user_type_id, name FROM sys.types"
+
+# sys.foreign_keys referential action descriptions -> display form
+_REF_ACTION = {
+    "NO_ACTION": "NO ACTION",
+    "CASCADE": "CASCADE",
+    "SET_NULL": "SET NULL",
+    "SET_DEFAULT": "SET DEFAULT",
+}
+
+# Comma-separated DML events of the trigger aliased "tr"; NULL when there are none
+_TRIGGER_EVENTS = """STUFF(
+                    CASE WHEN OBJECTPROPERTY(tr.object_id, 'ExecIsInsertTrigger') = 1 THEN ',INSERT' ELSE '' END
+                    + CASE WHEN OBJECTPROPERTY(tr.object_id, 'ExecIsUpdateTrigger') = 1 THEN ',UPDATE' ELSE '' END
+                    + CASE WHEN OBJECTPROPERTY(tr.object_id, 'ExecIsDeleteTrigger') = 1 THEN ',DELETE' ELSE '' END,
+                    1, 1, '')"""
+
+# One part of a multi-part name: [bracketed, with ]] escapes] or plain up to the next dot
+_NAME_PART = re.compile(r"\[((?:[^\]]|\]\])*)\]|([^.]*)")
+
+
+@lru_cache(maxsize=4096)
+def _parse_base_object(
+    base_object_name: str,
+) -> tuple[Optional[str], Optional[str], Optional[str], str]:
+    """Split a synonym's base object name into (server, database, schema, object)."""
+    parts = []
+    pos = 0
+    while True:
+        match = _NAME_PART.match(base_object_name, pos)
+        bracketed, plain = match.groups()
+        parts.append(plain if bracketed is None else bracketed.replace("]]", "]"))
+        pos = match.end()
+        if pos >= len(base_object_name) or base_object_name[pos] != ".":
+            break
+        pos += 1
+    parts = parts[:4]
+    return (None,) * (4 - len(parts)) + tuple(parts)
+
 
 class MSSQLBaseExtractor(BaseExtractor):
     """Base extractor with MSSQL-specific helpers."""
 
+    def __init__(self, connection: BaseConnection, config: Any):
+        super().__init__(connection, config)
+        # (schema, object) -> object-level MS_Description, once preloaded;
+        # column descriptions are joined into the column queries instead
+        self._ep_cache: Optional[dict[tuple[str, str], str]] = None
+        # schema_id -> name for included schemas, and user_type_id -> type name;
+        # resolved here so bulk queries need not join sys.schemas / sys.types
+        self._schema_names: Optional[dict[int, str]] = None
+        self._type_names: Optional[dict[int, str]] = None
+
+    def _get_schema_names(self) -> dict[int, str]:
+        """Get the names of the included schemas by schema_id, loading them once."""
+        if self._schema_names is None:
+            rows = self.connection.execute(_SCHEMAS_QUERY)
+            self._schema_names = {
+                schema_id: name for schema_id, name in rows if self._should_include_schema(name)
+            }
+        return self._schema_names
+
+    def _get_type_names(self) -> dict[int, str]:
+        """Get every type name by user_type_id, loading them once."""
+        if self._type_names is None:
+            rows = self.connection.execute(_TYPES_QUERY)
+            self._type_names = dict(rows)
+        return self._type_names
+
+    def _schema_id_filter(self, column: str) -> str:
+        """SQL predicate limiting a schema_id column to the included schemas."""
+        schema_ids = self._get_schema_names()
+        if not schema_ids:
+            return "1 = 0"
+        # schema_ids are integers read from the server, so inlining them is safe
+        return f"{column} IN ({', '.join(map(str, sorted(schema_ids)))})"
+
+    def _load_extended_properties(self) -> None:
+        """Preload every object-level MS_Description in a single query."""
+        query = f"""
+            SELECT s.name AS schema_name, o.name AS object_name,
+                   CAST(ep.value AS NVARCHAR(MAX)) AS description
+            FROM sys.extended_properties ep
+            JOIN sys.objects o ON ep.major_id = o.object_id
+            JOIN sys.schemas s ON o.schema_id = s.schema_id
+            WHERE ep.name = 'MS_Description' AND ep.class = 1 AND ep.minor_id = 0
+              AND {self._schema_id_filter("o.schema_id")}
+        """
+        rows = self.connection.iter_dict(query)
+        self._ep_cache = {
+            (row["schema_name"], row["object_name"]): row["description"] for row in rows
+        }
+
     def get_extended_property(
         self,
         schema_name: str,
         object_name: str,
         column_name: Optional[str] = None,
     ) -> Optional[str]:
-        """Get MS_Description extended property for an object."""
+        """
+        Get MS_Description extended property for an object or column.
+
+        Object descriptions come from the preloaded cache, which is filled
+        with a single query on first use; column lookups query directly.
+        """
         if column_name:
             query = """
                 SELECT CAST(ep.value AS NVARCHAR(MAX))
@@ -58,18 +155,10 @@ class MSSQLBaseExtractor(BaseExtractor):
                 AND c.name = ?
             """
             return self.connection.execute_scalar(query, (schema_name, object_name, column_name))
-        else:
-            query = """
-                SELECT CAST(ep.value AS NVARCHAR(MAX))
-                FROM sys.extended_properties ep
-                JOIN sys.objects o ON ep.major_id = o.object_id
-                JOIN sys.schemas s ON o.schema_id = s.schema_id
-                WHERE ep.name = 'MS_Description'
-                AND ep.minor_id = 0
-                AND s.name = ?
-                AND o.name = ?
-            """
-            return self.connection.execute_scalar(query, (schema_name, object_name))
+
+        if self._ep_cache is None:
+            self._load_extended_properties()
+        return self._ep_cache.get((schema_name, object_name))
 
 
 class TableExtractor(MSSQLBaseExtractor):
@@ -80,120 +169,155 @@ class TableExtractor(MSSQLBaseExtractor):
         tables = self._get_tables()
         logger.info(f"Found {len(tables)} tables")
 
+        # Each helper fetches its metadata for every table in one query,
+        # keyed by (schema_name, table_name); they are independent of each other.
+        # The description cache read by get_extended_property is filled alongside
+        results = self._run_parallel({
+            "extended_properties": self._load_extended_properties,
+            "columns": self._get_columns,
+            "primary_keys": self._get_primary_keys,
+            "foreign_keys": self._get_foreign_keys,
+            "indexes": self._get_indexes,
+            "check_constraints": self._get_check_constraints,
+            "unique_constraints": self._get_unique_constraints,
+            "triggers": self._get_table_triggers,
+            "stats": self._get_table_stats,
+            "partitioned": self._get_partitioned_tables,
+        })
+        columns = results["columns"]
+        primary_keys = results["primary_keys"]
+        foreign_keys = results["foreign_keys"]
+        indexes = results["indexes"]
+        check_constraints = results["check_constraints"]
+        unique_constraints = results["unique_constraints"]
+        triggers = results["triggers"]
+        stats = results["stats"]
+        # Partition details are only fetched when some table is partitioned
+        partitioning = self._get_partitioning(results["partitioned"])
+        referenced_by = self._build_references(foreign_keys)
+
         for table in tables:
-            table.columns = self._get_columns(table.schema_name, table.name)
-            table.primary_key = self._get_primary_key(table.schema_name, table.name)
-            table.foreign_keys = self._get_foreign_keys(table.schema_name, table.name)
-            table.indexes = self._get_indexes(table.schema_name, table.name)
-            table.check_constraints = self._get_check_constraints(table.schema_name, table.name)
-            table.unique_constraints = self._get_unique_constraints(table.schema_name, table.name)
-            table.triggers = self._get_table_triggers(table.schema_name, table.name)
-            table.partitioning = self._get_partitioning(table.schema_name, table.name)
+            key = (table.schema_name, table.name)
+            table.columns = columns.get(key, [])
+            table.primary_key = primary_keys.get(key)
+            table.foreign_keys = foreign_keys.get(key, [])
+            table.referenced_by = referenced_by.get(key, [])
+            table.indexes = indexes.get(key, [])
+            table.check_constraints = check_constraints.get(key, [])
+            table.unique_constraints = unique_constraints.get(key, [])
+            table.triggers = triggers.get(key, [])
+            table.partitioning = partitioning.get(key) or TablePartitioning(is_partitioned=False)
             table.description = self.get_extended_property(table.schema_name, table.name)
-            stats = self._get_table_stats(table.schema_name, table.name)
-            table.row_count = stats.get("row_count", 0)
-            table.total_space_kb = stats.get("total_space_kb", 0)
-            table.used_space_kb = stats.get("used_space_kb", 0)
+            table_stats = stats.get(key, {})
+            table.row_count = table_stats.get("row_count", 0)
+            table.total_space_kb = table_stats.get("total_space_kb", 0)
+            table.used_space_kb = table_stats.get("used_space_kb", 0)
 
-        self._build_references(tables)
         return tables
 
     def _get_tables(self) -> list[Table]:
         """Get list of all tables."""
-        query = """
+        query = f"""
             SELECT s.name AS schema_name, t.name AS table_name
             FROM sys.tables t
             JOIN sys.schemas s ON t.schema_id = s.schema_id
-            WHERE t.is_ms_shipped = 0
+            WHERE t.is_ms_shipped = 0 AND {self._schema_id_filter("t.schema_id")}
             ORDER BY s.name, t.name
         """
         rows = self.connection.execute_dict(query)
         return [
             Table(schema_name=row["schema_name"], name=row["table_name"])
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
-    def _get_columns(self, schema_name: str, table_name: str) -> list[Column]:
-        """Get columns for a table."""
-        query = """
+    def _get_columns(self) -> dict[tuple[str, str], list[Column]]:
+        """Get columns for all tables."""
+        query = f"""
             SELECT
-                c.name AS column_name, t.name AS data_type,
+                tb.schema_id, tb.name AS table_name,
+                c.name AS column_name, c.user_type_id,
                 c.max_length, c.precision, c.scale, c.is_nullable,
                 dc.definition AS default_value, c.is_identity,
                 CAST(ic.seed_value AS BIGINT) AS identity_seed,
                 CAST(ic.increment_value AS BIGINT) AS identity_increment,
                 c.is_computed, cc.definition AS computed_definition,
-                c.collation_name, c.column_id AS ordinal_position
+                c.collation_name, c.column_id AS ordinal_position,
+                CAST(ep.value AS NVARCHAR(MAX)) AS description
             FROM sys.columns c
-            JOIN sys.types t ON c.user_type_id = t.user_type_id
             JOIN sys.tables tb ON c.object_id = tb.object_id
-            JOIN sys.schemas s ON tb.schema_id = s.schema_id
             LEFT JOIN sys.default_constraints dc ON c.default_object_id = dc.object_id
             LEFT JOIN sys.identity_columns ic ON c.object_id = ic.object_id AND c.column_id = ic.column_id
             LEFT JOIN sys.computed_columns cc ON c.object_id = cc.object_id AND c.column_id = cc.column_id
-            WHERE s.name = ? AND tb.name = ?
-            ORDER BY c.column_id
+            LEFT JOIN sys.extended_properties ep ON ep.major_id = c.object_id AND ep.minor_id = c.column_id
+                   AND ep.class = 1 AND ep.name = 'MS_Description'
+            WHERE tb.is_ms_shipped = 0 AND {self._schema_id_filter("tb.schema_id")}
+            ORDER BY tb.schema_id, tb.name, c.column_id
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        columns = []
-        for row in rows:
-            col = Column(
-                name=row["column_name"],
-                data_type=row["data_type"],
-                max_length=row["max_length"],
-                precision=row["precision"],
-                scale=row["scale"],
-                is_nullable=row["is_nullable"],
-                default_value=row["default_value"],
-                is_identity=row["is_identity"],
-                identity_seed=row["identity_seed"],
-                identity_increment=row["identity_increment"],
-                is_computed=row["is_computed"],
-                computed_definition=row["computed_definition"],
-                collation=row["collation_name"],
-                ordinal_position=row["ordinal_position"],
+        schema_names = self._get_schema_names()
+        type_names = self._get_type_names()
+        columns: dict[tuple[str, str], list[Column]] = defaultdict(list)
+        # Streamed plain tuple rows: this is the largest result set, so skip per-row dicts
+        for (
+            schema_id, table_name, column_name, user_type_id, max_length, precision, scale,
+            is_nullable, default_value, is_identity, identity_seed, identity_increment,
+            is_computed, computed_definition, collation_name, ordinal_position, description,
+        ) in self.connection.execute_iter(query):
+            columns[(schema_names[schema_id], table_name)].append(
+                Column(
+                    name=column_name,
+                    data_type=type_names.get(user_type_id),
+                    max_length=max_length,
+                    precision=precision,
+                    scale=scale,
+                    is_nullable=is_nullable,
+                    default_value=default_value,
+                    is_identity=is_identity,
+                    identity_seed=identity_seed,
+                    identity_increment=identity_increment,
+                    is_computed=is_computed,
+                    computed_definition=computed_definition,
+                    collation=collation_name,
+                    ordinal_position=ordinal_position,
+                    description=description,
+                )
             )
-            col.description = self.get_extended_property(schema_name, table_name, row["column_name"])
-            columns.append(col)
         return columns
 
-    def _get_primary_key(self, schema_name: str, table_name: str) -> Optional[PrimaryKey]:
-        """Get primary key for a table."""
-        query = """
-            SELECT kc.name AS constraint_name, i.type_desc AS index_type
+    def _get_primary_keys(self) -> dict[tuple[str, str], PrimaryKey]:
+        """Get primary keys and their columns for all tables."""
+        query = f"""
+            SELECT
+                s.name AS schema_name, t.name AS table_name,
+                kc.name AS constraint_name, i.type_desc AS index_type,
+                c.name AS column_name
             FROM sys.key_constraints kc
             JOIN sys.tables t ON kc.parent_object_id = t.object_id
             JOIN sys.schemas s ON t.schema_id = s.schema_id
             JOIN sys.indexes i ON kc.parent_object_id = i.object_id AND kc.unique_index_id = i.index_id
-            WHERE kc.type = 'PK' AND s.name = ? AND t.name = ?
+            LEFT JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
+            LEFT JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
+            WHERE kc.type = 'PK' AND t.is_ms_shipped = 0 AND {self._schema_id_filter("t.schema_id")}
+            ORDER BY s.name, t.name, ic.key_ordinal
         """
-        pk_row = self.connection.execute_dict(query, (schema_name, table_name))
-        if not pk_row:
-            return None
+        primary_keys: dict[tuple[str, str], PrimaryKey] = {}
+        for row in self.connection.iter_dict(query):
+            key = (row["schema_name"], row["table_name"])
+            pk = primary_keys.get(key)
+            if pk is None:
+                pk = primary_keys[key] = PrimaryKey(
+                    name=row["constraint_name"],
+                    columns=[],
+                    is_clustered=row["index_type"] == "CLUSTERED",
+                )
+            if row["column_name"] is not None:
+                pk.columns.append(row["column_name"])
+        return primary_keys
 
-        pk_info = pk_row[0]
-        columns_query = """
-            SELECT c.name
-            FROM sys.index_columns ic
-            JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
-            JOIN sys.indexes i ON ic.object_id = i.object_id AND ic.index_id = i.index_id
-            JOIN sys.tables t ON i.object_id = t.object_id
-            JOIN sys.schemas s ON t.schema_id = s.schema_id
-            WHERE i.is_primary_key = 1 AND s.name = ? AND t.name = ?
-            ORDER BY ic.key_ordinal
-        """
-        col_rows = self.connection.execute_dict(columns_query, (schema_name, table_name))
-        return PrimaryKey(
-            name=pk_info["constraint_name"],
-            columns=[row["name"] for row in col_rows],
-            is_clustered=pk_info["index_type"] == "CLUSTERED",
-        )
-
-    def _get_foreign_keys(self, schema_name: str, table_name: str) -> list[ForeignKey]:
-        """Get foreign keys for a table."""
-        query = """
+    def _get_foreign_keys(self) -> dict[tuple[str, str], list[ForeignKey]]:
+        """Get foreign keys for all tables."""
+        query = f"""
             SELECT
+                s.name AS schema_name, t.name AS table_name, fk.object_id AS fk_id,
                 fk.name AS fk_name, rs.name AS referenced_schema, rt.name AS referenced_table,
                 fk.delete_referential_action_desc AS on_delete,
                 fk.update_referential_action_desc AS on_update
@@ -202,326 +326,308 @@ class TableExtractor(MSSQLBaseExtractor):
             JOIN sys.schemas s ON t.schema_id = s.schema_id
             JOIN sys.tables rt ON fk.referenced_object_id = rt.object_id
             JOIN sys.schemas rs ON rt.schema_id = rs.schema_id
-            WHERE s.name = ? AND t.name = ?
+            WHERE t.is_ms_shipped = 0 AND {self._schema_id_filter("t.schema_id")}
+            ORDER BY s.name, t.name
+        """
+        columns_query = f"""
+            SELECT fkc.constraint_object_id AS fk_id,
+                   pc.name AS parent_column, rc.name AS referenced_column
+            FROM sys.foreign_key_columns fkc
+            JOIN sys.columns pc ON fkc.parent_object_id = pc.object_id AND fkc.parent_column_id = pc.column_id
+            JOIN sys.columns rc ON fkc.referenced_object_id = rc.object_id AND fkc.referenced_column_id = rc.column_id
+            JOIN sys.tables t ON fkc.parent_object_id = t.object_id
+            WHERE t.is_ms_shipped = 0 AND {self._schema_id_filter("t.schema_id")}
+            ORDER BY fkc.constraint_object_id, fkc.constraint_column_id
         """
-        fk_rows = self.connection.execute_dict(query, (schema_name, table_name))
-        foreign_keys = []
+        fk_rows, column_rows = self.connection.execute_multi([(query, ()), (columns_query, ())])
+
+        # fk_id -> (parent columns, referenced columns), filled in one pass
+        columns_by_fk: dict[int, tuple[list[str], list[str]]] = defaultdict(lambda: ([], []))
+        for row in column_rows:
+            parent_columns, referenced_columns = columns_by_fk[row["fk_id"]]
+            parent_columns.append(row["parent_column"])
+            referenced_columns.append(row["referenced_column"])
 
+        foreign_keys: dict[tuple[str, str], list[ForeignKey]] = defaultdict(list)
         for fk_row in fk_rows:
-            columns_query = """
-                SELECT pc.name AS parent_column, rc.name AS referenced_column
-                FROM sys.foreign_key_columns fkc
-                JOIN sys.columns pc ON fkc.parent_object_id = pc.object_id AND fkc.parent_column_id = pc.column_id
-                JOIN sys.columns rc ON fkc.referenced_object_id = rc.object_id AND fkc.referenced_column_id = rc.column_id
-                JOIN sys.foreign_keys fk ON fkc.constraint_object_id = fk.object_id
-                WHERE fk.name = ?
-                ORDER BY fkc.constraint_column_id
-            """
-            col_rows = self.connection.execute_dict(columns_query, (fk_row["fk_name"],))
-            foreign_keys.append(
+            parent_columns, referenced_columns = columns_by_fk.get(fk_row["fk_id"], ([], []))
+            foreign_keys[(fk_row["schema_name"], fk_row["table_name"])].append(
                 ForeignKey(
                     name=fk_row["fk_name"],
-                    columns=[row["parent_column"] for row in col_rows],
+                    columns=parent_columns,
                     referenced_schema=fk_row["referenced_schema"],
                     referenced_table=fk_row["referenced_table"],
-                    referenced_columns=[row["referenced_column"] for row in col_rows],
-                    on_delete=fk_row["on_delete"].replace("_", " "),
-                    on_update=fk_row["on_update"].replace("_", " "),
+                    referenced_columns=referenced_columns,
+                    on_delete=_REF_ACTION.get(fk_row["on_delete"], fk_row["on_delete"]),
+                    on_update=_REF_ACTION.get(fk_row["on_update"], fk_row["on_update"]),
                 )
             )
         return foreign_keys
 
-    def _get_indexes(self, schema_name: str, table_name: str) -> list[Index]:
-        """Get indexes for a table."""
-        query = """
+    def _get_indexes(self) -> dict[tuple[str, str], list[Index]]:
+        """Get indexes for all tables."""
+        query = f"""
             SELECT
+                s.name AS schema_name, t.name AS table_name,
+                i.object_id, i.index_id,
                 i.name AS index_name, i.is_unique, i.type_desc AS index_type,
                 i.is_primary_key, i.filter_definition
             FROM sys.indexes i
             JOIN sys.tables t ON i.object_id = t.object_id
             JOIN sys.schemas s ON t.schema_id = s.schema_id
-            WHERE s.name = ? AND t.name = ? AND i.name IS NOT NULL
-            ORDER BY i.index_id
+            WHERE i.name IS NOT NULL AND t.is_ms_shipped = 0 AND {self._schema_id_filter("t.schema_id")}
+            ORDER BY s.name, t.name, i.index_id
         """
-        idx_rows = self.connection.execute_dict(query, (schema_name, table_name))
-        indexes = []
+        columns_query = f"""
+            SELECT ic.object_id, ic.index_id, c.name, ic.is_included_column
+            FROM sys.index_columns ic
+            JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
+            JOIN sys.tables t ON ic.object_id = t.object_id
+            WHERE t.is_ms_shipped = 0 AND {self._schema_id_filter("t.schema_id")}
+            ORDER BY ic.object_id, ic.index_id, ic.key_ordinal, ic.index_column_id
+        """
+        idx_rows, column_rows = self.connection.execute_multi([(query, ()), (columns_query, ())])
+
+        # (object_id, index_id) -> (key columns, included columns), filled in one pass
+        columns_by_index: dict[tuple[int, int], tuple[list[str], list[str]]] = defaultdict(lambda: ([], []))
+        for row in column_rows:
+            key_columns, included_columns = columns_by_index[(row["object_id"], row["index_id"])]
+            (included_columns if row["is_included_column"] else key_columns).append(row["name"])
 
+        indexes: dict[tuple[str, str], list[Index]] = defaultdict(list)
         for idx_row in idx_rows:
-            columns_query = """
-                SELECT c.name, ic.is_included_column
-                FROM sys.index_columns ic
-                JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
-                JOIN sys.indexes i ON ic.object_id = i.object_id AND ic.index_id = i.index_id
-                JOIN sys.tables t ON i.object_id = t.object_id
-                JOIN sys.schemas s ON t.schema_id = s.schema_id
-                WHERE i.name = ? AND s.name = ? AND t.name = ?
-                ORDER BY ic.key_ordinal, ic.index_column_id
-            """
-            col_rows = self.connection.execute_dict(
-                columns_query, (idx_row["index_name"], schema_name, table_name)
+            key_columns, included_columns = columns_by_index.get(
+                (idx_row["object_id"], idx_row["index_id"]), ([], [])
             )
-            indexes.append(
+            indexes[(idx_row["schema_name"], idx_row["table_name"])].append(
                 Index(
                     name=idx_row["index_name"],
-                    columns=[row["name"] for row in col_rows if not row["is_included_column"]],
+                    columns=key_columns,
                     is_unique=idx_row["is_unique"],
                     is_clustered=idx_row["index_type"] == "CLUSTERED",
                     is_primary_key=idx_row["is_primary_key"],
-                    included_columns=[row["name"] for row in col_rows if row["is_included_column"]],
+                    included_columns=included_columns,
                     filter_definition=idx_row["filter_definition"],
                     index_type=idx_row["index_type"],
                 )
             )
         return indexes
 
-    def _get_check_constraints(self, schema_name: str, table_name: str) -> list[CheckConstraint]:
-        """Get check constraints for a table."""
-        query = """
-            SELECT cc.name AS constraint_name, cc.definition
+    def _get_check_constraints(self) -> dict[tuple[str, str], list[CheckConstraint]]:
+        """Get check constraints for all tables."""
+        query = f"""
+            SELECT s.name AS schema_name, t.name AS table_name,
+                   cc.name AS constraint_name, cc.definition
             FROM sys.check_constraints cc
             JOIN sys.tables t ON cc.parent_object_id = t.object_id
             JOIN sys.schemas s ON t.schema_id = s.schema_id
-            WHERE s.name = ? AND t.name = ?
+            WHERE t.is_ms_shipped = 0 AND {self._schema_id_filter("t.schema_id")}
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        return [CheckConstraint(name=row["constraint_name"], definition=row["definition"]) for row in rows]
+        check_constraints: dict[tuple[str, str], list[CheckConstraint]] = defaultdict(list)
+        for row in self.connection.iter_dict(query):
+            check_constraints[(row["schema_name"], row["table_name"])].append(
+                CheckConstraint(name=row["constraint_name"], definition=row["definition"])
+            )
+        return check_constraints
 
-    def _get_unique_constraints(self, schema_name: str, table_name: str) -> list[UniqueConstraint]:
-        """Get unique constraints for a table."""
-        query = """
-            SELECT kc.name AS constraint_name
+    def _get_unique_constraints(self) -> dict[tuple[str, str], list[UniqueConstraint]]:
+        """Get unique constraints for all tables."""
+        query = f"""
+            SELECT s.name AS schema_name, t.name AS table_name,
+                   kc.object_id AS constraint_id, kc.name AS constraint_name
             FROM sys.key_constraints kc
             JOIN sys.tables t ON kc.parent_object_id = t.object_id
             JOIN sys.schemas s ON t.schema_id = s.schema_id
-            WHERE kc.type = 'UQ' AND s.name = ? AND t.name = ?
+            WHERE kc.type = 'UQ' AND t.is_ms_shipped = 0 AND {self._schema_id_filter("t.schema_id")}
         """
-        constraint_rows = self.connection.execute_dict(query, (schema_name, table_name))
-        unique_constraints = []
+        columns_query = f"""
+            SELECT kc.object_id AS constraint_id, c.name
+            FROM sys.key_constraints kc
+            JOIN sys.index_columns ic ON kc.parent_object_id = ic.object_id AND kc.unique_index_id = ic.index_id
+            JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
+            JOIN sys.tables t ON kc.parent_object_id = t.object_id
+            WHERE kc.type = 'UQ' AND t.is_ms_shipped = 0 AND {self._schema_id_filter("t.schema_id")}
+            ORDER BY kc.object_id, ic.key_ordinal
+        """
+        constraint_rows, column_rows = self.connection.execute_multi([(query, ()), (columns_query, ())])
 
+        columns_by_constraint: dict[int, list[str]] = defaultdict(list)
+        for row in column_rows:
+            columns_by_constraint[row["constraint_id"]].append(row["name"])
+
+        unique_constraints: dict[tuple[str, str], list[UniqueConstraint]] = defaultdict(list)
         for constraint_row in constraint_rows:
-            columns_query = """
-                SELECT c.name
-                FROM sys.index_columns ic
-                JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
-                JOIN sys.key_constraints kc ON ic.object_id = kc.parent_object_id AND ic.index_id = kc.unique_index_id
-                JOIN sys.tables t ON kc.parent_object_id = t.object_id
-                JOIN sys.schemas s ON t.schema_id = s.schema_id
-                WHERE kc.name = ? AND s.name = ? AND t.name = ?
-                ORDER BY ic.key_ordinal
-            """
-            col_rows = self.connection.execute_dict(
-                columns_query, (constraint_row["constraint_name"], schema_name, table_name)
-            )
-            unique_constraints.append(
+            unique_constraints[(constraint_row["schema_name"], constraint_row["table_name"])].append(
                 UniqueConstraint(
                     name=constraint_row["constraint_name"],
-                    columns=[row["name"] for row in col_rows],
+                    columns=columns_by_constraint.get(constraint_row["constraint_id"], []),
                 )
             )
         return unique_constraints
 
-    def _get_partitioning(self, schema_name: str, table_name: str) -> Optional[TablePartitioning]:
-        """Get partitioning information for a table."""
-        # Check if table is partitioned
-        partition_check_query = """
-            SELECT ps.name AS partition_scheme_name, pf.name AS partition_function_name,
-                   pf.fanout AS partition_count, pf.boundary_value_on_right
+    def _get_partitioned_tables(self) -> dict[tuple[str, str], dict[str, Any]]:
+        """Get partition scheme, function and column for every partitioned table."""
+        query = f"""
+            SELECT s.name AS schema_name, t.name AS table_name,
+                   ps.name AS partition_scheme_name, pf.name AS partition_function_name,
+                   pf.boundary_value_on_right, c.name AS partition_column
             FROM sys.tables t
             JOIN sys.schemas s ON t.schema_id = s.schema_id
             JOIN sys.indexes i ON t.object_id = i.object_id AND i.index_id IN (0, 1)
             JOIN sys.partition_schemes ps ON i.data_space_id = ps.data_space_id
             JOIN sys.partition_functions pf ON ps.function_id = pf.function_id
-            WHERE s.name = ? AND t.name = ?
+            LEFT JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
+                   AND ic.partition_ordinal = 1
+            LEFT JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
+            WHERE t.is_ms_shipped = 0 AND {self._schema_id_filter("t.schema_id")}
         """
-
-        partition_rows = self.connection.execute_dict(partition_check_query, (schema_name, table_name))
-        if not partition_rows:
-            return TablePartitioning(is_partitioned=False)
-
-        row = partition_rows[0]
-
-        # Get partition column
-        column_query = """
-            SELECT c.name AS column_name
+        rows = self.connection.execute_dict(query)
+        return {(row["schema_name"], row["table_name"]): row for row in rows}
+
+    def _get_partitioning(
+        self, partitioned: dict[tuple[str, str], dict[str, Any]]
+    ) -> dict[tuple[str, str], TablePartitioning]:
+        """Get the partitions of every partitioned table."""
+        if not partitioned:
+            return {}
+
+        # One row per partition; partition N starts at boundary N - 1
+        query = f"""
+            SELECT s.name AS schema_name, t.name AS table_name,
+                   p.partition_number, p.rows AS row_count, fg.name AS filegroup_name,
+                   p.data_compression_desc AS data_compression, prv.value AS boundary_value
             FROM sys.tables t
             JOIN sys.schemas s ON t.schema_id = s.schema_id
             JOIN sys.indexes i ON t.object_id = i.object_id AND i.index_id IN (0, 1)
             JOIN sys.partition_schemes ps ON i.data_space_id = ps.data_space_id
-            JOIN sys.partition_parameters pp ON ps.function_id = pp.function_id
-            JOIN sys.columns c ON pp.object_id = c.object_id AND pp.parameter_id = c.column_id
-            WHERE s.name = ? AND t.name = ?
-        """
-        column_rows = self.connection.execute_dict(column_query, (schema_name, table_name))
-        partition_column = column_rows[0]["column_name"] if column_rows else ""
-
-        # Get partition boundaries
-        boundary_query = """
-            SELECT prv.boundary_id, prv.value AS boundary_value, fg.name AS filegroup_name
-            FROM sys.partition_range_values prv
-            JOIN sys.partition_functions pf ON prv.function_id = pf.function_id
-            JOIN sys.partition_schemes ps ON pf.function_id = ps.function_id
+            JOIN sys.partitions p ON i.object_id = p.object_id AND i.index_id = p.index_id
             JOIN sys.destination_data_spaces dds ON ps.data_space_id = dds.partition_scheme_id
-                   AND prv.boundary_id = dds.destination_id
+                   AND p.partition_number = dds.destination_id
             JOIN sys.filegroups fg ON dds.data_space_id = fg.data_space_id
-            WHERE pf.name = ?
-            ORDER BY prv.boundary_id
+            LEFT JOIN sys.partition_range_values prv ON ps.function_id = prv.function_id
+                   AND prv.boundary_id = p.partition_number - 1
+            WHERE t.is_ms_shipped = 0 AND {self._schema_id_filter("t.schema_id")}
+            ORDER BY s.name, t.name, p.partition_number
         """
-        boundary_rows = self.connection.execute_dict(boundary_query, (row["partition_function_name"],))
+        partitions: dict[tuple[str, str], list[Partition]] = defaultdict(list)
+        for row in self.connection.execute_dict(query):
+            partitions[(row["schema_name"], row["table_name"])].append(
+                Partition(
+                    partition_number=row["partition_number"],
+                    boundary_value=str(row["boundary_value"]) if row["boundary_value"] is not None else None,
+                    filegroup_name=row["filegroup_name"],
+                    row_count=row["row_count"] or 0,
+                    data_compression=row["data_compression"],
+                )
+            )
 
-        # Get partition statistics
-        partition_stats_query = """
-            SELECT p.partition_number, p.rows AS row_count, fg.name AS filegroup_name,
-                   p.data_compression_desc AS data_compression
-            FROM sys.tables t
-            JOIN sys.schemas s ON t.schema_id = s.schema_id
-            JOIN sys.indexes i ON t.object_id = i.object_id AND i.index_id IN (0, 1)
-            JOIN sys.partitions p ON i.object_id = p.object_id AND i.index_id = p.index_id
-            JOIN sys.destination_data_spaces dds ON p.partition_number = dds.destination_id
-                   AND i.data_space_id = dds.partition_scheme_id
-            JOIN sys.filegroups fg ON dds.data_space_id = fg.data_space_id
-            WHERE s.name = ? AND t.name = ?
-            ORDER BY p.partition_number
-        """
-        stats_rows = self.connection.execute_dict(partition_stats_query, (schema_name, table_name))
-
-        # Build partitions list
-        partitions = []
-        stats_dict = {row["partition_number"]: row for row in stats_rows}
-
-        for boundary_row in boundary_rows:
-            partition_num = boundary_row["boundary_id"] + 1  # SQL Server partitions are 1-based
-            stats = stats_dict.get(partition_num, {})
-
-            partitions.append(Partition(
-                partition_number=partition_num,
-                boundary_value=str(boundary_row["boundary_value"]) if boundary_row["boundary_value"] else None,
-                filegroup_name=boundary_row["filegroup_name"],
-                row_count=stats.get("row_count", 0),
-                data_compression=stats.get("data_compression"),
-            ))
-
-        # Handle the last partition (no boundary)
-        if stats_rows and len(stats_rows) > len(boundary_rows):
-            last_partition = stats_rows[-1]
-            if last_partition["partition_number"] > len(boundary_rows):
-                partitions.append(Partition(
-                    partition_number=last_partition["partition_number"],
-                    filegroup_name=last_partition["filegroup_name"],
-                    row_count=last_partition["row_count"],
-                    data_compression=last_partition["data_compression"],
-                ))
-
-        partition_scheme = PartitionScheme(
-            name=row["partition_scheme_name"],
-            partition_function_name=row["partition_function_name"],
-            partition_column=partition_column,
-            partition_type="RANGE",
-            boundary_type="RIGHT" if row["boundary_value_on_right"] else "LEFT",
-            partitions=partitions,
-        )
-
-        return TablePartitioning(
-            partition_scheme=partition_scheme,
-            is_partitioned=True,
-        )
-
-    def _get_table_triggers(self, schema_name: str, table_name: str) -> list[Trigger]:
-        """Get triggers for a table."""
-        query = """
+        return {
+            key: TablePartitioning(
+                partition_scheme=PartitionScheme(
+                    name=scheme_row["partition_scheme_name"],
+                    partition_function_name=scheme_row["partition_function_name"],
+                    partition_column=scheme_row["partition_column"] or "",
+                    partition_type="RANGE",
+                    boundary_type="RIGHT" if scheme_row["boundary_value_on_right"] else "LEFT",
+                    partitions=partitions.get(key, []),
+                ),
+                is_partitioned=True,
+            )
+            for key, scheme_row in partitioned.items()
+        }
+
+    def _get_table_triggers(self) -> dict[tuple[str, str], list[Trigger]]:
+        """Get triggers for all tables."""
+        query = f"""
             SELECT
+                ps.name AS schema_name, pt.name AS table_name,
                 tr.name AS trigger_name,
                 CASE WHEN tr.is_instead_of_trigger = 1 THEN 'INSTEAD OF' ELSE 'AFTER' END AS trigger_type,
-                OBJECTPROPERTY(tr.object_id, 'ExecIsInsertTrigger') AS is_insert,
-                OBJECTPROPERTY(tr.object_id, 'ExecIsUpdateTrigger') AS is_update,
-                OBJECTPROPERTY(tr.object_id, 'ExecIsDeleteTrigger') AS is_delete,
-                tr.is_disabled
+                {_TRIGGER_EVENTS} AS events,
+                tr.is_disabled, m.definition
             FROM sys.triggers tr
             JOIN sys.tables pt ON tr.parent_id = pt.object_id
             JOIN sys.schemas ps ON pt.schema_id = ps.schema_id
-            WHERE tr.is_ms_shipped = 0 AND tr.parent_class = 1
-            AND ps.name = ? AND pt.name = ?
+            LEFT JOIN sys.sql_modules m ON tr.object_id = m.object_id
+            WHERE tr.is_ms_shipped = 0 AND tr.parent_class = 1 AND {self._schema_id_filter("pt.schema_id")}
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        triggers = []
+        rows = self.connection.iter_dict(query)
+        triggers: dict[tuple[str, str], list[Trigger]] = defaultdict(list)
 
         for row in rows:
-            events = []
-            if row["is_insert"]:
-                events.append("INSERT")
-            if row["is_update"]:
-                events.append("UPDATE")
-            if row["is_delete"]:
-                events.append("DELETE")
-
-            # Get trigger definition
-            def_query = """
-                SELECT m.definition
-                FROM sys.sql_modules m
-                JOIN sys.triggers tr ON m.object_id = tr.object_id
-                WHERE tr.name = ?
-            """
-            def_rows = self.connection.execute_dict(def_query, (row["trigger_name"],))
-            definition = def_rows[0]["definition"] if def_rows else None
-
-            triggers.append(
+            triggers[(row["schema_name"], row["table_name"])].append(
                 Trigger(
-                    schema_name=schema_name,
+                    schema_name=row["schema_name"],
                     name=row["trigger_name"],
-                    parent_table_schema=schema_name,
-                    parent_table_name=table_name,
+                    parent_table_schema=row["schema_name"],
+                    parent_table_name=row["table_name"],
                     trigger_type=row["trigger_type"],
-                    events=events,
-                    definition=definition,
+                    events=row["events"].split(",") if row["events"] else [],
+                    definition=row["definition"],
                     is_disabled=bool(row["is_disabled"]),
                 )
             )
         return triggers
 
-    def _get_table_stats(self, schema_name: str, table_name: str) -> dict[str, Any]:
-        """Get row count and space statistics for a table."""
-        query = """
-            SELECT
-                SUM(p.rows) AS row_count,
-                SUM(a.total_pages) * 8 AS total_space_kb,
-                SUM(a.used_pages) * 8 AS used_space_kb
-            FROM sys.tables t
-            JOIN sys.schemas s ON t.schema_id = s.schema_id
-            JOIN sys.indexes i ON t.object_id = i.object_id
-            JOIN sys.partitions p ON i.object_id = p.object_id AND i.index_id = p.index_id
-            JOIN sys.allocation_units a ON p.partition_id = a.container_id
-            WHERE s.name = ? AND t.name = ? AND i.index_id IN (0, 1)
-            GROUP BY t.object_id
-        """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        if rows:
-            return {
-                "row_count": rows[0]["row_count"] or 0,
-                "total_space_kb": rows[0]["total_space_kb"] or 0,
-                "used_space_kb": rows[0]["used_space_kb"] or 0,
-            }
-        return {"row_count": 0, "total_space_kb": 0, "used_space_kb": 0}
-
-    def _build_references(self, tables: list[Table]) -> None:
-        """Build the referenced_by list for each table."""
-        query = """
-            SELECT
-                ps.name AS parent_schema, pt.name AS parent_table, fk.name AS fk_name,
-                rs.name AS referenced_schema, rt.name AS referenced_table
-            FROM sys.foreign_keys fk
-            JOIN sys.tables pt ON fk.parent_object_id = pt.object_id
-            JOIN sys.schemas ps ON pt.schema_id = ps.schema_id
-            JOIN sys.tables rt ON fk.referenced_object_id = rt.object_id
-            JOIN sys.schemas rs ON rt.schema_id = rs.schema_id
-        """
+    def _get_table_stats(self) -> dict[tuple[str, str], dict[str, Any]]:
+        """Get row count and space statistics for all tables."""
+        if not self.config.include_stats:
+            return {}
+        # sys.dm_db_partition_stats already holds per-partition row and page
+        # counts, so one scan replaces the partitions/allocation_units join.
+        # It needs VIEW DATABASE STATE, so check that rather than treating any
+        # failure of the DMV query as a missing permission
+        if self.connection.execute_scalar("SELECT HAS_PERMS_BY_NAME(NULL, NULL, 'VIEW DATABASE STATE')"):
+            query = f"""
+                SELECT
+                    s.name AS schema_name, t.name AS table_name,
+                    SUM(ps.row_count) AS row_count,
+                    SUM(ps.reserved_page_count) * 8 AS total_space_kb,
+                    SUM(ps.used_page_count) * 8 AS used_space_kb
+                FROM sys.dm_db_partition_stats ps
+                JOIN sys.tables t ON ps.object_id = t.object_id
+                JOIN sys.schemas s ON t.schema_id = s.schema_id
+                WHERE t.is_ms_shipped = 0 AND ps.index_id IN (0, 1)
+                AND {self._schema_id_filter("t.schema_id")}
+                GROUP BY s.name, t.name
+            """
+        else:
+            logger.debug("No VIEW DATABASE STATE permission, using sys.allocation_units")
+            query = f"""
+                SELECT
+                    s.name AS schema_name, t.name AS table_name,
+                    SUM(p.rows) AS row_count,
+                    SUM(a.total_pages) * 8 AS total_space_kb,
+                    SUM(a.used_pages) * 8 AS used_space_kb
+                FROM sys.tables t
+                JOIN sys.schemas s ON t.schema_id = s.schema_id
+                JOIN sys.indexes i ON t.object_id = i.object_id
+                JOIN sys.partitions p ON i.object_id = p.object_id AND i.index_id = p.index_id
+                JOIN sys.allocation_units a ON p.partition_id = a.container_id
+                WHERE t.is_ms_shipped = 0 AND {self._schema_id_filter("t.schema_id")} AND i.index_id IN (0, 1)
+                GROUP BY s.name, t.name
+            """
         rows = self.connection.execute_dict(query)
-        table_map = {(t.schema_name, t.name): t for t in tables}
+        return {
+            (row["schema_name"], row["table_name"]): {
+                "row_count": row["row_count"] or 0,
+                "total_space_kb": row["total_space_kb"] or 0,
+                "used_space_kb": row["used_space_kb"] or 0,
+            }
+            for row in rows
+        }
 
-        for row in rows:
-            ref_key = (row["referenced_schema"], row["referenced_table"])
-            if ref_key in table_map:
-                table_map[ref_key].referenced_by.append(
-                    (row["parent_schema"], row["parent_table"], row["fk_name"])
+    def _build_references(
+        self, foreign_keys: dict[tuple[str, str], list[ForeignKey]]
+    ) -> dict[tuple[str, str], list[tuple[str, str, str]]]:
+        """Invert foreign keys into (schema, table, fk_name) entries per referenced table."""
+        referenced_by: dict[tuple[str, str], list[tuple[str, str, str]]] = {}
+        for (schema_name, table_name), table_fks in foreign_keys.items():
+            for fk in table_fks:
+                referenced_by.setdefault((fk.referenced_schema, fk.referenced_table), []).append(
+                    (schema_name, table_name, fk.name)
                 )
+        return referenced_by
 
 
 class ViewExtractor(MSSQLBaseExtractor):
@@ -532,84 +638,99 @@ class ViewExtractor(MSSQLBaseExtractor):
         views = self._get_views()
         logger.info(f"Found {len(views)} views")
 
+        results = self._run_parallel({
+            "columns": self._get_columns,
+            "base_tables": self._get_base_tables,
+        })
+        columns = results["columns"]
+        base_tables = results["base_tables"]
+
         for view in views:
-            view.columns = self._get_columns(view.schema_name, view.name)
-            view.definition = self._get_definition(view.schema_name, view.name)
-            view.description = self.get_extended_property(view.schema_name, view.name)
-            view.base_tables = self._get_base_tables(view.schema_name, view.name)
+            key = (view.schema_name, view.name)
+            view.columns = columns.get(key, [])
+            view.base_tables = base_tables.get(key, [])
 
         return views
 
     def _get_views(self) -> list[View]:
-        """Get list of all views."""
-        query = """
-            SELECT s.name AS schema_name, v.name AS view_name,
-                   OBJECTPROPERTY(v.object_id, 'IsSchemaBound') AS is_schema_bound
+        """Get all views with their definitions and descriptions."""
+        query = f"""
+            SELECT s.name AS schema_name, v.name AS view_name, {self._definition_column("m.definition")},
+                   CAST(ep.value AS NVARCHAR(MAX)) AS description
             FROM sys.views v
             JOIN sys.schemas s ON v.schema_id = s.schema_id
-            WHERE v.is_ms_shipped = 0
+            LEFT JOIN sys.sql_modules m ON v.object_id = m.object_id
+            LEFT JOIN sys.extended_properties ep ON ep.major_id = v.object_id AND ep.minor_id = 0
+                   AND ep.class = 1 AND ep.name = 'MS_Description'
+            WHERE v.is_ms_shipped = 0 AND {self._schema_id_filter("v.schema_id")}
             ORDER BY s.name, v.name
         """
         rows = self.connection.execute_dict(query)
         return [
-            View(schema_name=row["schema_name"], name=row["view_name"])
+            View(
+                schema_name=row["schema_name"],
+                name=row["view_name"],
+                definition=row["definition"],
+                description=row["description"],
+            )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
-    def _get_columns(self, schema_name: str, view_name: str) -> list[Column]:
-        """Get columns for a view."""
-        query = """
+    def _get_columns(self) -> dict[tuple[str, str], list[Column]]:
+        """Get columns for all views."""
+        query = f"""
             SELECT
-                c.name AS column_name, t.name AS data_type,
+                v.schema_id, v.name AS view_name,
+                c.name AS column_name, c.user_type_id,
                 c.max_length, c.precision, c.scale, c.is_nullable,
-                c.collation_name, c.column_id AS ordinal_position
+                c.collation_name, c.column_id AS ordinal_position,
+                CAST(ep.value AS NVARCHAR(MAX)) AS description
             FROM sys.columns c
-            JOIN sys.types t ON c.user_type_id = t.user_type_id
             JOIN sys.views v ON c.object_id = v.object_id
-            JOIN sys.schemas s ON v.schema_id = s.schema_id
-            WHERE s.name = ? AND v.name = ?
-            ORDER BY c.column_id
+            LEFT JOIN sys.extended_properties ep ON ep.major_id = c.object_id AND ep.minor_id = c.column_id
+                   AND ep.class = 1 AND ep.name = 'MS_Description'
+            WHERE v.is_ms_shipped = 0 AND {self._schema_id_filter("v.schema_id")}
+            ORDER BY v.schema_id, v.name, c.column_id
         """
-        rows = self.connection.execute_dict(query, (schema_name, view_name))
-        return [
-            Column(
-                name=row["column_name"],
-                data_type=row["data_type"],
-                max_length=row["max_length"],
-                precision=row["precision"],
-                scale=row["scale"],
-                is_nullable=row["is_nullable"],
-                collation=row["collation_name"],
-                ordinal_position=row["ordinal_position"],
+        schema_names = self._get_schema_names()
+        type_names = self._get_type_names()
+        columns: dict[tuple[str, str], list[Column]] = defaultdict(list)
+        for (
+            schema_id, view_name, column_name, user_type_id, max_length, precision, scale,
+            is_nullable, collation_name, ordinal_position, description,
+        ) in self.connection.execute_iter(query):
+            columns[(schema_names[schema_id], view_name)].append(
+                Column(
+                    name=column_name,
+                    data_type=type_names.get(user_type_id),
+                    max_length=max_length,
+                    precision=precision,
+                    scale=scale,
+                    is_nullable=is_nullable,
+                    collation=collation_name,
+                    ordinal_position=ordinal_position,
+                    description=description,
+                )
             )
-            for row in rows
-        ]
-
-    def _get_definition(self, schema_name: str, view_name: str) -> Optional[str]:
-        """Get the full SQL definition of a view."""
-        query = """
-            SELECT m.definition
-            FROM sys.sql_modules m
-            JOIN sys.views v ON m.object_id = v.object_id
-            JOIN sys.schemas s ON v.schema_id = s.schema_id
-            WHERE s.name = ? AND v.name = ?
-        """
-        return self.connection.execute_scalar(query, (schema_name, view_name))
+        return columns
 
-    def _get_base_tables(self, schema_name: str, view_name: str) -> list[str]:
-        """Get the base tables referenced by a view."""
-        query = """
-            SELECT DISTINCT SCHEMA_NAME(o.schema_id) + '.' + o.name AS table_name
+    def _get_base_tables(self) -> dict[tuple[str, str], list[str]]:
+        """Get the base tables referenced by every view."""
+        query = f"""
+            SELECT DISTINCT
+                s.name AS schema_name, v.name AS view_name,
+                SCHEMA_NAME(o.schema_id) + '.' + o.name AS table_name
             FROM sys.sql_expression_dependencies d
             JOIN sys.views v ON d.referencing_id = v.object_id
             JOIN sys.schemas s ON v.schema_id = s.schema_id
             JOIN sys.objects o ON d.referenced_id = o.object_id
-            WHERE s.name = ? AND v.name = ? AND o.type IN ('U', 'V')
-            ORDER BY table_name
+            WHERE v.is_ms_shipped = 0 AND o.type IN ('U', 'V') AND {self._schema_id_filter("v.schema_id")}
+            ORDER BY schema_name, view_name, table_name
         """
-        rows = self.connection.execute_dict(query, (schema_name, view_name))
-        return [row["table_name"] for row in rows]
+        base_tables: dict[tuple[str, str], list[str]] = defaultdict(list)
+        for row in self.connection.iter_dict(query):
+            base_tables[(row["schema_name"], row["view_name"])].append(row["table_name"])
+        return base_tables
 
 
 class ProcedureExtractor(MSSQLBaseExtractor):
@@ -619,70 +740,73 @@ class ProcedureExtractor(MSSQLBaseExtractor):
         """Extract all stored procedures with their metadata."""
         procedures = self._get_procedures()
         logger.info(f"Found {len(procedures)} stored procedures")
+        parameters = self._get_parameters()
 
         for proc in procedures:
-            proc.parameters = self._get_parameters(proc.schema_name, proc.name)
-            proc.definition = self._get_definition(proc.schema_name, proc.name)
-            proc.description = self.get_extended_property(proc.schema_name, proc.name)
+            proc.parameters = parameters.get((proc.schema_name, proc.name), [])
 
         return procedures
 
     def _get_procedures(self) -> list[Procedure]:
-        """Get list of all stored procedures."""
-        query = """
-            SELECT s.name AS schema_name, p.name AS procedure_name
+        """Get all stored procedures with their definitions and descriptions."""
+        query = f"""
+            SELECT s.name AS schema_name, p.name AS procedure_name, {self._definition_column("m.definition")},
+                   CAST(ep.value AS NVARCHAR(MAX)) AS description
             FROM sys.procedures p
             JOIN sys.schemas s ON p.schema_id = s.schema_id
-            WHERE p.is_ms_shipped = 0 AND p.type = 'P'
+            LEFT JOIN sys.sql_modules m ON p.object_id = m.object_id
+            LEFT JOIN sys.extended_properties ep ON ep.major_id = p.object_id AND ep.minor_id = 0
+                   AND ep.class = 1 AND ep.name = 'MS_Description'
+            WHERE p.is_ms_shipped = 0 AND p.type = 'P' AND {self._schema_id_filter("p.schema_id")}
             ORDER BY s.name, p.name
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.iter_dict(query)
         return [
-            Procedure(schema_name=row["schema_name"], name=row["procedure_name"], language="T-SQL")
+            Procedure(
+                schema_name=row["schema_name"],
+                name=row["procedure_name"],
+                definition=row["definition"],
+                description=row["description"],
+                language="T-SQL",
+            )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
-    def _get_parameters(self, schema_name: str, procedure_name: str) -> list[Parameter]:
-        """Get parameters for a stored procedure."""
-        query = """
+    def _get_parameters(self) -> dict[tuple[str, str], list[Parameter]]:
+        """Get parameters for all stored procedures."""
+        query = f"""
             SELECT
-                p.name AS parameter_name, t.name AS data_type,
+                pr.schema_id, pr.name AS procedure_name,
+                p.name AS parameter_name, p.user_type_id,
                 p.max_length, p.precision, p.scale, p.is_output,
-                p.has_default_value, p.default_value, p.parameter_id AS ordinal_position
+                p.has_default_value, CAST(p.default_value AS NVARCHAR(4000)) AS default_value,
+                p.parameter_id AS ordinal_position
             FROM sys.parameters p
-            JOIN sys.types t ON p.user_type_id = t.user_type_id
             JOIN sys.procedures pr ON p.object_id = pr.object_id
-            JOIN sys.schemas s ON pr.schema_id = s.schema_id
-            WHERE s.name = ? AND pr.name = ? AND p.parameter_id > 0
-            ORDER BY p.parameter_id
+            WHERE pr.is_ms_shipped = 0 AND p.parameter_id > 0 AND {self._schema_id_filter("pr.schema_id")}
+            ORDER BY pr.schema_id, pr.name, p.parameter_id
         """
-        rows = self.connection.execute_dict(query, (schema_name, procedure_name))
-        return [
-            Parameter(
-                name=row["parameter_name"],
-                data_type=row["data_type"],
-                max_length=row["max_length"],
-                precision=row["precision"],
-                scale=row["scale"],
-                is_output=row["is_output"],
-                has_default=row["has_default_value"],
-                default_value=str(row["default_value"]) if row["default_value"] is not None else None,
-                ordinal_position=row["ordinal_position"],
+        schema_names = self._get_schema_names()
+        type_names = self._get_type_names()
+        parameters: dict[tuple[str, str], list[Parameter]] = defaultdict(list)
+        for (
+            schema_id, procedure_name, parameter_name, user_type_id, max_length, precision, scale,
+            is_output, has_default_value, default_value, ordinal_position,
+        ) in self.connection.execute_iter(query):
+            parameters[(schema_names[schema_id], procedure_name)].append(
+                Parameter(
+                    name=parameter_name,
+                    data_type=type_names.get(user_type_id),
+                    max_length=max_length,
+                    precision=precision,
+                    scale=scale,
+                    is_output=is_output,
+                    has_default=has_default_value,
+                    default_value=default_value,
+                    ordinal_position=ordinal_position,
+                )
             )
-            for row in rows
-        ]
-
-    def _get_definition(self, schema_name: str, procedure_name: str) -> Optional[str]:
-        """Get the full SQL definition of a stored procedure."""
-        query = """
-            SELECT m.definition
-            FROM sys.sql_modules m
-            JOIN sys.procedures p ON m.object_id = p.object_id
-            JOIN sys.schemas s ON p.schema_id = s.schema_id
-            WHERE s.name = ? AND p.name = ?
-        """
-        return self.connection.execute_scalar(query, (schema_name, procedure_name))
+        return parameters
 
 
 class FunctionExtractor(MSSQLBaseExtractor):
@@ -693,21 +817,27 @@ class FunctionExtractor(MSSQLBaseExtractor):
         functions = self._get_functions()
         logger.info(f"Found {len(functions)} user-defined functions")
 
+        results = self._run_parallel({
+            "parameters": self._get_parameters,
+            "return_columns": self._get_return_columns,
+        })
+        parameters, return_types = results["parameters"]
+        return_columns = results["return_columns"]
+
         for func in functions:
-            func.parameters = self._get_parameters(func.schema_name, func.name)
-            func.definition = self._get_definition(func.schema_name, func.name)
-            func.description = self.get_extended_property(func.schema_name, func.name)
+            key = (func.schema_name, func.name)
+            func.parameters = parameters.get(key, [])
 
             if func.function_type == "SCALAR":
-                func.return_type = self._get_return_type(func.schema_name, func.name)
+                func.return_type = return_types.get(key)
             else:
-                func.return_columns = self._get_return_columns(func.schema_name, func.name)
+                func.return_columns = return_columns.get(key, [])
 
         return functions
 
     def _get_functions(self) -> list[Function]:
-        """Get list of all user-defined functions."""
-        query = """
+        """Get all user-defined functions with their definitions and descriptions."""
+        query = f"""
             SELECT
                 s.name AS schema_name, o.name AS function_name,
                 CASE o.type
@@ -715,116 +845,123 @@ class FunctionExtractor(MSSQLBaseExtractor):
                     WHEN 'IF' THEN 'INLINE_TABLE_VALUED'
                     WHEN 'TF' THEN 'TABLE_VALUED'
                     ELSE 'UNKNOWN'
-                END AS function_type
+                END AS function_type,
+                {self._definition_column("m.definition")}, CAST(ep.value AS NVARCHAR(MAX)) AS description
             FROM sys.objects o
             JOIN sys.schemas s ON o.schema_id = s.schema_id
+            LEFT JOIN sys.sql_modules m ON o.object_id = m.object_id
+            LEFT JOIN sys.extended_properties ep ON ep.major_id = o.object_id AND ep.minor_id = 0
+                   AND ep.class = 1 AND ep.name = 'MS_Description'
             WHERE o.type IN ('FN', 'IF', 'TF') AND o.is_ms_shipped = 0
+              AND {self._schema_id_filter("o.schema_id")}
             ORDER BY s.name, o.name
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.iter_dict(query)
         return [
             Function(
                 schema_name=row["schema_name"],
                 name=row["function_name"],
                 function_type=row["function_type"],
+                definition=row["definition"],
+                description=row["description"],
                 language="T-SQL",
             )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
-    def _get_parameters(self, schema_name: str, function_name: str) -> list[Parameter]:
-        """Get parameters for a function."""
-        query = """
+    def _get_parameters(
+        self,
+    ) -> tuple[dict[tuple[str, str], list[Parameter]], dict[tuple[str, str], str]]:
+        """Get parameters and scalar return types for all functions."""
+        # parameter_id 0 is the return value of a scalar function
+        query = f"""
             SELECT
-                p.name AS parameter_name, t.name AS data_type,
+                o.schema_id, o.name AS function_name,
+                p.name AS parameter_name, p.user_type_id,
                 p.max_length, p.precision, p.scale, p.is_output,
-                p.has_default_value, p.default_value, p.parameter_id AS ordinal_position
+                p.has_default_value, CAST(p.default_value AS NVARCHAR(4000)) AS default_value,
+                p.parameter_id AS ordinal_position
             FROM sys.parameters p
-            JOIN sys.types t ON p.user_type_id = t.user_type_id
             JOIN sys.objects o ON p.object_id = o.object_id
-            JOIN sys.schemas s ON o.schema_id = s.schema_id
-            WHERE s.name = ? AND o.name = ? AND p.parameter_id > 0
-            ORDER BY p.parameter_id
+            WHERE o.type IN ('FN', 'IF', 'TF') AND o.is_ms_shipped = 0
+              AND {self._schema_id_filter("o.schema_id")}
+            ORDER BY o.schema_id, o.name, p.parameter_id
         """
-        rows = self.connection.execute_dict(query, (schema_name, function_name))
-        return [
-            Parameter(
-                name=row["parameter_name"],
-                data_type=row["data_type"],
-                max_length=row["max_length"],
-                precision=row["precision"],
-                scale=row["scale"],
-                is_output=row["is_output"],
-                has_default=row["has_default_value"],
-                default_value=str(row["default_value"]) if row["default_value"] is not None else None,
-                ordinal_position=row["ordinal_position"],
+        schema_names = self._get_schema_names()
+        type_names = self._get_type_names()
+        parameters: dict[tuple[str, str], list[Parameter]] = defaultdict(list)
+        return_types: dict[tuple[str, str], str] = {}
+        for (
+            schema_id, function_name, parameter_name, user_type_id, max_length, precision, scale,
+            is_output, has_default_value, default_value, ordinal_position,
+        ) in self.connection.execute_iter(query):
+            key = (schema_names[schema_id], function_name)
+            data_type = type_names.get(user_type_id)
+            if ordinal_position == 0:
+                return_types[key] = self._format_return_type(data_type, max_length, precision, scale)
+                continue
+            parameters[key].append(
+                Parameter(
+                    name=parameter_name,
+                    data_type=data_type,
+                    max_length=max_length,
+                    precision=precision,
+                    scale=scale,
+                    is_output=is_output,
+                    has_default=has_default_value,
+                    default_value=default_value,
+                    ordinal_position=ordinal_position,
+                )
             )
-            for row in rows
-        ]
+        return parameters, return_types
 
-    def _get_definition(self, schema_name: str, function_name: str) -> Optional[str]:
-        """Get the full SQL definition of a function."""
-        query = """
-            SELECT m.definition
-            FROM sys.sql_modules m
-            JOIN sys.objects o ON m.object_id = o.object_id
-            JOIN sys.schemas s ON o.schema_id = s.schema_id
-            WHERE s.name = ? AND o.name = ?
-        """
-        return self.connection.execute_scalar(query, (schema_name, function_name))
-
-    def _get_return_type(self, schema_name: str, function_name: str) -> Optional[str]:
-        """Get the return type for a scalar function."""
-        query = """
-            SELECT t.name AS data_type, p.max_length, p.precision, p.scale
-            FROM sys.parameters p
-            JOIN sys.types t ON p.user_type_id = t.user_type_id
-            JOIN sys.objects o ON p.object_id = o.object_id
-            JOIN sys.schemas s ON o.schema_id = s.schema_id
-            WHERE s.name = ? AND o.name = ? AND p.parameter_id = 0
-        """
-        rows = self.connection.execute_dict(query, (schema_name, function_name))
-        if not rows:
-            return None
-        row = rows[0]
-        data_type = row["data_type"]
+    @staticmethod
+    def _format_return_type(
+        data_type: Optional[str], max_length: int, precision: int, scale: int
+    ) -> Optional[str]:
+        """Format a scalar function's return type with its length or precision."""
         if data_type in ("varchar", "nvarchar", "char", "nchar", "binary", "varbinary"):
-            length = "max" if row["max_length"] == -1 else str(row["max_length"])
-            if data_type.startswith("n") and row["max_length"] and row["max_length"] > 0:
-                length = str(row["max_length"] // 2)
+            length = "max" if max_length == -1 else str(max_length)
+            if data_type.startswith("n") and max_length and max_length > 0:
+                length = str(max_length // 2)
             return f"{data_type}({length})"
         elif data_type in ("decimal", "numeric"):
-            return f"{data_type}({row['precision']},{row['scale']})"
+            return f"{data_type}({precision},{scale})"
         return data_type
 
-    def _get_return_columns(self, schema_name: str, function_name: str) -> list[FunctionColumn]:
-        """Get return columns for a table-valued function."""
-        query = """
+    def _get_return_columns(self) -> dict[tuple[str, str], list[FunctionColumn]]:
+        """Get return columns for all table-valued functions."""
+        query = f"""
             SELECT
-                c.name AS column_name, t.name AS data_type,
+                o.schema_id, o.name AS function_name,
+                c.name AS column_name, c.user_type_id,
                 c.max_length, c.precision, c.scale, c.is_nullable,
                 c.column_id AS ordinal_position
             FROM sys.columns c
-            JOIN sys.types t ON c.user_type_id = t.user_type_id
             JOIN sys.objects o ON c.object_id = o.object_id
-            JOIN sys.schemas s ON o.schema_id = s.schema_id
-            WHERE s.name = ? AND o.name = ?
-            ORDER BY c.column_id
+            WHERE o.type IN ('IF', 'TF') AND o.is_ms_shipped = 0
+              AND {self._schema_id_filter("o.schema_id")}
+            ORDER BY o.schema_id, o.name, c.column_id
         """
-        rows = self.connection.execute_dict(query, (schema_name, function_name))
-        return [
-            FunctionColumn(
-                name=row["column_name"],
-                data_type=row["data_type"],
-                max_length=row["max_length"],
-                precision=row["precision"],
-                scale=row["scale"],
-                is_nullable=row["is_nullable"],
-                ordinal_position=row["ordinal_position"],
+        schema_names = self._get_schema_names()
+        type_names = self._get_type_names()
+        return_columns: dict[tuple[str, str], list[FunctionColumn]] = defaultdict(list)
+        for (
+            schema_id, function_name, column_name, user_type_id, max_length, precision, scale,
+            is_nullable, ordinal_position,
+        ) in self.connection.execute_iter(query):
+            return_columns[(schema_names[schema_id], function_name)].append(
+                FunctionColumn(
+                    name=column_name,
+                    data_type=type_names.get(user_type_id),
+                    max_length=max_length,
+                    precision=precision,
+                    scale=scale,
+                    is_nullable=is_nullable,
+                    ordinal_position=ordinal_position,
+                )
             )
-            for row in rows
-        ]
+        return return_columns
 
 
 class TriggerExtractor(MSSQLBaseExtractor):
@@ -834,69 +971,46 @@ class TriggerExtractor(MSSQLBaseExtractor):
         """Extract all DML triggers with their metadata."""
         triggers = self._get_triggers()
         logger.info(f"Found {len(triggers)} triggers")
-
-        for trigger in triggers:
-            trigger.definition = self._get_definition(trigger.schema_name, trigger.name)
-            trigger.description = self.get_extended_property(trigger.schema_name, trigger.name)
-
         return triggers
 
     def _get_triggers(self) -> list[Trigger]:
-        """Get list of all DML triggers."""
-        query = """
+        """Get all DML triggers with their definitions and descriptions."""
+        query = f"""
             SELECT
-                s.name AS schema_name, tr.name AS trigger_name,
-                ps.name AS parent_schema, pt.name AS parent_table,
+                ps.name AS schema_name, tr.name AS trigger_name, pt.name AS parent_table,
                 CASE WHEN tr.is_instead_of_trigger = 1 THEN 'INSTEAD OF' ELSE 'AFTER' END AS trigger_type,
                 tr.is_disabled,
-                OBJECTPROPERTY(tr.object_id, 'ExecIsInsertTrigger') AS is_insert,
-                OBJECTPROPERTY(tr.object_id, 'ExecIsUpdateTrigger') AS is_update,
-                OBJECTPROPERTY(tr.object_id, 'ExecIsDeleteTrigger') AS is_delete
+                {_TRIGGER_EVENTS} AS events,
+                m.definition, CAST(ep.value AS NVARCHAR(MAX)) AS description
             FROM sys.triggers tr
             JOIN sys.tables pt ON tr.parent_id = pt.object_id
             JOIN sys.schemas ps ON pt.schema_id = ps.schema_id
-            JOIN sys.schemas s ON pt.schema_id = s.schema_id
-            WHERE tr.is_ms_shipped = 0 AND tr.parent_class = 1
-            ORDER BY s.name, tr.name
+            LEFT JOIN sys.sql_modules m ON tr.object_id = m.object_id
+            LEFT JOIN sys.extended_properties ep ON ep.major_id = tr.object_id AND ep.minor_id = 0
+                   AND ep.class = 1 AND ep.name = 'MS_Description'
+            WHERE tr.is_ms_shipped = 0 AND tr.parent_class = 1 AND {self._schema_id_filter("pt.schema_id")}
+            ORDER BY ps.name, tr.name
         """
         rows = self.connection.execute_dict(query)
         triggers = []
 
         for row in rows:
-            if not self._should_include_schema(row["schema_name"]):
-                continue
-            events = []
-            if row["is_insert"]:
-                events.append("INSERT")
-            if row["is_update"]:
-                events.append("UPDATE")
-            if row["is_delete"]:
-                events.append("DELETE")
             triggers.append(
                 Trigger(
                     schema_name=row["schema_name"],
                     name=row["trigger_name"],
-                    parent_table_schema=row["parent_schema"],
+                    # A DML trigger always lives in its table's schema
+                    parent_table_schema=row["schema_name"],
                     parent_table_name=row["parent_table"],
                     trigger_type=row["trigger_type"],
-                    events=events,
+                    events=row["events"].split(",") if row["events"] else [],
+                    definition=row["definition"],
                     is_disabled=row["is_disabled"],
+                    description=row["description"],
                 )
             )
         return triggers
 
-    def _get_definition(self, schema_name: str, trigger_name: str) -> Optional[str]:
-        """Get the full SQL definition of a trigger."""
-        query = """
-            SELECT m.definition
-            FROM sys.sql_modules m
-            JOIN sys.triggers tr ON m.object_id = tr.object_id
-            JOIN sys.tables t ON tr.parent_id = t.object_id
-            JOIN sys.schemas s ON t.schema_id = s.schema_id
-            WHERE s.name = ? AND tr.name = ?
-        """
-        return self.connection.execute_scalar(query, (schema_name, trigger_name))
-
 
 class TypeExtractor(MSSQLBaseExtractor):
     """Extracts user-defined type metadata from SQL Server."""
@@ -906,15 +1020,17 @@ class TypeExtractor(MSSQLBaseExtractor):
         types = self._get_types()
         logger.info(f"Found {len(types)} user-defined types")
 
-        for udt in types:
-            if udt.type_category == "TABLE_TYPE":
-                udt.columns = self._get_table_type_columns(udt.schema_name, udt.name)
+        if any(udt.type_category == "TABLE_TYPE" for udt in types):
+            columns = self._get_table_type_columns()
+            for udt in types:
+                if udt.type_category == "TABLE_TYPE":
+                    udt.columns = columns.get((udt.schema_name, udt.name), [])
 
         return types
 
     def _get_types(self) -> list[UserDefinedType]:
         """Get list of all user-defined types."""
-        query = """
+        query = f"""
             SELECT
                 s.name AS schema_name, t.name AS type_name,
                 CASE
@@ -922,56 +1038,58 @@ class TypeExtractor(MSSQLBaseExtractor):
                     WHEN t.is_assembly_type = 1 THEN 'CLR_TYPE'
                     ELSE 'ALIAS_TYPE'
                 END AS type_category,
-                bt.name AS base_type, t.max_length, t.precision, t.scale, t.is_nullable
+                t.system_type_id, t.max_length, t.precision, t.scale, t.is_nullable
             FROM sys.types t
             JOIN sys.schemas s ON t.schema_id = s.schema_id
-            LEFT JOIN sys.types bt ON t.system_type_id = bt.user_type_id AND bt.is_user_defined = 0
-            WHERE t.is_user_defined = 1
+            WHERE t.is_user_defined = 1 AND {self._schema_id_filter("t.schema_id")}
             ORDER BY s.name, t.name
         """
+        # A system type's user_type_id equals its system_type_id
+        type_names = self._get_type_names()
         rows = self.connection.execute_dict(query)
         return [
             UserDefinedType(
                 schema_name=row["schema_name"],
                 name=row["type_name"],
                 type_category=row["type_category"],
-                base_type=row["base_type"],
+                base_type=type_names.get(row["system_type_id"]),
                 max_length=row["max_length"],
                 precision=row["precision"],
                 scale=row["scale"],
                 is_nullable=row["is_nullable"],
             )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
-    def _get_table_type_columns(self, schema_name: str, type_name: str) -> list[TypeColumn]:
-        """Get columns for a table type."""
-        query = """
+    def _get_table_type_columns(self) -> dict[tuple[str, str], list[TypeColumn]]:
+        """Get columns for all table types."""
+        query = f"""
             SELECT
-                c.name AS column_name, bt.name AS data_type,
+                tt.schema_id, tt.name AS type_name,
+                c.name AS column_name, c.user_type_id,
                 c.max_length, c.precision, c.scale, c.is_nullable,
                 c.column_id AS ordinal_position
             FROM sys.table_types tt
-            JOIN sys.schemas s ON tt.schema_id = s.schema_id
             JOIN sys.columns c ON tt.type_table_object_id = c.object_id
-            JOIN sys.types bt ON c.user_type_id = bt.user_type_id
-            WHERE s.name = ? AND tt.name = ?
-            ORDER BY c.column_id
+            WHERE {self._schema_id_filter("tt.schema_id")}
+            ORDER BY tt.schema_id, tt.name, c.column_id
         """
-        rows = self.connection.execute_dict(query, (schema_name, type_name))
-        return [
-            TypeColumn(
-                name=row["column_name"],
-                data_type=row["data_type"],
-                max_length=row["max_length"],
-                precision=row["precision"],
-                scale=row["scale"],
-                is_nullable=row["is_nullable"],
-                ordinal_position=row["ordinal_position"],
+        schema_names = self._get_schema_names()
+        type_names = self._get_type_names()
+        columns: dict[tuple[str, str], list[TypeColumn]] = defaultdict(list)
+        for row in self.connection.iter_dict(query):
+            columns[(schema_names[row["schema_id"]], row["type_name"])].append(
+                TypeColumn(
+                    name=row["column_name"],
+                    data_type=type_names.get(row["user_type_id"]),
+                    max_length=row["max_length"],
+                    precision=row["precision"],
+                    scale=row["scale"],
+                    is_nullable=row["is_nullable"],
+                    ordinal_position=row["ordinal_position"],
+                )
             )
-            for row in rows
-        ]
+        return columns
 
 
 class SequenceExtractor(MSSQLBaseExtractor):
@@ -985,9 +1103,9 @@ class SequenceExtractor(MSSQLBaseExtractor):
 
     def _get_sequences(self) -> list[Sequence]:
         """Get list of all sequences."""
-        query = """
+        query = f"""
             SELECT
-                s.name AS schema_name, seq.name AS sequence_name, t.name AS data_type,
+                s.name AS schema_name, seq.name AS sequence_name, seq.user_type_id,
                 CAST(seq.start_value AS BIGINT) AS start_value,
                 CAST(seq.increment AS BIGINT) AS increment,
                 CAST(seq.minimum_value AS BIGINT) AS min_value,
@@ -996,15 +1114,16 @@ class SequenceExtractor(MSSQLBaseExtractor):
                 CAST(seq.current_value AS BIGINT) AS current_value
             FROM sys.sequences seq
             JOIN sys.schemas s ON seq.schema_id = s.schema_id
-            JOIN sys.types t ON seq.user_type_id = t.user_type_id
+            WHERE {self._schema_id_filter("seq.schema_id")}
             ORDER BY s.name, seq.name
         """
+        type_names = self._get_type_names()
         rows = self.connection.execute_dict(query)
         return [
             Sequence(
                 schema_name=row["schema_name"],
                 name=row["sequence_name"],
-                data_type=row["data_type"],
+                data_type=type_names.get(row["user_type_id"]),
                 start_value=row["start_value"],
                 increment=row["increment"],
                 min_value=row["min_value"],
@@ -1014,7 +1133,6 @@ class SequenceExtractor(MSSQLBaseExtractor):
                 current_value=row["current_value"],
             )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
 
@@ -1029,66 +1147,48 @@ class SynonymExtractor(MSSQLBaseExtractor):
 
     def _get_synonyms(self) -> list[Synonym]:
         """Get list of all synonyms."""
-        query = """
+        query = f"""
             SELECT s.name AS schema_name, syn.name AS synonym_name, syn.base_object_name
             FROM sys.synonyms syn
             JOIN sys.schemas s ON syn.schema_id = s.schema_id
+            WHERE {self._schema_id_filter("syn.schema_id")}
             ORDER BY s.name, syn.name
         """
         rows = self.connection.execute_dict(query)
         synonyms = []
 
         for row in rows:
-            if not self._should_include_schema(row["schema_name"]):
-                continue
-            parsed = self._parse_base_object(row["base_object_name"])
+            server, database, schema, obj = _parse_base_object(row["base_object_name"])
             synonyms.append(
                 Synonym(
                     schema_name=row["schema_name"],
                     name=row["synonym_name"],
                     base_object_name=row["base_object_name"],
-                    target_server=parsed.get("server"),
-                    target_database=parsed.get("database"),
-                    target_schema=parsed.get("schema"),
-                    target_object=parsed.get("object"),
+                    target_server=server,
+                    target_database=database,
+                    target_schema=schema,
+                    target_object=obj,
                 )
             )
         return synonyms
 
-    def _parse_base_object(self, base_object_name: str) -> dict[str, Optional[str]]:
-        """Parse the base object name into components."""
-        parts = base_object_name.replace("[", "").replace("]", "").split(".")
-        if len(parts) == 1:
-            return {"server": None, "database": None, "schema": None, "object": parts[0]}
-        elif len(parts) == 2:
-            return {"server": None, "database": None, "schema": parts[0], "object": parts[1]}
-        elif len(parts) == 3:
-            return {"server": None, "database": parts[0], "schema": parts[1], "object": parts[2]}
-        elif len(parts) >= 4:
-            return {"server": parts[0], "database": parts[1], "schema": parts[2], "object": parts[3]}
-        return {"server": None, "database": None, "schema": None, "object": base_object_name}
-
 
 class SecurityExtractor(MSSQLBaseExtractor):
     """Extracts security metadata from SQL Server."""
 
     def extract(self) -> dict:
         """Extract all security metadata."""
-        users = self._extract_users()
-        logger.info(f"Found {len(users)} users")
-        roles = self._extract_roles()
-        logger.info(f"Found {len(roles)} roles")
-        permissions = self._extract_permissions()
-        logger.info(f"Found {len(permissions)} permissions")
-        memberships = self._extract_role_memberships()
-        logger.info(f"Found {len(memberships)} role memberships")
-
-        return {
-            "users": users,
-            "roles": roles,
-            "permissions": permissions,
-            "role_memberships": memberships,
-        }
+        results = self._run_parallel({
+            "users": self._extract_users,
+            "roles": self._extract_roles,
+            "permissions": self._extract_permissions,
+            "role_memberships": self._extract_role_memberships,
+        })
+        logger.info(f"Found {len(results['users'])} users")
+        logger.info(f"Found {len(results['roles'])} roles")
+        logger.info(f"Found {len(results['permissions'])} permissions")
+        logger.info(f"Found {len(results['role_memberships'])} role memberships")
+        return results
 
     def _extract_users(self) -> list[User]:
         """Extract all database users."""
@@ -1099,8 +1199,8 @@ class SecurityExtractor(MSSQLBaseExtractor):
                 u.type_desc AS user_type,
                 u.is_disabled,
                 u.default_schema_name,
-                u.create_date,
-                u.modify_date
+                CONVERT(NVARCHAR(23), u.create_date, 121) AS create_date,
+                CONVERT(NVARCHAR(23), u.modify_date, 121) AS modify_date
             FROM sys.database_principals u
             LEFT JOIN sys.schemas s ON u.default_schema_name = s.name
             WHERE u.type IN ('S', 'U', 'G', 'E')  -- SQL user, Windows user, Windows group, external user
@@ -1114,8 +1214,8 @@ class SecurityExtractor(MSSQLBaseExtractor):
                 authentication_type=row["user_type"],
                 is_disabled=bool(row["is_disabled"]),
                 default_schema=row["default_schema_name"],
-                create_date=str(row["create_date"]) if row["create_date"] else None,
-                modify_date=str(row["modify_date"]) if row["modify_date"] else None,
+                create_date=row["create_date"],
+                modify_date=row["modify_date"],
             )
             for row in rows
         ]
@@ -1127,8 +1227,8 @@ class SecurityExtractor(MSSQLBaseExtractor):
                 r.name AS role_name,
                 r.type_desc AS role_type,
                 r.is_disabled,
-                r.create_date,
-                r.modify_date
+                CONVERT(NVARCHAR(23), r.create_date, 121) AS create_date,
+                CONVERT(NVARCHAR(23), r.modify_date, 121) AS modify_date
             FROM sys.database_principals r
             WHERE r.type = 'R'  -- Database role
             ORDER BY r.name
@@ -1139,15 +1239,15 @@ class SecurityExtractor(MSSQLBaseExtractor):
                 name=row["role_name"],
                 role_type=row["role_type"],
                 is_disabled=bool(row["is_disabled"]),
-                create_date=str(row["create_date"]) if row["create_date"] else None,
-                modify_date=str(row["modify_date"]) if row["modify_date"] else None,
+                create_date=row["create_date"],
+                modify_date=row["modify_date"],
             )
             for row in rows
         ]
 
     def _extract_permissions(self) -> list[Permission]:
-        """Extract all object-level permissions."""
-        query = """
+        """Extract all object-level permissions on objects in the included schemas."""
+        query = f"""
             SELECT
                 dp.name AS grantee_name,
                 dp.type_desc AS grantee_type,
@@ -1163,22 +1263,11 @@ class SecurityExtractor(MSSQLBaseExtractor):
             JOIN sys.schemas s ON o.schema_id = s.schema_id
             LEFT JOIN sys.database_principals gp ON p.grantor_principal_id = gp.principal_id
             WHERE p.class = 1  -- Object permissions
+              AND o.is_ms_shipped = 0 AND {self._schema_id_filter("o.schema_id")}
             ORDER BY s.name, o.name, dp.name, p.permission_name
         """
-        rows = self.connection.execute_dict(query)
-        return [
-            Permission(
-                grantee=row["grantee_name"],
-                grantee_type=row["grantee_type"],
-                object_schema=row["object_schema"],
-                object_name=row["object_name"],
-                object_type=row["object_type"],
-                permission=row["permission_name"],
-                state=row["state"],
-                grantor=row["grantor_name"],
-            )
-            for row in rows
-        ]
+        # The columns are selected in Permission's field order
+        return [Permission(*row) for row in self.connection.execute_iter(query)]
 
     def _extract_role_memberships(self) -> list[RoleMembership]:
         """Extract all role memberships."""
@@ -1,5 +1,8 @@
 """MySQL backend."""
 
+from types import MappingProxyType
+from typing import Mapping, Optional
+
 from .connection import MySQLConnection
 from .extractors import (
     FunctionExtractor,
@@ -11,19 +14,22 @@ from .extractors import (
 )
 
 
-def get_extractors() -> dict:
+_EXTRACTORS: Mapping[str, Optional[type]] = MappingProxyType({
+    "tables": TableExtractor,
+    "views": ViewExtractor,
+    "procedures": ProcedureExtractor,
+    "functions": FunctionExtractor,
+    "triggers": TriggerExtractor,
+    "types": None,  # MySQL doesn't have user-defined types
+    "sequences": None,  # MySQL doesn't have sequences (uses AUTO_INCREMENT)
+    "synonyms": None,  # MySQL doesn't have synonyms
+    "security": SecurityExtractor,
+})
+
+
+def get_extractors() -> Mapping[str, Optional[type]]:
     """Get all extractors for MySQL."""
-    return {
-        "tables": TableExtractor,
-        "views": ViewExtractor,
-        "procedures": ProcedureExtractor,
-        "functions": FunctionExtractor,
-        "triggers": TriggerExtractor,
-        "types": None,  # MySQL doesn't have user-defined types
-        "sequences": None,  # MySQL doesn't have sequences (uses AUTO_INCREMENT)
-        "synonyms": None,  # MySQL doesn't have synonyms
-        "security": SecurityExtractor,
-    }
+    return _EXTRACTORS
 
 
 __all__ = [
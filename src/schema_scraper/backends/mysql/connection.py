@@ -1,11 +1,11 @@
 """MySQL database connection."""
 
 import logging
-from typing import Any, Optional
+from contextlib import contextmanager
+from typing import Any, Generator, Iterator, Optional
 
 import mysql.connector
 from mysql.connector import Error as MySQLError
-from mysql.connector.cursor import MySQLCursorDict
 
 from ...base.connection import BaseConnection
 from ...config import ScraperConfig
@@ -20,6 +20,10 @@ class MySQLConnection(BaseConnection):
     def __init__(self, config: ScraperConfig):
         super().__init__(config)
         self._connection: Optional[mysql.connector.MySQLConnection] = None
+        # Shared cursor for unparameterized queries, reused until disconnect
+        self._cursor: Any = None
+        # query text -> prepared-statement cursor, reused by the per-object loops
+        self._prepared: dict[str, Any] = {}
 
     def connect(self) -> None:
         """Establish database connection."""
@@ -34,6 +38,8 @@ class MySQLConnection(BaseConnection):
                 conn_params["password"] = self.config.password
 
             logger.debug(f"Connecting to MySQL: {self.config.host}:{conn_params['port']}/{self.config.database}")
+            # connect() returns the C extension's connection whenever it is
+            # installed (use_pure defaults to False), so rows decode in C
             self._connection = mysql.connector.connect(**conn_params)
             logger.info(f"Connected to {self.config.database}")
         except MySQLError as e:
@@ -41,6 +47,12 @@ class MySQLConnection(BaseConnection):
 
     def disconnect(self) -> None:
         """Close database connection."""
+        if self._cursor is not None:
+            self._cursor.close()
+            self._cursor = None
+        for cursor in self._prepared.values():
+            cursor.close()
+        self._prepared.clear()
         if self._connection:
             self._connection.close()
             self._connection = None
@@ -53,27 +65,60 @@ class MySQLConnection(BaseConnection):
             raise ConnectionError("Not connected to database")
         return self._connection
 
+    @contextmanager
+    def cursor(self) -> Generator[Any, None, None]:
+        """Get the connection's shared cursor, creating it on first use."""
+        yield self._cursor_for("", ())
+
+    def _column_names(self, cur: Any) -> list[str]:
+        """Get lowercase dictionary keys, normalized once per result set."""
+        return [column[0].lower() for column in cur.description]
+
+    def _cursor_for(self, query: str, params: tuple) -> Any:
+        """Get the cursor to run a query on: a prepared one when it has parameters."""
+        if not params:
+            if self._cursor is None:
+                self._cursor = self.connection.cursor()
+            return self._cursor
+        cursor = self._prepared.get(query)
+        if cursor is None:
+            cursor = self._prepared[query] = self.connection.cursor(prepared=True)
+        return cursor
+
     def execute_dict(self, query: str, params: tuple = ()) -> list[dict[str, Any]]:
-        """Execute a query and return results as dictionaries with lowercase keys."""
-        cursor = self.connection.cursor(dictionary=True)
-        try:
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            # Normalize keys to lowercase for consistency
-            return [{k.lower(): v for k, v in row.items()} for row in rows]
-        finally:
-            cursor.close()
+        """Execute a query and return results as dictionaries.
+
+        Parameterized queries run as server-side prepared statements, so the
+        per-table lookups are parsed once and only re-executed afterwards.
+        """
+        cursor = self._cursor_for(query, params)
+        cursor.execute(query, params)
+        columns = self._column_names(cursor)
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def iter_dict(
+        self, query: str, params: tuple = (), arraysize: Optional[int] = None
+    ) -> Iterator[dict[str, Any]]:
+        """Execute a query and yield its rows as dictionaries, arraysize at a time."""
+        cursor = self._cursor_for(query, params)
+        cursor.execute(query, params)
+        columns = self._column_names(cursor)
+        while True:
+            rows = cursor.fetchmany(arraysize or self.config.fetch_batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(columns, row))
 
     def execute_scalar(self, query: str, params: tuple = ()) -> Any:
         """Execute a query and return a single value."""
-        cursor = self.connection.cursor()
-        try:
-            cursor.execute(query, params)
-            row = cursor.fetchone()
-            return row[0] if row else None
-        finally:
-            cursor.close()
+        cursor = self._cursor_for(query, params)
+        cursor.execute(query, params)
+        # Drain the unbuffered result so the cursor can be reused
+        rows = cursor.fetchall()
+        return rows[0][0] if rows else None
 
     def get_version(self) -> str:
         """Get MySQL version."""
-        return self.execute_scalar("SELECT VERSION()") or "Unknown"
+        # Reported by the server in the connection handshake, so no query is needed
+        return self.connection.get_server_info() or "Unknown"
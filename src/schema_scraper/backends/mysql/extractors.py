@@ -1,7 +1,9 @@
 """MySQL schema extractors."""
 
 import logging
-from typing import Any, Optional
+import re
+from collections import defaultdict
+from typing import Optional
 
 from ...base import BaseExtractor
 from ...base.models import (
@@ -25,244 +27,388 @@ from ...base.models import (
 
 logger = logging.getLogger(__name__)
 
-
-class TableExtractor(BaseExtractor):
+# Database-level privileges reported from mysql.db -> their flag column
+_DB_PRIVILEGES = {
+    "SELECT": "Select_priv",
+    "INSERT": "Insert_priv",
+    "UPDATE": "Update_priv",
+    "DELETE": "Delete_priv",
+    "CREATE": "Create_priv",
+    "DROP": "Drop_priv",
+    "GRANT": "Grant_priv",
+    "REFERENCES": "References_priv",
+    "INDEX": "Index_priv",
+    "ALTER": "Alter_priv",
+}
+
+# SQL expression listing the privileges granted by a mysql.db row, comma-separated
+# like mysql.tables_priv.table_priv
+_DB_PRIVILEGE_LIST = "CONCAT_WS(',', {})".format(", ".join(
+    f"IF({column} = 'Y', '{perm_name}', NULL)" for perm_name, column in _DB_PRIVILEGES.items()
+))
+
+# An index declaration in SHOW CREATE TABLE output and its WHERE clause
+_INDEX_FILTER = re.compile(r"INDEX\s+`((?:[^`]|``)+)`\s+.*?(WHERE\s+[^,\)]+)", re.IGNORECASE | re.DOTALL)
+
+
+class MySQLBaseExtractor(BaseExtractor):
+    """Base extractor with MySQL-specific helpers."""
+
+    def _server_version(self) -> tuple[int, int, int]:
+        """Get the server version as a comparable tuple, e.g. (8, 0, 36)."""
+        match = re.match(r"(\d+)\.(\d+)\.(\d+)", self.connection.get_version())
+        if not match:
+            return (0, 0, 0)
+        major, minor, patch = (int(part) for part in match.groups())
+        return (major, minor, patch)
+
+
+class TableExtractor(MySQLBaseExtractor):
     """Extracts table metadata from MySQL."""
 
     def extract(self) -> list[Table]:
         """Extract all tables with their metadata."""
-        tables = self._get_tables()
+        # Each helper fetches its metadata for every table in one query, keyed
+        # by (schema_name, table_name); they are independent of each other and
+        # of the table list, so all of them are issued together
+        results = self._run_parallel({
+            "tables": self._get_tables,
+            "columns": self._get_columns,
+            "primary_keys": self._get_primary_keys,
+            "foreign_keys": self._get_foreign_keys,
+            "indexes": self._get_indexes,
+            "check_constraints": self._get_check_constraints,
+            "unique_constraints": self._get_unique_constraints,
+            "triggers": self._get_table_triggers,
+        })
+        tables = results["tables"]
         logger.info(f"Found {len(tables)} tables")
+        columns = results["columns"]
+        primary_keys = results["primary_keys"]
+        foreign_keys = results["foreign_keys"]
+        indexes = results["indexes"]
+        check_constraints = results["check_constraints"]
+        unique_constraints = results["unique_constraints"]
+        triggers = results["triggers"]
+        self._add_filter_definitions(indexes)
+        referenced_by = self._build_references(foreign_keys)
 
         for table in tables:
-            table.columns = self._get_columns(table.schema_name, table.name)
-            table.primary_key = self._get_primary_key(table.schema_name, table.name)
-            table.foreign_keys = self._get_foreign_keys(table.schema_name, table.name)
-            table.indexes = self._get_indexes(table.schema_name, table.name)
-            table.check_constraints = self._get_check_constraints(table.schema_name, table.name)
-            table.unique_constraints = self._get_unique_constraints(table.schema_name, table.name)
-            table.triggers = self._get_table_triggers(table.schema_name, table.name)
-            stats = self._get_table_stats(table.schema_name, table.name)
-            table.row_count = stats.get("row_count", 0)
-            table.total_space_kb = stats.get("total_space_kb", 0)
-            table.description = stats.get("description")
-
-        self._build_references(tables)
+            key = (table.schema_name, table.name)
+            table.columns = columns.get(key, [])
+            table.primary_key = primary_keys.get(key)
+            table.foreign_keys = foreign_keys.get(key, [])
+            table.referenced_by = referenced_by.get(key, [])
+            table.indexes = indexes.get(key, [])
+            table.check_constraints = check_constraints.get(key, [])
+            table.unique_constraints = unique_constraints.get(key, [])
+            table.triggers = triggers.get(key, [])
+
         return tables
 
     def _get_tables(self) -> list[Table]:
-        """Get list of all tables."""
-        query = """
-            SELECT table_schema, table_name
+        """Get all tables with their descriptions and, unless disabled, statistics."""
+        schema_filter, params = self._schema_filter("table_schema")
+        # table_rows and the lengths are dynamic statistics that may have to be
+        # read from the storage engine, so they are only selected when wanted
+        if self.config.include_stats:
+            stats = "table_rows AS row_count, ROUND((data_length + index_length) / 1024) AS total_space_kb"
+        else:
+            stats = "NULL AS row_count, NULL AS total_space_kb"
+        query = f"""
+            SELECT table_schema, table_name, {stats}, table_comment AS description
             FROM information_schema.tables
             WHERE table_type = 'BASE TABLE'
             AND table_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
+            {schema_filter}
             ORDER BY table_schema, table_name
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         return [
-            Table(schema_name=row["table_schema"], name=row["table_name"])
+            Table(
+                schema_name=row["table_schema"],
+                name=row["table_name"],
+                row_count=row["row_count"] or 0,
+                total_space_kb=row["total_space_kb"] or 0,
+                description=row["description"] if row["description"] else None,
+            )
             for row in rows
-            if self._should_include_schema(row["table_schema"])
         ]
 
-    def _get_columns(self, schema_name: str, table_name: str) -> list[Column]:
-        """Get columns for a table."""
-        query = """
+    def _get_columns(self) -> dict[tuple[str, str], list[Column]]:
+        """Get columns for all tables."""
+        # Every column selected here, type lengths included, is static data
+        # dictionary metadata; only information_schema.tables carries dynamic
+        # statistics, and the join to it selects none of them
+        schema_filter, params = self._schema_filter("c.table_schema")
+        query = f"""
             SELECT
-                column_name,
-                data_type,
-                character_maximum_length AS max_length,
-                numeric_precision AS `precision`,
-                numeric_scale AS scale,
-                is_nullable = 'YES' AS is_nullable,
-                column_default AS default_value,
-                extra LIKE '%%auto_increment%%' AS is_identity,
-                generation_expression AS computed_definition,
-                collation_name,
-                ordinal_position,
-                column_comment AS description
-            FROM information_schema.columns
-            WHERE table_schema = %s AND table_name = %s
-            ORDER BY ordinal_position
+                c.table_schema,
+                c.table_name,
+                c.column_name,
+                c.data_type,
+                c.character_maximum_length AS max_length,
+                c.numeric_precision AS `precision`,
+                c.numeric_scale AS scale,
+                c.is_nullable,
+                c.column_default AS default_value,
+                c.extra,
+                c.generation_expression AS computed_definition,
+                c.collation_name,
+                c.ordinal_position,
+                c.column_comment AS description
+            FROM information_schema.columns c
+            JOIN information_schema.tables t
+                ON c.table_schema = t.table_schema AND c.table_name = t.table_name
+            WHERE t.table_type = 'BASE TABLE'
+            AND c.table_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
+            {schema_filter}
+            ORDER BY c.table_schema, c.table_name, c.ordinal_position
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        return [
-            Column(
-                name=row["column_name"],
-                data_type=row["data_type"],
-                max_length=row["max_length"],
-                precision=row["precision"],
-                scale=row["scale"],
-                is_nullable=bool(row["is_nullable"]),
-                default_value=row["default_value"],
-                is_identity=bool(row["is_identity"]),
-                is_computed=bool(row["computed_definition"]),
-                computed_definition=row["computed_definition"],
-                collation=row["collation_name"],
-                ordinal_position=row["ordinal_position"],
-                description=row["description"] if row["description"] else None,
+        columns: dict[tuple[str, str], list[Column]] = defaultdict(list)
+        # Streamed plain tuple rows in fetch_batch_size batches: this is the
+        # largest result set, so skip per-row dicts
+        for (
+            schema_name, table_name, column_name, data_type, max_length, precision, scale,
+            is_nullable, default_value, extra, computed_definition, collation_name,
+            ordinal_position, description,
+        ) in self.connection.execute_iter(query, params):
+            columns[(schema_name, table_name)].append(
+                Column(
+                    name=column_name,
+                    data_type=data_type,
+                    max_length=max_length,
+                    precision=precision,
+                    scale=scale,
+                    is_nullable=is_nullable == "YES",
+                    default_value=default_value,
+                    is_identity="auto_increment" in extra,
+                    is_computed=bool(computed_definition),
+                    computed_definition=computed_definition,
+                    collation=collation_name,
+                    ordinal_position=ordinal_position,
+                    description=description if description else None,
+                )
             )
-            for row in rows
-        ]
+        return columns
 
-    def _get_primary_key(self, schema_name: str, table_name: str) -> Optional[PrimaryKey]:
-        """Get primary key for a table."""
-        query = """
-            SELECT
-                constraint_name,
-                GROUP_CONCAT(column_name ORDER BY ordinal_position) AS columns
+    def _get_primary_keys(self) -> dict[tuple[str, str], PrimaryKey]:
+        """Get primary keys for all tables."""
+        schema_filter, params = self._schema_filter("table_schema")
+        query = f"""
+            SELECT table_schema, table_name, constraint_name, column_name
             FROM information_schema.key_column_usage
-            WHERE table_schema = %s AND table_name = %s
-            AND constraint_name = 'PRIMARY'
-            GROUP BY constraint_name
+            WHERE constraint_name = 'PRIMARY'
+            AND table_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
+            {schema_filter}
+            ORDER BY table_schema, table_name, ordinal_position
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        if not rows:
-            return None
-        row = rows[0]
-        return PrimaryKey(name=row["constraint_name"], columns=row["columns"].split(","), is_clustered=True)
+        primary_keys: dict[tuple[str, str], PrimaryKey] = {}
+        for schema_name, table_name, constraint_name, column_name in self.connection.execute_iter(
+            query, params
+        ):
+            pk = primary_keys.get((schema_name, table_name))
+            if pk is None:
+                pk = primary_keys[(schema_name, table_name)] = PrimaryKey(
+                    name=constraint_name, columns=[], is_clustered=True
+                )
+            pk.columns.append(column_name)
+        return primary_keys
 
-    def _get_foreign_keys(self, schema_name: str, table_name: str) -> list[ForeignKey]:
-        """Get foreign keys for a table."""
-        query = """
+    def _get_foreign_keys(self) -> dict[tuple[str, str], list[ForeignKey]]:
+        """Get foreign keys for all tables."""
+        schema_filter, params = self._schema_filter("kcu.table_schema")
+        query = f"""
             SELECT
+                kcu.table_schema,
+                kcu.table_name,
                 kcu.constraint_name,
-                GROUP_CONCAT(kcu.column_name ORDER BY kcu.ordinal_position) AS columns,
+                kcu.column_name,
                 kcu.referenced_table_schema AS referenced_schema,
                 kcu.referenced_table_name AS referenced_table,
-                GROUP_CONCAT(kcu.referenced_column_name ORDER BY kcu.ordinal_position) AS referenced_columns,
+                kcu.referenced_column_name,
                 rc.delete_rule AS on_delete,
                 rc.update_rule AS on_update
             FROM information_schema.key_column_usage kcu
             JOIN information_schema.referential_constraints rc
                 ON kcu.constraint_name = rc.constraint_name
                 AND kcu.constraint_schema = rc.constraint_schema
-            WHERE kcu.table_schema = %s AND kcu.table_name = %s
-            AND kcu.referenced_table_name IS NOT NULL
-            GROUP BY kcu.constraint_name, kcu.referenced_table_schema,
-                     kcu.referenced_table_name, rc.delete_rule, rc.update_rule
+            WHERE kcu.referenced_table_name IS NOT NULL
+            AND kcu.table_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
+            {schema_filter}
+            ORDER BY kcu.table_schema, kcu.table_name, kcu.constraint_name, kcu.ordinal_position
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        return [
-            ForeignKey(
-                name=row["constraint_name"],
-                columns=row["columns"].split(","),
-                referenced_schema=row["referenced_schema"],
-                referenced_table=row["referenced_table"],
-                referenced_columns=row["referenced_columns"].split(","),
-                on_delete=row["on_delete"],
-                on_update=row["on_update"],
-            )
-            for row in rows
-        ]
-
-    def _get_indexes(self, schema_name: str, table_name: str) -> list[Index]:
-        """Get indexes for a table."""
-        # Get basic index info
-        query = """
+        foreign_keys: dict[tuple[str, str], list[ForeignKey]] = defaultdict(list)
+        # One row per key column, in constraint order
+        for (
+            schema_name, table_name, constraint_name, column_name, referenced_schema,
+            referenced_table, referenced_column, on_delete, on_update,
+        ) in self.connection.execute_iter(query, params):
+            table_fks = foreign_keys[(schema_name, table_name)]
+            if not table_fks or table_fks[-1].name != constraint_name:
+                table_fks.append(ForeignKey(
+                    name=constraint_name,
+                    columns=[],
+                    referenced_schema=referenced_schema,
+                    referenced_table=referenced_table,
+                    referenced_columns=[],
+                    on_delete=on_delete,
+                    on_update=on_update,
+                ))
+            table_fks[-1].columns.append(column_name)
+            table_fks[-1].referenced_columns.append(referenced_column)
+        return foreign_keys
+
+    def _get_indexes(self) -> dict[tuple[str, str], list[Index]]:
+        """Get indexes for all tables."""
+        schema_filter, params = self._schema_filter("table_schema")
+        query = f"""
             SELECT
+                table_schema,
+                table_name,
                 index_name,
                 NOT non_unique AS is_unique,
                 index_name = 'PRIMARY' AS is_primary_key,
                 index_type,
-                GROUP_CONCAT(column_name ORDER BY seq_in_index) AS columns
+                column_name
             FROM information_schema.statistics
-            WHERE table_schema = %s AND table_name = %s
-            GROUP BY index_name, non_unique, index_type
-            ORDER BY index_name
+            WHERE table_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
+            {schema_filter}
+            ORDER BY table_schema, table_name, index_name, seq_in_index
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-
-        indexes = []
-        for row in rows:
-            # Try to get filter definition from SHOW CREATE TABLE (MySQL 8.0+)
-            filter_definition = None
-            try:
-                create_query = f"SHOW CREATE TABLE `{schema_name}`.`{table_name}`"
-                create_rows = self.connection.execute_dict(create_query)
-                if create_rows:
-                    create_sql = create_rows[0]["Create Table"]
-                    # Look for index definition with WHERE clause
-                    import re
-                    index_pattern = rf'INDEX\s+`{re.escape(row["index_name"])}`\s+.*?(WHERE\s+[^,\)]+)'
-                    match = re.search(index_pattern, create_sql, re.IGNORECASE | re.DOTALL)
-                    if match:
-                        filter_definition = match.group(1)
-            except Exception:
-                # SHOW CREATE TABLE may not be available or index may not have filter
-                pass
-
-            indexes.append(
-                Index(
-                    name=row["index_name"],
-                    columns=row["columns"].split(","),
-                    is_unique=bool(row["is_unique"]),
-                    is_primary_key=bool(row["is_primary_key"]),
+        indexes: dict[tuple[str, str], list[Index]] = defaultdict(list)
+        # One row per index column, in index order
+        for (
+            schema_name, table_name, index_name, is_unique, is_primary_key, index_type, column_name,
+        ) in self.connection.execute_iter(query, params):
+            table_indexes = indexes[(schema_name, table_name)]
+            if not table_indexes or table_indexes[-1].name != index_name:
+                table_indexes.append(Index(
+                    name=index_name,
+                    columns=[],
+                    is_unique=bool(is_unique),
+                    is_primary_key=bool(is_primary_key),
                     is_clustered=False,  # MySQL doesn't have explicit clustered indexes like SQL Server
-                    index_type=row["index_type"].upper(),
-                    filter_definition=filter_definition,
-                )
-            )
+                    index_type=index_type.upper(),
+                ))
+            # Functional key parts (MySQL 8.0.13+) have no column name
+            if column_name is not None:
+                table_indexes[-1].columns.append(column_name)
         return indexes
 
-    def _get_check_constraints(self, schema_name: str, table_name: str) -> list[CheckConstraint]:
-        """Get check constraints for a table (MySQL 8.0.16+)."""
-        query = """
+    def _add_filter_definitions(self, indexes: dict[tuple[str, str], list[Index]]) -> None:
+        """Fill in index filter definitions from SHOW CREATE TABLE (MySQL 8.0.16+)."""
+        if self._server_version() < (8, 0, 16):
+            return
+
+        # One SHOW CREATE TABLE per table that has an index besides its primary key
+        keys = [
+            key for key, table_indexes in indexes.items()
+            if any(not index.is_primary_key for index in table_indexes)
+        ]
+        create_sql = dict(zip(keys, self._map_parallel(self._get_create_table, keys)))
+
+        for key, sql in create_sql.items():
+            if not sql:
+                continue
+            # One scan of the statement finds the filters of all its indexes
+            filters: dict[str, str] = {}
+            for match in _INDEX_FILTER.finditer(sql):
+                filters.setdefault(match.group(1).replace("``", "`"), match.group(2))
+            for index in indexes[key]:
+                index.filter_definition = filters.get(index.name)
+
+    def _get_create_table(self, key: tuple[str, str]) -> Optional[str]:
+        """Get the CREATE TABLE statement of a table."""
+        schema_name, table_name = (name.replace("`", "``") for name in key)
+        try:
+            rows = self.connection.execute_dict(f"SHOW CREATE TABLE `{schema_name}`.`{table_name}`")
+        except Exception:
+            # SHOW CREATE TABLE may not be available
+            return None
+        # execute_dict lowercases column names
+        return rows[0]["create table"] if rows else None
+
+    def _get_check_constraints(self) -> dict[tuple[str, str], list[CheckConstraint]]:
+        """Get check constraints for all tables (MySQL 8.0.16+)."""
+        schema_filter, params = self._schema_filter("tc.table_schema")
+        query = f"""
             SELECT
+                tc.table_schema,
+                tc.table_name,
                 tc.constraint_name,
                 cc.check_clause AS definition
             FROM information_schema.table_constraints tc
             JOIN information_schema.check_constraints cc
                 ON tc.constraint_name = cc.constraint_name
                 AND tc.constraint_schema = cc.constraint_schema
-            WHERE tc.table_schema = %s AND tc.table_name = %s
-            AND tc.constraint_type = 'CHECK'
+            WHERE tc.constraint_type = 'CHECK'
+            AND tc.table_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
+            {schema_filter}
         """
+        check_constraints: dict[tuple[str, str], list[CheckConstraint]] = defaultdict(list)
         try:
-            rows = self.connection.execute_dict(query, (schema_name, table_name))
-            return [CheckConstraint(name=row["constraint_name"], definition=row["definition"]) for row in rows]
+            rows = self.connection.execute_dict(query, params)
         except Exception:
-            return []  # Check constraints not supported in older MySQL
+            return check_constraints  # Check constraints not supported in older MySQL
+        for row in rows:
+            check_constraints[(row["table_schema"], row["table_name"])].append(
+                CheckConstraint(name=row["constraint_name"], definition=row["definition"])
+            )
+        return check_constraints
 
-    def _get_unique_constraints(self, schema_name: str, table_name: str) -> list[UniqueConstraint]:
-        """Get unique constraints for a table."""
-        query = """
+    def _get_unique_constraints(self) -> dict[tuple[str, str], list[UniqueConstraint]]:
+        """Get unique constraints for all tables."""
+        schema_filter, params = self._schema_filter("tc.table_schema")
+        query = f"""
             SELECT
+                tc.table_schema,
+                tc.table_name,
                 tc.constraint_name,
-                GROUP_CONCAT(kcu.column_name ORDER BY kcu.ordinal_position) AS columns
+                kcu.column_name
             FROM information_schema.table_constraints tc
             JOIN information_schema.key_column_usage kcu
                 ON tc.constraint_name = kcu.constraint_name
                 AND tc.table_schema = kcu.table_schema
+                AND tc.table_name = kcu.table_name
             WHERE tc.constraint_type = 'UNIQUE'
-            AND tc.table_schema = %s AND tc.table_name = %s
-            GROUP BY tc.constraint_name
+            AND tc.table_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
+            {schema_filter}
+            ORDER BY tc.table_schema, tc.table_name, tc.constraint_name, kcu.ordinal_position
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        return [UniqueConstraint(name=row["constraint_name"], columns=row["columns"].split(",")) for row in rows]
-
-    def _get_table_triggers(self, schema_name: str, table_name: str) -> list[Trigger]:
-        """Get triggers for a table."""
-        query = """
+        unique_constraints: dict[tuple[str, str], list[UniqueConstraint]] = defaultdict(list)
+        for schema_name, table_name, constraint_name, column_name in self.connection.execute_iter(
+            query, params
+        ):
+            table_constraints = unique_constraints[(schema_name, table_name)]
+            if not table_constraints or table_constraints[-1].name != constraint_name:
+                table_constraints.append(UniqueConstraint(name=constraint_name, columns=[]))
+            table_constraints[-1].columns.append(column_name)
+        return unique_constraints
+
+    def _get_table_triggers(self) -> dict[tuple[str, str], list[Trigger]]:
+        """Get triggers for all tables."""
+        schema_filter, params = self._schema_filter("event_object_schema")
+        query = f"""
             SELECT
+                event_object_schema AS table_schema,
+                event_object_table AS table_name,
                 trigger_name,
                 action_timing AS trigger_type,
                 event_manipulation AS event,
                 action_statement AS definition
             FROM information_schema.triggers
-            WHERE event_object_schema = %s AND event_object_table = %s
+            WHERE event_object_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
+            {schema_filter}
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        triggers = []
-
-        for row in rows:
-            triggers.append(
+        triggers: dict[tuple[str, str], list[Trigger]] = defaultdict(list)
+        for row in self.connection.iter_dict(query, params):
+            triggers[(row["table_schema"], row["table_name"])].append(
                 Trigger(
-                    schema_name=schema_name,
+                    schema_name=row["table_schema"],
                     name=row["trigger_name"],
-                    parent_table_schema=schema_name,
-                    parent_table_name=table_name,
+                    parent_table_schema=row["table_schema"],
+                    parent_table_name=row["table_name"],
                     trigger_type=row["trigger_type"],
                     events=[row["event"]],
                     definition=row["definition"],
@@ -270,239 +416,229 @@ class TableExtractor(BaseExtractor):
             )
         return triggers
 
-    def _get_table_stats(self, schema_name: str, table_name: str) -> dict[str, Any]:
-        """Get row count and space statistics."""
-        query = """
-            SELECT
-                table_rows AS row_count,
-                ROUND((data_length + index_length) / 1024) AS total_space_kb,
-                table_comment AS description
-            FROM information_schema.tables
-            WHERE table_schema = %s AND table_name = %s
-        """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        if rows:
-            return {
-                "row_count": rows[0]["row_count"] or 0,
-                "total_space_kb": rows[0]["total_space_kb"] or 0,
-                "description": rows[0]["description"] if rows[0]["description"] else None,
-            }
-        return {"row_count": 0, "total_space_kb": 0, "description": None}
-
-    def _build_references(self, tables: list[Table]) -> None:
-        """Build the referenced_by list for each table."""
-        query = """
-            SELECT
-                kcu.table_schema AS parent_schema,
-                kcu.table_name AS parent_table,
-                kcu.constraint_name AS fk_name,
-                kcu.referenced_table_schema AS referenced_schema,
-                kcu.referenced_table_name AS referenced_table
-            FROM information_schema.key_column_usage kcu
-            WHERE kcu.referenced_table_name IS NOT NULL
-        """
-        rows = self.connection.execute_dict(query)
-        table_map = {(t.schema_name, t.name): t for t in tables}
-
-        for row in rows:
-            ref_key = (row["referenced_schema"], row["referenced_table"])
-            if ref_key in table_map:
-                table_map[ref_key].referenced_by.append(
-                    (row["parent_schema"], row["parent_table"], row["fk_name"])
+    def _build_references(
+        self, foreign_keys: dict[tuple[str, str], list[ForeignKey]]
+    ) -> dict[tuple[str, str], list[tuple[str, str, str]]]:
+        """Invert foreign keys into (schema, table, fk_name) entries per referenced table."""
+        referenced_by: dict[tuple[str, str], list[tuple[str, str, str]]] = defaultdict(list)
+        for (schema_name, table_name), table_fks in foreign_keys.items():
+            for fk in table_fks:
+                referenced_by[(fk.referenced_schema, fk.referenced_table)].append(
+                    (schema_name, table_name, fk.name)
                 )
+        return referenced_by
 
 
-class ViewExtractor(BaseExtractor):
+class ViewExtractor(MySQLBaseExtractor):
     """Extracts view metadata from MySQL."""
 
     def extract(self) -> list[View]:
         """Extract all views with their metadata."""
-        views = self._get_views()
+        # The column query does not depend on the view list, so both are issued together
+        results = self._run_parallel({"views": self._get_views, "columns": self._get_columns})
+        views = results["views"]
         logger.info(f"Found {len(views)} views")
 
+        columns = results["columns"]
         for view in views:
-            view.columns = self._get_columns(view.schema_name, view.name)
-            view.definition = self._get_definition(view.schema_name, view.name)
+            view.columns = columns.get((view.schema_name, view.name), [])
 
         return views
 
     def _get_views(self) -> list[View]:
-        """Get list of all views."""
-        query = """
-            SELECT table_schema AS schema_name, table_name AS view_name
+        """Get all views with their definitions."""
+        schema_filter, params = self._schema_filter("table_schema")
+        query = f"""
+            SELECT table_schema AS schema_name, table_name AS view_name,
+                   {self._definition_column("view_definition")}
             FROM information_schema.views
             WHERE table_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
+            {schema_filter}
             ORDER BY table_schema, table_name
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         return [
-            View(schema_name=row["schema_name"], name=row["view_name"])
+            View(schema_name=row["schema_name"], name=row["view_name"], definition=row["definition"])
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
-    def _get_columns(self, schema_name: str, view_name: str) -> list[Column]:
-        """Get columns for a view."""
-        query = """
+    def _get_columns(self) -> dict[tuple[str, str], list[Column]]:
+        """Get columns for all views."""
+        schema_filter, params = self._schema_filter("c.table_schema")
+        query = f"""
             SELECT
-                column_name,
-                data_type,
-                character_maximum_length AS max_length,
-                numeric_precision AS `precision`,
-                numeric_scale AS scale,
-                is_nullable = 'YES' AS is_nullable,
-                ordinal_position
-            FROM information_schema.columns
-            WHERE table_schema = %s AND table_name = %s
-            ORDER BY ordinal_position
+                c.table_schema,
+                c.table_name,
+                c.column_name,
+                c.data_type,
+                c.character_maximum_length AS max_length,
+                c.numeric_precision AS `precision`,
+                c.numeric_scale AS scale,
+                c.is_nullable,
+                c.ordinal_position
+            FROM information_schema.columns c
+            JOIN information_schema.views v
+                ON c.table_schema = v.table_schema AND c.table_name = v.table_name
+            WHERE c.table_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
+            {schema_filter}
+            ORDER BY c.table_schema, c.table_name, c.ordinal_position
         """
-        rows = self.connection.execute_dict(query, (schema_name, view_name))
-        return [
-            Column(
-                name=row["column_name"],
-                data_type=row["data_type"],
-                max_length=row["max_length"],
-                precision=row["precision"],
-                scale=row["scale"],
-                is_nullable=bool(row["is_nullable"]),
-                ordinal_position=row["ordinal_position"],
+        columns: dict[tuple[str, str], list[Column]] = defaultdict(list)
+        for (
+            schema_name, view_name, column_name, data_type, max_length, precision, scale,
+            is_nullable, ordinal_position,
+        ) in self.connection.execute_iter(query, params):
+            columns[(schema_name, view_name)].append(
+                Column(
+                    name=column_name,
+                    data_type=data_type,
+                    max_length=max_length,
+                    precision=precision,
+                    scale=scale,
+                    is_nullable=is_nullable == "YES",
+                    ordinal_position=ordinal_position,
+                )
             )
-            for row in rows
-        ]
-
-    def _get_definition(self, schema_name: str, view_name: str) -> Optional[str]:
-        """Get the SQL definition of a view."""
-        query = """
-            SELECT view_definition
-            FROM information_schema.views
-            WHERE table_schema = %s AND table_name = %s
-        """
-        return self.connection.execute_scalar(query, (schema_name, view_name))
+        return columns
 
 
-class ProcedureExtractor(BaseExtractor):
+class ProcedureExtractor(MySQLBaseExtractor):
     """Extracts stored procedure metadata from MySQL."""
 
     def extract(self) -> list[Procedure]:
         """Extract all stored procedures."""
-        procedures = self._get_procedures()
+        # The parameter query does not depend on the procedure list, so both are issued together
+        results = self._run_parallel({"procedures": self._get_procedures, "parameters": self._get_parameters})
+        procedures = results["procedures"]
         logger.info(f"Found {len(procedures)} stored procedures")
 
+        parameters = results["parameters"]
         for proc in procedures:
-            proc.parameters = self._get_parameters(proc.schema_name, proc.name)
-            proc.definition = self._get_definition(proc.schema_name, proc.name)
+            proc.parameters = parameters.get((proc.schema_name, proc.name), [])
 
         return procedures
 
     def _get_procedures(self) -> list[Procedure]:
-        """Get list of all stored procedures."""
-        query = """
+        """Get all stored procedures with their definitions."""
+        schema_filter, params = self._schema_filter("routine_schema")
+        query = f"""
             SELECT
                 routine_schema AS schema_name,
                 routine_name AS procedure_name,
-                routine_comment AS description
+                routine_comment AS description,
+                {self._definition_column("routine_definition")}
             FROM information_schema.routines
             WHERE routine_type = 'PROCEDURE'
             AND routine_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
+            {schema_filter}
             ORDER BY routine_schema, routine_name
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         return [
             Procedure(
                 schema_name=row["schema_name"],
                 name=row["procedure_name"],
+                definition=row["definition"],
                 description=row["description"] if row["description"] else None,
                 language="SQL",
             )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
-    def _get_parameters(self, schema_name: str, proc_name: str) -> list[Parameter]:
-        """Get parameters for a procedure."""
-        query = """
+    def _get_parameters(self) -> dict[tuple[str, str], list[Parameter]]:
+        """Get parameters for all stored procedures."""
+        schema_filter, params = self._schema_filter("specific_schema")
+        query = f"""
             SELECT
+                specific_schema,
+                specific_name,
                 parameter_name,
                 data_type,
                 character_maximum_length AS max_length,
                 numeric_precision AS `precision`,
                 numeric_scale AS scale,
-                parameter_mode IN ('OUT', 'INOUT') AS is_output,
+                parameter_mode,
                 ordinal_position
             FROM information_schema.parameters
-            WHERE specific_schema = %s AND specific_name = %s
+            WHERE routine_type = 'PROCEDURE'
             AND parameter_name IS NOT NULL
-            ORDER BY ordinal_position
+            AND specific_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
+            {schema_filter}
+            ORDER BY specific_schema, specific_name, ordinal_position
         """
-        rows = self.connection.execute_dict(query, (schema_name, proc_name))
-        return [
-            Parameter(
-                name=row["parameter_name"],
-                data_type=row["data_type"],
-                max_length=row["max_length"],
-                precision=row["precision"],
-                scale=row["scale"],
-                is_output=bool(row["is_output"]),
-                ordinal_position=row["ordinal_position"],
+        parameters: dict[tuple[str, str], list[Parameter]] = defaultdict(list)
+        for (
+            schema_name, procedure_name, parameter_name, data_type, max_length, precision, scale,
+            parameter_mode, ordinal_position,
+        ) in self.connection.execute_iter(query, params):
+            parameters[(schema_name, procedure_name)].append(
+                Parameter(
+                    name=parameter_name,
+                    data_type=data_type,
+                    max_length=max_length,
+                    precision=precision,
+                    scale=scale,
+                    is_output=parameter_mode in ("OUT", "INOUT"),
+                    ordinal_position=ordinal_position,
+                )
             )
-            for row in rows
-        ]
-
-    def _get_definition(self, schema_name: str, proc_name: str) -> Optional[str]:
-        """Get procedure definition."""
-        query = """
-            SELECT routine_definition
-            FROM information_schema.routines
-            WHERE routine_schema = %s AND routine_name = %s AND routine_type = 'PROCEDURE'
-        """
-        return self.connection.execute_scalar(query, (schema_name, proc_name))
+        return parameters
 
 
-class FunctionExtractor(BaseExtractor):
+class FunctionExtractor(MySQLBaseExtractor):
     """Extracts function metadata from MySQL."""
 
     def extract(self) -> list[Function]:
         """Extract all functions."""
-        functions = self._get_functions()
+        # The parameter query does not depend on the function list, so both are issued together
+        results = self._run_parallel({"functions": self._get_functions, "parameters": self._get_parameters})
+        functions = results["functions"]
         logger.info(f"Found {len(functions)} functions")
 
+        parameters = results["parameters"]
         for func in functions:
-            func.parameters = self._get_parameters(func.schema_name, func.name)
-            func.definition = self._get_definition(func.schema_name, func.name)
+            func.parameters = parameters.get((func.schema_name, func.name), [])
 
         return functions
 
     def _get_functions(self) -> list[Function]:
-        """Get list of all functions."""
-        query = """
+        """Get all functions with their definitions."""
+        schema_filter, params = self._schema_filter("routine_schema")
+        query = f"""
             SELECT
                 routine_schema AS schema_name,
                 routine_name AS function_name,
                 data_type AS return_type,
-                routine_comment AS description
+                routine_comment AS description,
+                {self._definition_column("routine_definition")}
             FROM information_schema.routines
             WHERE routine_type = 'FUNCTION'
             AND routine_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
+            {schema_filter}
             ORDER BY routine_schema, routine_name
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         return [
             Function(
                 schema_name=row["schema_name"],
                 name=row["function_name"],
                 function_type="SCALAR",
                 return_type=row["return_type"],
+                definition=row["definition"],
                 description=row["description"] if row["description"] else None,
                 language="SQL",
             )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
-    def _get_parameters(self, schema_name: str, func_name: str) -> list[Parameter]:
-        """Get parameters for a function."""
-        query = """
+    def _get_parameters(self) -> dict[tuple[str, str], list[Parameter]]:
+        """Get parameters for all functions."""
+        # The return value is reported as a nameless parameter at position 0
+        schema_filter, params = self._schema_filter("specific_schema")
+        query = f"""
             SELECT
+                specific_schema,
+                specific_name,
                 parameter_name,
                 data_type,
                 character_maximum_length AS max_length,
@@ -510,35 +646,32 @@ class FunctionExtractor(BaseExtractor):
                 numeric_scale AS scale,
                 ordinal_position
             FROM information_schema.parameters
-            WHERE specific_schema = %s AND specific_name = %s
+            WHERE routine_type = 'FUNCTION'
             AND parameter_mode = 'IN'
             AND parameter_name IS NOT NULL
-            ORDER BY ordinal_position
+            AND specific_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
+            {schema_filter}
+            ORDER BY specific_schema, specific_name, ordinal_position
         """
-        rows = self.connection.execute_dict(query, (schema_name, func_name))
-        return [
-            Parameter(
-                name=row["parameter_name"],
-                data_type=row["data_type"],
-                max_length=row["max_length"],
-                precision=row["precision"],
-                scale=row["scale"],
-                ordinal_position=row["ordinal_position"],
+        parameters: dict[tuple[str, str], list[Parameter]] = defaultdict(list)
+        for (
+            schema_name, function_name, parameter_name, data_type, max_length, precision, scale,
+            ordinal_position,
+        ) in self.connection.execute_iter(query, params):
+            parameters[(schema_name, function_name)].append(
+                Parameter(
+                    name=parameter_name,
+                    data_type=data_type,
+                    max_length=max_length,
+                    precision=precision,
+                    scale=scale,
+                    ordinal_position=ordinal_position,
+                )
             )
-            for row in rows
-        ]
-
-    def _get_definition(self, schema_name: str, func_name: str) -> Optional[str]:
-        """Get function definition."""
-        query = """
-            SELECT routine_definition
-            FROM information_schema.routines
-            WHERE routine_schema = %s AND routine_name = %s AND routine_type = 'FUNCTION'
-        """
-        return self.connection.execute_scalar(query, (schema_name, func_name))
+        return parameters
 
 
-class TriggerExtractor(BaseExtractor):
+class TriggerExtractor(MySQLBaseExtractor):
     """Extracts trigger metadata from MySQL."""
 
     def extract(self) -> list[Trigger]:
@@ -549,7 +682,8 @@ class TriggerExtractor(BaseExtractor):
 
     def _get_triggers(self) -> list[Trigger]:
         """Get list of all triggers."""
-        query = """
+        schema_filter, params = self._schema_filter("trigger_schema")
+        query = f"""
             SELECT
                 trigger_schema AS schema_name,
                 trigger_name,
@@ -560,36 +694,31 @@ class TriggerExtractor(BaseExtractor):
                 action_statement AS definition
             FROM information_schema.triggers
             WHERE trigger_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
+            {schema_filter}
             ORDER BY trigger_schema, trigger_name
         """
-        rows = self.connection.execute_dict(query)
-        triggers = []
-
-        for row in rows:
-            if not self._should_include_schema(row["schema_name"]):
-                continue
-            triggers.append(
-                Trigger(
-                    schema_name=row["schema_name"],
-                    name=row["trigger_name"],
-                    parent_table_schema=row["parent_schema"],
-                    parent_table_name=row["parent_table"],
-                    trigger_type=row["trigger_type"],
-                    events=[row["event"]],
-                    definition=row["definition"],
-                )
+        rows = self.connection.execute_dict(query, params)
+        return [
+            Trigger(
+                schema_name=row["schema_name"],
+                name=row["trigger_name"],
+                parent_table_schema=row["parent_schema"],
+                parent_table_name=row["parent_table"],
+                trigger_type=row["trigger_type"],
+                events=[row["event"]],
+                definition=row["definition"],
             )
-        return triggers
+            for row in rows
+        ]
 
 
-class SecurityExtractor(BaseExtractor):
+class SecurityExtractor(MySQLBaseExtractor):
     """Extracts security metadata from MySQL."""
 
     def extract(self) -> dict:
         """Extract all security metadata."""
-        users = self._extract_users()
+        users, roles = self._extract_accounts()
         logger.info(f"Found {len(users)} users")
-        roles = self._extract_roles()
         logger.info(f"Found {len(roles)} roles")
         permissions = self._extract_permissions()
         logger.info(f"Found {len(permissions)} permissions")
@@ -603,150 +732,76 @@ class SecurityExtractor(BaseExtractor):
             "role_memberships": memberships,
         }
 
-    def _extract_users(self) -> list[User]:
-        """Extract all database users."""
+    def _extract_accounts(self) -> tuple[list[User], list[Role]]:
+        """Extract all database users and roles from a single read of mysql.user."""
         query = """
             SELECT
                 u.user AS user_name,
                 u.host AS host,
                 u.plugin AS auth_plugin,
-                u.authentication_string IS NOT NULL AS has_password,
-                u.account_locked = 'Y' AS is_locked,
-                u.password_expired = 'Y' AS password_expired,
+                u.account_locked,
                 u.password_last_changed AS password_change_date
             FROM mysql.user u
             ORDER BY u.user, u.host
         """
-        rows = self.connection.execute_dict(query)
-        return [
-            User(
-                name=f"{row['user_name']}@{row['host']}",
-                authentication_type=row["auth_plugin"] or "UNKNOWN",
-                is_disabled=bool(row["is_locked"]),
+        users = []
+        roles = []
+        for (
+            user_name, host, auth_plugin, account_locked, password_change_date,
+        ) in self.connection.execute_iter(query):
+            is_locked = account_locked == "Y"
+            name = f"{user_name}@{host}"
+            users.append(User(
+                name=name,
+                authentication_type=auth_plugin or "UNKNOWN",
+                is_disabled=is_locked,
                 create_date=None,
-                modify_date=str(row["password_change_date"]) if row["password_change_date"] else None,
-            )
-            for row in rows
-        ]
-
-    def _extract_roles(self) -> list[Role]:
-        """Extract all database roles (MySQL 8.0+)."""
-        # MySQL roles are essentially users that cannot login
-        query = """
-            SELECT
-                u.user AS role_name,
-                u.host AS host,
-                CASE
-                    WHEN u.account_locked = 'Y' THEN 'DISABLED_ROLE'
-                    ELSE 'DATABASE_ROLE'
-                END AS role_type,
-                u.account_locked = 'Y' AS is_disabled
-            FROM mysql.user u
-            WHERE u.account_locked = 'Y' OR u.user LIKE 'mysql.%'
-            ORDER BY u.user, u.host
-        """
-        try:
-            rows = self.connection.execute_dict(query)
-            return [
-                Role(
-                    name=f"{row['role_name']}@{row['host']}",
-                    role_type=row["role_type"],
-                    is_disabled=bool(row["is_disabled"]),
+                modify_date=str(password_change_date) if password_change_date else None,
+            ))
+            # MySQL roles are essentially users that cannot login
+            if is_locked or user_name.startswith("mysql."):
+                roles.append(Role(
+                    name=name,
+                    role_type="DISABLED_ROLE" if is_locked else "DATABASE_ROLE",
+                    is_disabled=is_locked,
                     create_date=None,
                     modify_date=None,
-                )
-                for row in rows
-            ]
-        except Exception:
-            # Older MySQL versions don't have roles
-            return []
+                ))
+        return users, roles
 
     def _extract_permissions(self) -> list[Permission]:
-        """Extract object-level permissions."""
-        permissions = []
-
-        # Extract table permissions from mysql.db and mysql.tables_priv
-        db_query = """
-            SELECT
-                db AS schema_name,
-                user AS grantee,
-                host AS grantee_host,
-                Select_priv = 'Y' AS can_select,
-                Insert_priv = 'Y' AS can_insert,
-                Update_priv = 'Y' AS can_update,
-                Delete_priv = 'Y' AS can_delete,
-                Create_priv = 'Y' AS can_create,
-                Drop_priv = 'Y' AS can_drop,
-                Grant_priv = 'Y' AS can_grant,
-                References_priv = 'Y' AS can_reference,
-                Index_priv = 'Y' AS can_index,
-                Alter_priv = 'Y' AS can_alter,
-                Create_tmp_table_priv = 'Y' AS can_create_tmp,
-                Lock_tables_priv = 'Y' AS can_lock
+        """Extract database- and table-level permissions."""
+        # The mysql.db flag columns are folded into the comma-separated form of
+        # mysql.tables_priv so both tables come back from a single query
+        query = f"""
+            SELECT 'DATABASE' AS object_type, db, '' AS table_name, user, host,
+                   {_DB_PRIVILEGE_LIST} AS privileges
             FROM mysql.db
-            ORDER BY db, user, host
+            UNION ALL
+            SELECT 'TABLE', db, table_name, user, host, table_priv
+            FROM mysql.tables_priv
+            ORDER BY object_type, db, table_name, user, host
         """
-        db_rows = self.connection.execute_dict(db_query)
-        for row in db_rows:
-            grantee = f"{row['grantee']}@{row['grantee_host']}"
-            perms = [
-                ("SELECT", row["can_select"]),
-                ("INSERT", row["can_insert"]),
-                ("UPDATE", row["can_update"]),
-                ("DELETE", row["can_delete"]),
-                ("CREATE", row["can_create"]),
-                ("DROP", row["can_drop"]),
-                ("GRANT", row["can_grant"]),
-                ("REFERENCES", row["can_reference"]),
-                ("INDEX", row["can_index"]),
-                ("ALTER", row["can_alter"]),
-            ]
-            for perm_name, has_perm in perms:
-                if has_perm:
+        permissions = []
+        for object_type, schema_name, object_name, user, host, privileges in self.connection.execute_iter(
+            query
+        ):
+            if not privileges:
+                continue
+            grantee = f"{user}@{host}"
+            for priv in privileges.split(","):
+                priv = priv.strip()
+                if priv:
                     permissions.append(Permission(
                         grantee=grantee,
                         grantee_type="USER",
-                        object_schema=row["schema_name"],
-                        object_name="",  # Database-level permission
-                        object_type="DATABASE",
-                        permission=perm_name,
+                        object_schema=schema_name,
+                        object_name=object_name,
+                        object_type=object_type,
+                        permission=priv.upper(),
                         state="GRANT",
                         grantor=None,
                     ))
-
-        # Extract table-specific permissions
-        table_query = """
-            SELECT
-                tp.db AS schema_name,
-                tp.table_name AS object_name,
-                tp.user AS grantee,
-                tp.host AS grantee_host,
-                tp.table_priv AS table_privileges,
-                tp.column_priv AS column_privileges
-            FROM mysql.tables_priv tp
-            ORDER BY tp.db, tp.table_name, tp.user, tp.host
-        """
-        table_rows = self.connection.execute_dict(table_query)
-        for row in table_rows:
-            grantee = f"{row['grantee']}@{row['grantee_host']}"
-
-            # Parse table privileges (comma-separated)
-            if row["table_privileges"]:
-                priv_list = row["table_privileges"].split(',')
-                for priv in priv_list:
-                    priv = priv.strip()
-                    if priv:
-                        permissions.append(Permission(
-                            grantee=grantee,
-                            grantee_type="USER",
-                            object_schema=row["schema_name"],
-                            object_name=row["object_name"],
-                            object_type="TABLE",
-                            permission=priv.upper(),
-                            state="GRANT",
-                            grantor=None,
-                        ))
-
         return permissions
 
     def _extract_role_memberships(self) -> list[RoleMembership]:
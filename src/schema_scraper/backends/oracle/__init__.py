@@ -1,5 +1,8 @@
 """Oracle backend."""
 
+from types import MappingProxyType
+from typing import Mapping, Optional
+
 from .connection import OracleConnection
 from .extractors import (
     FunctionExtractor,
@@ -13,18 +16,21 @@ from .extractors import (
 )
 
 
-def get_extractors() -> dict:
+_EXTRACTORS: Mapping[str, Optional[type]] = MappingProxyType({
+    "tables": TableExtractor,
+    "views": ViewExtractor,
+    "procedures": ProcedureExtractor,
+    "functions": FunctionExtractor,
+    "triggers": TriggerExtractor,
+    "types": TypeExtractor,
+    "sequences": SequenceExtractor,
+    "synonyms": SynonymExtractor,
+})
+
+
+def get_extractors() -> Mapping[str, Optional[type]]:
     """Get all extractors for Oracle."""
-    return {
-        "tables": TableExtractor,
-        "views": ViewExtractor,
-        "procedures": ProcedureExtractor,
-        "functions": FunctionExtractor,
-        "triggers": TriggerExtractor,
-        "types": TypeExtractor,
-        "sequences": SequenceExtractor,
-        "synonyms": SynonymExtractor,
-    }
+    return _EXTRACTORS
 
 
 __all__ = [
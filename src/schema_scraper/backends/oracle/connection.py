@@ -1,7 +1,8 @@
 """Oracle database connection."""
 
 import logging
-from typing import Any, Optional
+from contextlib import contextmanager
+from typing import Any, Generator, Optional
 
 import oracledb
 
@@ -60,12 +61,18 @@ class OracleConnection(BaseConnection):
             raise ConnectionError("Not connected to database")
         return self._connection
 
-    def execute_dict(self, query: str, params: tuple = ()) -> list[dict[str, Any]]:
-        """Execute a query and return results as dictionaries."""
+    @contextmanager
+    def cursor(self) -> Generator[Any, None, None]:
+        """Get a cursor that fetches config.fetch_batch_size rows per round trip."""
         with self.connection.cursor() as cur:
-            cur.execute(query, params)
-            columns = [col[0].lower() for col in cur.description]
-            return [dict(zip(columns, row)) for row in cur.fetchall()]
+            cur.arraysize = self.config.fetch_batch_size
+            # Return the first batch in the execute round trip itself
+            cur.prefetchrows = cur.arraysize + 1
+            yield cur
+
+    def _column_names(self, cur: Any) -> list[str]:
+        """Get lowercase dictionary keys; Oracle reports column names in upper case."""
+        return [col[0].lower() for col in cur.description]
 
     def execute_scalar(self, query: str, params: tuple = ()) -> Any:
         """Execute a query and return a single value."""
@@ -1,7 +1,8 @@
 """Oracle schema extractors."""
 
 import logging
-from typing import Any, Optional
+from collections import defaultdict
+from typing import Optional
 
 from ...base import BaseExtractor
 from ...base.models import (
@@ -30,52 +31,119 @@ from ...base.models import (
 logger = logging.getLogger(__name__)
 
 
-class TableExtractor(BaseExtractor):
+class OracleBaseExtractor(BaseExtractor):
+    """Base extractor with Oracle-specific helpers."""
+
+    _placeholder = ":{}"
+
+    def _get_sources(self, object_type: str) -> dict[tuple[str, str], str]:
+        """Get the source text of every object of one type, keyed by (owner, name)."""
+        if not self.config.include_definitions:
+            return {}
+        schema_filter, params = self._schema_filter("owner")
+        query = f"""
+            SELECT owner, name, text
+            FROM all_source
+            WHERE type = '{object_type}'
+            AND owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
+                             'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
+                             'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
+            ORDER BY owner, name, line
+        """
+        # Lines are joined here rather than with LISTAGG, which is capped at 4000 bytes
+        lines: dict[tuple[str, str], list[str]] = defaultdict(list)
+        for owner, name, text in self.connection.execute_iter(query, params):
+            lines[(owner, name)].append(text)
+        return {key: "".join(texts) for key, texts in lines.items()}
+
+
+class TableExtractor(OracleBaseExtractor):
     """Extracts table metadata from Oracle."""
 
     def extract(self) -> list[Table]:
         """Extract all tables with their metadata."""
-        tables = self._get_tables()
+        # Each helper fetches its metadata for every table in one query, keyed
+        # by (owner, table_name); they are independent of each other and of
+        # the table list, so all of them are issued together
+        results = self._run_parallel({
+            "tables": self._get_tables,
+            "columns": self._get_columns,
+            "primary_keys": self._get_primary_keys,
+            "foreign_keys": self._get_foreign_keys,
+            "indexes": self._get_indexes,
+            "check_constraints": self._get_check_constraints,
+            "unique_constraints": self._get_unique_constraints,
+            "triggers": self._get_table_triggers,
+            "partitioned": self._get_partitioned_tables,
+            "referenced_by": self._get_references,
+        })
+        tables = results["tables"]
         logger.info(f"Found {len(tables)} tables")
+        columns = results["columns"]
+        primary_keys = results["primary_keys"]
+        foreign_keys = results["foreign_keys"]
+        indexes = results["indexes"]
+        check_constraints = results["check_constraints"]
+        unique_constraints = results["unique_constraints"]
+        triggers = results["triggers"]
+        partitioned = results["partitioned"]
+        referenced_by = results["referenced_by"]
 
         for table in tables:
-            table.columns = self._get_columns(table.schema_name, table.name)
-            table.primary_key = self._get_primary_key(table.schema_name, table.name)
-            table.foreign_keys = self._get_foreign_keys(table.schema_name, table.name)
-            table.indexes = self._get_indexes(table.schema_name, table.name)
-            table.check_constraints = self._get_check_constraints(table.schema_name, table.name)
-            table.unique_constraints = self._get_unique_constraints(table.schema_name, table.name)
-            table.triggers = self._get_table_triggers(table.schema_name, table.name)
-            table.partitioning = self._get_partitioning(table.schema_name, table.name)
-            table.description = self._get_description(table.schema_name, table.name)
-            stats = self._get_table_stats(table.schema_name, table.name)
-            table.row_count = stats.get("row_count", 0)
-            table.total_space_kb = stats.get("total_space_kb", 0)
-
-        self._build_references(tables)
+            key = (table.schema_name, table.name)
+            table.columns = columns.get(key, [])
+            table.primary_key = primary_keys.get(key)
+            table.foreign_keys = foreign_keys.get(key, [])
+            table.referenced_by = referenced_by.get(key, [])
+            table.indexes = indexes.get(key, [])
+            table.check_constraints = check_constraints.get(key, [])
+            table.unique_constraints = unique_constraints.get(key, [])
+            table.triggers = triggers.get(key, [])
+            # Partition details are only queried for tables that have partitions
+            if key in partitioned:
+                table.partitioning = self._get_partitioning(table.schema_name, table.name)
+            else:
+                table.partitioning = TablePartitioning(is_partitioned=False)
+
         return tables
 
     def _get_tables(self) -> list[Table]:
-        """Get list of all tables."""
-        query = """
-            SELECT owner AS schema_name, table_name
-            FROM all_tables
-            WHERE owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
-                               'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
-                               'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
-            ORDER BY owner, table_name
+        """Get all tables with their descriptions and, unless disabled, statistics."""
+        schema_filter, params = self._schema_filter("t.owner")
+        if self.config.include_stats:
+            stats = "NVL(t.num_rows, 0) AS row_count, NVL(t.blocks * 8, 0) AS total_space_kb"
+        else:
+            stats = "NULL AS row_count, NULL AS total_space_kb"
+        query = f"""
+            SELECT t.owner AS schema_name, t.table_name, {stats}, tc.comments AS description
+            FROM all_tables t
+            LEFT JOIN all_tab_comments tc ON tc.owner = t.owner AND tc.table_name = t.table_name
+            WHERE t.owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
+                                 'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
+                                 'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
+            ORDER BY t.owner, t.table_name
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         return [
-            Table(schema_name=row["schema_name"], name=row["table_name"])
+            Table(
+                schema_name=row["schema_name"],
+                name=row["table_name"],
+                row_count=row["row_count"] or 0,
+                total_space_kb=row["total_space_kb"] or 0,
+                description=row["description"],
+            )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
-    def _get_columns(self, schema_name: str, table_name: str) -> list[Column]:
-        """Get columns for a table."""
-        query = """
+    def _get_columns(self) -> dict[tuple[str, str], list[Column]]:
+        """Get columns for all tables."""
+        schema_filter, params = self._schema_filter("c.owner")
+        query = f"""
             SELECT
+                c.owner,
+                c.table_name,
                 c.column_name,
                 c.data_type,
                 c.data_length AS max_length,
@@ -88,197 +156,215 @@ class TableExtractor(BaseExtractor):
                 CASE WHEN c.virtual_column = 'YES' THEN 1 ELSE 0 END AS is_virtual,
                 cc.comments AS description
             FROM all_tab_columns c
+            JOIN all_tables t ON t.owner = c.owner AND t.table_name = c.table_name
             LEFT JOIN all_col_comments cc
                 ON c.owner = cc.owner AND c.table_name = cc.table_name AND c.column_name = cc.column_name
-            WHERE c.owner = :1 AND c.table_name = :2
-            ORDER BY c.column_id
+            WHERE c.owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
+                                 'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
+                                 'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
+            ORDER BY c.owner, c.table_name, c.column_id
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        return [
-            Column(
-                name=row["column_name"],
-                data_type=row["data_type"],
-                max_length=row["max_length"],
-                precision=row["precision"],
-                scale=row["scale"],
-                is_nullable=bool(row["is_nullable"]),
-                default_value=str(row["default_value"]).strip() if row["default_value"] and not row["is_virtual"] else None,
-                is_identity=bool(row["is_identity"]),
-                is_computed=bool(row["is_virtual"]),
-                computed_definition=str(row["default_value"]).strip() if row["is_virtual"] and row["default_value"] else None,
-                ordinal_position=row["ordinal_position"],
-                description=row["description"],
+        columns: dict[tuple[str, str], list[Column]] = defaultdict(list)
+        # Streamed plain tuple rows in fetch_batch_size batches: this is the
+        # largest result set, so skip per-row dicts
+        for (
+            schema_name, table_name, column_name, data_type, max_length, precision, scale,
+            is_nullable, default_value, ordinal_position, is_identity, is_virtual, description,
+        ) in self.connection.execute_iter(query, params):
+            expression = str(default_value).strip() if default_value else None
+            columns[(schema_name, table_name)].append(
+                Column(
+                    name=column_name,
+                    data_type=data_type,
+                    max_length=max_length,
+                    precision=precision,
+                    scale=scale,
+                    is_nullable=bool(is_nullable),
+                    default_value=None if is_virtual else expression,
+                    is_identity=bool(is_identity),
+                    is_computed=bool(is_virtual),
+                    computed_definition=expression if is_virtual else None,
+                    ordinal_position=ordinal_position,
+                    description=description,
+                )
             )
-            for row in rows
-        ]
+        return columns
 
-    def _get_primary_key(self, schema_name: str, table_name: str) -> Optional[PrimaryKey]:
-        """Get primary key for a table."""
-        query = """
-            SELECT constraint_name
-            FROM all_constraints
-            WHERE owner = :1 AND table_name = :2 AND constraint_type = 'P'
-        """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        if not rows:
-            return None
-
-        pk_name = rows[0]["constraint_name"]
-        col_query = """
-            SELECT column_name
-            FROM all_cons_columns
-            WHERE owner = :1 AND constraint_name = :2
-            ORDER BY position
+    def _get_primary_keys(self) -> dict[tuple[str, str], PrimaryKey]:
+        """Get primary keys for all tables."""
+        schema_filter, params = self._schema_filter("c.owner")
+        query = f"""
+            SELECT c.owner, c.table_name, c.constraint_name, cc.column_name
+            FROM all_constraints c
+            JOIN all_cons_columns cc ON cc.owner = c.owner AND cc.constraint_name = c.constraint_name
+            WHERE c.constraint_type = 'P'
+            AND c.owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
+                               'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
+                               'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
+            ORDER BY c.owner, c.table_name, cc.position
         """
-        col_rows = self.connection.execute_dict(col_query, (schema_name, pk_name))
-        return PrimaryKey(
-            name=pk_name,
-            columns=[row["column_name"] for row in col_rows],
-            is_clustered=False,
-        )
+        primary_keys: dict[tuple[str, str], PrimaryKey] = {}
+        for schema_name, table_name, constraint_name, column_name in self.connection.execute_iter(
+            query, params
+        ):
+            pk = primary_keys.get((schema_name, table_name))
+            if pk is None:
+                pk = primary_keys[(schema_name, table_name)] = PrimaryKey(
+                    name=constraint_name, columns=[], is_clustered=False
+                )
+            pk.columns.append(column_name)
+        return primary_keys
 
-    def _get_foreign_keys(self, schema_name: str, table_name: str) -> list[ForeignKey]:
-        """Get foreign keys for a table."""
-        query = """
+    def _get_foreign_keys(self) -> dict[tuple[str, str], list[ForeignKey]]:
+        """Get foreign keys for all tables."""
+        schema_filter, params = self._schema_filter("c.owner")
+        query = f"""
             SELECT
+                c.owner,
+                c.table_name,
                 c.constraint_name,
+                cc.column_name,
                 c.r_owner AS referenced_schema,
                 rc.table_name AS referenced_table,
+                rcc.column_name AS referenced_column,
                 c.delete_rule AS on_delete
             FROM all_constraints c
-            JOIN all_constraints rc ON c.r_constraint_name = rc.constraint_name AND c.r_owner = rc.owner
-            WHERE c.owner = :1 AND c.table_name = :2 AND c.constraint_type = 'R'
+            JOIN all_cons_columns cc ON cc.owner = c.owner AND cc.constraint_name = c.constraint_name
+            JOIN all_constraints rc ON rc.owner = c.r_owner AND rc.constraint_name = c.r_constraint_name
+            JOIN all_cons_columns rcc
+                ON rcc.owner = rc.owner AND rcc.constraint_name = rc.constraint_name
+                AND rcc.position = cc.position
+            WHERE c.constraint_type = 'R'
+            AND c.owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
+                               'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
+                               'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
+            ORDER BY c.owner, c.table_name, c.constraint_name, cc.position
         """
-        fk_rows = self.connection.execute_dict(query, (schema_name, table_name))
-        foreign_keys = []
-
-        for fk_row in fk_rows:
-            # Get FK columns
-            col_query = """
-                SELECT column_name
-                FROM all_cons_columns
-                WHERE owner = :1 AND constraint_name = :2
-                ORDER BY position
-            """
-            fk_cols = self.connection.execute_dict(col_query, (schema_name, fk_row["constraint_name"]))
-
-            # Get referenced columns
-            ref_query = """
-                SELECT cc.column_name
-                FROM all_constraints c
-                JOIN all_cons_columns cc ON c.r_constraint_name = cc.constraint_name AND c.r_owner = cc.owner
-                WHERE c.owner = :1 AND c.constraint_name = :2
-                ORDER BY cc.position
-            """
-            ref_cols = self.connection.execute_dict(ref_query, (schema_name, fk_row["constraint_name"]))
-
-            foreign_keys.append(
-                ForeignKey(
-                    name=fk_row["constraint_name"],
-                    columns=[row["column_name"] for row in fk_cols],
-                    referenced_schema=fk_row["referenced_schema"],
-                    referenced_table=fk_row["referenced_table"],
-                    referenced_columns=[row["column_name"] for row in ref_cols],
-                    on_delete=fk_row["on_delete"] or "NO ACTION",
+        foreign_keys: dict[tuple[str, str], list[ForeignKey]] = defaultdict(list)
+        # One row per key column, in constraint order
+        for (
+            schema_name, table_name, constraint_name, column_name, referenced_schema,
+            referenced_table, referenced_column, on_delete,
+        ) in self.connection.execute_iter(query, params):
+            table_fks = foreign_keys[(schema_name, table_name)]
+            if not table_fks or table_fks[-1].name != constraint_name:
+                table_fks.append(ForeignKey(
+                    name=constraint_name,
+                    columns=[],
+                    referenced_schema=referenced_schema,
+                    referenced_table=referenced_table,
+                    referenced_columns=[],
+                    on_delete=on_delete or "NO ACTION",
                     on_update="NO ACTION",  # Oracle doesn't support ON UPDATE
-                )
-            )
+                ))
+            table_fks[-1].columns.append(column_name)
+            table_fks[-1].referenced_columns.append(referenced_column)
         return foreign_keys
 
-    def _get_indexes(self, schema_name: str, table_name: str) -> list[Index]:
-        """Get indexes for a table."""
-        query = """
+    def _get_indexes(self) -> dict[tuple[str, str], list[Index]]:
+        """Get indexes for all tables."""
+        schema_filter, params = self._schema_filter("i.table_owner")
+        query = f"""
             SELECT
+                i.table_owner,
+                i.table_name,
                 i.index_name,
-                i.uniqueness = 'UNIQUE' AS is_unique,
+                i.uniqueness,
                 i.index_type,
-                CASE WHEN c.constraint_type = 'P' THEN 1 ELSE 0 END AS is_primary_key
+                CASE WHEN c.constraint_type = 'P' THEN 1 ELSE 0 END AS is_primary_key,
+                ic.column_name
             FROM all_indexes i
+            JOIN all_ind_columns ic ON ic.index_owner = i.owner AND ic.index_name = i.index_name
             LEFT JOIN all_constraints c
                 ON i.owner = c.owner AND i.index_name = c.index_name AND c.constraint_type = 'P'
-            WHERE i.owner = :1 AND i.table_name = :2
-            ORDER BY i.index_name
+            WHERE i.table_owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
+                                       'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
+                                       'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
+            ORDER BY i.table_owner, i.table_name, i.index_name, ic.column_position
         """
-        idx_rows = self.connection.execute_dict(query, (schema_name, table_name))
-        indexes = []
-
-        for idx_row in idx_rows:
-            col_query = """
-                SELECT column_name
-                FROM all_ind_columns
-                WHERE index_owner = :1 AND index_name = :2
-                ORDER BY column_position
-            """
-            col_rows = self.connection.execute_dict(col_query, (schema_name, idx_row["index_name"]))
-
-            # Get filter definition if any
-            filter_query = """
-                SELECT index_type FROM all_indexes
-                WHERE owner = :1 AND index_name = :2 AND index_type LIKE '%FUNCTION-BASED%'
-            """
-            filter_rows = self.connection.execute_dict(filter_query, (schema_name, idx_row["index_name"]))
-            filter_definition = None
-            if filter_rows:
-                # For function-based indexes, we could potentially extract the expression
-                # but it's complex to parse. For now, we'll just indicate it's function-based
-                filter_definition = "FUNCTION-BASED INDEX"
-
-            indexes.append(
-                Index(
-                    name=idx_row["index_name"],
-                    columns=[row["column_name"] for row in col_rows],
-                    is_unique=bool(idx_row["is_unique"]),
-                    is_primary_key=bool(idx_row["is_primary_key"]),
-                    index_type=idx_row["index_type"],
-                    filter_definition=filter_definition,
-                )
-            )
+        indexes: dict[tuple[str, str], list[Index]] = defaultdict(list)
+        # One row per index column, in index order
+        for (
+            schema_name, table_name, index_name, uniqueness, index_type, is_primary_key, column_name,
+        ) in self.connection.execute_iter(query, params):
+            table_indexes = indexes[(schema_name, table_name)]
+            if not table_indexes or table_indexes[-1].name != index_name:
+                table_indexes.append(Index(
+                    name=index_name,
+                    columns=[],
+                    is_unique=uniqueness == "UNIQUE",
+                    is_primary_key=bool(is_primary_key),
+                    index_type=index_type,
+                    # The expression of a function-based index is not parsed,
+                    # only flagged
+                    filter_definition="FUNCTION-BASED INDEX" if "FUNCTION-BASED" in index_type else None,
+                ))
+            table_indexes[-1].columns.append(column_name)
         return indexes
 
-    def _get_check_constraints(self, schema_name: str, table_name: str) -> list[CheckConstraint]:
-        """Get check constraints for a table."""
-        query = """
-            SELECT constraint_name, search_condition AS definition
+    def _get_check_constraints(self) -> dict[tuple[str, str], list[CheckConstraint]]:
+        """Get check constraints for all tables."""
+        schema_filter, params = self._schema_filter("owner")
+        query = f"""
+            SELECT owner, table_name, constraint_name, search_condition AS definition
             FROM all_constraints
-            WHERE owner = :1 AND table_name = :2
-            AND constraint_type = 'C'
+            WHERE constraint_type = 'C'
             AND generated = 'USER NAME'
+            AND owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
+                             'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
+                             'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        return [
-            CheckConstraint(
-                name=row["constraint_name"],
-                definition=str(row["definition"]) if row["definition"] else "",
+        check_constraints: dict[tuple[str, str], list[CheckConstraint]] = defaultdict(list)
+        for schema_name, table_name, constraint_name, definition in self.connection.execute_iter(
+            query, params
+        ):
+            check_constraints[(schema_name, table_name)].append(
+                CheckConstraint(name=constraint_name, definition=str(definition) if definition else "")
             )
-            for row in rows
-        ]
+        return check_constraints
 
-    def _get_unique_constraints(self, schema_name: str, table_name: str) -> list[UniqueConstraint]:
-        """Get unique constraints for a table."""
-        query = """
-            SELECT constraint_name
-            FROM all_constraints
-            WHERE owner = :1 AND table_name = :2 AND constraint_type = 'U'
+    def _get_unique_constraints(self) -> dict[tuple[str, str], list[UniqueConstraint]]:
+        """Get unique constraints for all tables."""
+        schema_filter, params = self._schema_filter("c.owner")
+        query = f"""
+            SELECT c.owner, c.table_name, c.constraint_name, cc.column_name
+            FROM all_constraints c
+            JOIN all_cons_columns cc ON cc.owner = c.owner AND cc.constraint_name = c.constraint_name
+            WHERE c.constraint_type = 'U'
+            AND c.owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
+                               'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
+                               'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
+            ORDER BY c.owner, c.table_name, c.constraint_name, cc.position
         """
-        constraint_rows = self.connection.execute_dict(query, (schema_name, table_name))
-        unique_constraints = []
-
-        for constraint_row in constraint_rows:
-            col_query = """
-                SELECT column_name
-                FROM all_cons_columns
-                WHERE owner = :1 AND constraint_name = :2
-                ORDER BY position
-            """
-            col_rows = self.connection.execute_dict(col_query, (schema_name, constraint_row["constraint_name"]))
-            unique_constraints.append(
-                UniqueConstraint(
-                    name=constraint_row["constraint_name"],
-                    columns=[row["column_name"] for row in col_rows],
-                )
-            )
+        unique_constraints: dict[tuple[str, str], list[UniqueConstraint]] = defaultdict(list)
+        for schema_name, table_name, constraint_name, column_name in self.connection.execute_iter(
+            query, params
+        ):
+            table_constraints = unique_constraints[(schema_name, table_name)]
+            if not table_constraints or table_constraints[-1].name != constraint_name:
+                table_constraints.append(UniqueConstraint(name=constraint_name, columns=[]))
+            table_constraints[-1].columns.append(column_name)
         return unique_constraints
 
+    def _get_partitioned_tables(self) -> set[tuple[str, str]]:
+        """Get tables that are partitioned."""
+        schema_filter, params = self._schema_filter("owner")
+        query = f"""
+            SELECT owner, table_name
+            FROM all_part_tables
+            WHERE owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
+                               'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
+                               'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
+        """
+        return set(self.connection.execute_iter(query, params))
+
     def _get_partitioning(self, schema_name: str, table_name: str) -> Optional[TablePartitioning]:
         """Get partitioning information for a table."""
         # Check if table is partitioned
@@ -363,22 +449,28 @@ class TableExtractor(BaseExtractor):
             is_partitioned=True,
         )
 
-    def _get_table_triggers(self, schema_name: str, table_name: str) -> list[Trigger]:
-        """Get triggers for a table."""
-        query = """
+    def _get_table_triggers(self) -> dict[tuple[str, str], list[Trigger]]:
+        """Get triggers for all tables."""
+        schema_filter, params = self._schema_filter("table_owner")
+        query = f"""
             SELECT
+                table_owner,
+                table_name,
                 trigger_name,
                 trigger_type,
                 triggering_event AS events,
                 trigger_body AS definition,
-                status = 'DISABLED' AS is_disabled
+                status
             FROM all_triggers
-            WHERE table_owner = :1 AND table_name = :2
+            WHERE base_object_type = 'TABLE'
+            AND table_owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
+                                   'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
+                                   'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        triggers = []
+        triggers: dict[tuple[str, str], list[Trigger]] = defaultdict(list)
 
-        for row in rows:
+        for row in self.connection.iter_dict(query, params):
             # Parse trigger type
             trigger_type = row["trigger_type"]
             if "BEFORE" in trigger_type.upper():
@@ -393,68 +485,44 @@ class TableExtractor(BaseExtractor):
             # Parse events
             events = [e.strip() for e in row["events"].upper().split(" OR ")]
 
-            triggers.append(
+            triggers[(row["table_owner"], row["table_name"])].append(
                 Trigger(
-                    schema_name=schema_name,
+                    schema_name=row["table_owner"],
                     name=row["trigger_name"],
-                    parent_table_schema=schema_name,
-                    parent_table_name=table_name,
+                    parent_table_schema=row["table_owner"],
+                    parent_table_name=row["table_name"],
                     trigger_type=timing,
                     events=events,
                     definition=row["definition"],
-                    is_disabled=bool(row["is_disabled"]),
+                    is_disabled=row["status"] == "DISABLED",
                 )
             )
         return triggers
 
-    def _get_description(self, schema_name: str, table_name: str) -> Optional[str]:
-        """Get table description."""
-        query = """
-            SELECT comments
-            FROM all_tab_comments
-            WHERE owner = :1 AND table_name = :2
-        """
-        return self.connection.execute_scalar(query, (schema_name, table_name))
-
-    def _get_table_stats(self, schema_name: str, table_name: str) -> dict[str, Any]:
-        """Get row count and space statistics."""
-        query = """
-            SELECT
-                NVL(num_rows, 0) AS row_count,
-                NVL(blocks * 8, 0) AS total_space_kb
-            FROM all_tables
-            WHERE owner = :1 AND table_name = :2
-        """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        if rows:
-            return {"row_count": rows[0]["row_count"], "total_space_kb": rows[0]["total_space_kb"]}
-        return {"row_count": 0, "total_space_kb": 0}
-
-    def _build_references(self, tables: list[Table]) -> None:
-        """Build the referenced_by list for each table."""
-        query = """
-            SELECT
-                c.owner AS parent_schema,
-                c.table_name AS parent_table,
-                c.constraint_name AS fk_name,
-                c.r_owner AS referenced_schema,
-                rc.table_name AS referenced_table
+    def _get_references(self) -> dict[tuple[str, str], list[tuple[str, str, str]]]:
+        """Get the (schema, table, fk_name) foreign keys referencing each table."""
+        # Filtered on the referenced owner, so keys declared in excluded
+        # schemas are still listed against the included tables they point at
+        schema_filter, params = self._schema_filter("c.r_owner")
+        query = f"""
+            SELECT c.owner, c.table_name, c.constraint_name, c.r_owner, rc.table_name
             FROM all_constraints c
-            JOIN all_constraints rc ON c.r_constraint_name = rc.constraint_name AND c.r_owner = rc.owner
+            JOIN all_constraints rc ON rc.owner = c.r_owner AND rc.constraint_name = c.r_constraint_name
             WHERE c.constraint_type = 'R'
+            AND c.r_owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
+                                 'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
+                                 'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
         """
-        rows = self.connection.execute_dict(query)
-        table_map = {(t.schema_name, t.name): t for t in tables}
-
-        for row in rows:
-            ref_key = (row["referenced_schema"], row["referenced_table"])
-            if ref_key in table_map:
-                table_map[ref_key].referenced_by.append(
-                    (row["parent_schema"], row["parent_table"], row["fk_name"])
-                )
+        referenced_by: dict[tuple[str, str], list[tuple[str, str, str]]] = defaultdict(list)
+        for schema_name, table_name, fk_name, referenced_schema, referenced_table in (
+            self.connection.execute_iter(query, params)
+        ):
+            referenced_by[(referenced_schema, referenced_table)].append((schema_name, table_name, fk_name))
+        return referenced_by
 
 
-class ViewExtractor(BaseExtractor):
+class ViewExtractor(OracleBaseExtractor):
     """Extracts view metadata from Oracle."""
 
     def extract(self) -> list[View]:
@@ -462,28 +530,39 @@ class ViewExtractor(BaseExtractor):
         views = self._get_views()
         logger.info(f"Found {len(views)} views")
 
-        for view in views:
-            view.columns = self._get_columns(view.schema_name, view.name)
-            view.definition = self._get_definition(view.schema_name, view.name)
-            view.description = self._get_description(view.schema_name, view.name)
-
+        self._map_parallel(self._add_details, views)
         return views
 
+    def _add_details(self, view: View) -> None:
+        """Fetch the columns of one view."""
+        view.columns = self._get_columns(view.schema_name, view.name)
+
     def _get_views(self) -> list[View]:
         """Get list of all views."""
-        query = """
-            SELECT owner AS schema_name, view_name
-            FROM all_views
-            WHERE owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
-                               'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
-                               'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
-            ORDER BY owner, view_name
+        schema_filter, params = self._schema_filter("v.owner")
+        query = f"""
+            SELECT
+                v.owner AS schema_name,
+                v.view_name,
+                {self._definition_column("v.text")},
+                c.comments AS description
+            FROM all_views v
+            LEFT JOIN all_tab_comments c ON c.owner = v.owner AND c.table_name = v.view_name
+            WHERE v.owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
+                                 'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
+                                 'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
+            ORDER BY v.owner, v.view_name
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         return [
-            View(schema_name=row["schema_name"], name=row["view_name"])
+            View(
+                schema_name=row["schema_name"],
+                name=row["view_name"],
+                definition=row["definition"],
+                description=row["description"],
+            )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
     def _get_columns(self, schema_name: str, view_name: str) -> list[Column]:
@@ -515,53 +594,54 @@ class ViewExtractor(BaseExtractor):
             for row in rows
         ]
 
-    def _get_definition(self, schema_name: str, view_name: str) -> Optional[str]:
-        """Get the SQL definition of a view."""
-        query = "SELECT text FROM all_views WHERE owner = :1 AND view_name = :2"
-        return self.connection.execute_scalar(query, (schema_name, view_name))
-
-    def _get_description(self, schema_name: str, view_name: str) -> Optional[str]:
-        """Get view description."""
-        query = "SELECT comments FROM all_tab_comments WHERE owner = :1 AND table_name = :2"
-        return self.connection.execute_scalar(query, (schema_name, view_name))
-
 
-class ProcedureExtractor(BaseExtractor):
+class ProcedureExtractor(OracleBaseExtractor):
     """Extracts stored procedure metadata from Oracle."""
 
     def extract(self) -> list[Procedure]:
         """Extract all stored procedures."""
-        procedures = self._get_procedures()
+        results = self._run_parallel({
+            "procedures": self._get_procedures,
+            "definitions": lambda: self._get_sources("PROCEDURE"),
+            "parameters": self._get_parameters,
+        })
+        procedures = results["procedures"]
+        definitions = results["definitions"]
+        parameters = results["parameters"]
         logger.info(f"Found {len(procedures)} stored procedures")
 
         for proc in procedures:
-            proc.parameters = self._get_parameters(proc.schema_name, proc.name)
-            proc.definition = self._get_definition(proc.schema_name, proc.name)
-
+            key = (proc.schema_name, proc.name)
+            proc.definition = definitions.get(key)
+            proc.parameters = parameters.get(key, [])
         return procedures
 
     def _get_procedures(self) -> list[Procedure]:
         """Get list of all stored procedures."""
-        query = """
+        schema_filter, params = self._schema_filter("owner")
+        query = f"""
             SELECT owner AS schema_name, object_name AS procedure_name
             FROM all_procedures
             WHERE object_type = 'PROCEDURE'
             AND owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
                              'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
                              'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
             ORDER BY owner, object_name
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         return [
             Procedure(schema_name=row["schema_name"], name=row["procedure_name"], language="PL/SQL")
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
-    def _get_parameters(self, schema_name: str, proc_name: str) -> list[Parameter]:
-        """Get parameters for a procedure."""
-        query = """
+    def _get_parameters(self) -> dict[tuple[str, str], list[Parameter]]:
+        """Get parameters for all stored procedures."""
+        schema_filter, params = self._schema_filter("owner")
+        query = f"""
             SELECT
+                owner AS schema_name,
+                object_name AS procedure_name,
                 argument_name,
                 data_type,
                 data_length AS max_length,
@@ -572,13 +652,17 @@ class ProcedureExtractor(BaseExtractor):
                 default_value,
                 position AS ordinal_position
             FROM all_arguments
-            WHERE owner = :1 AND object_name = :2
+            WHERE package_name IS NULL
             AND argument_name IS NOT NULL
-            ORDER BY position
+            AND owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
+                             'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
+                             'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
+            ORDER BY owner, object_name, position
         """
-        rows = self.connection.execute_dict(query, (schema_name, proc_name))
-        return [
-            Parameter(
+        parameters: dict[tuple[str, str], list[Parameter]] = defaultdict(list)
+        for row in self.connection.iter_dict(query, params):
+            parameters[(row["schema_name"], row["procedure_name"])].append(Parameter(
                 name=row["argument_name"],
                 data_type=row["data_type"],
                 max_length=row["max_length"],
@@ -588,47 +672,48 @@ class ProcedureExtractor(BaseExtractor):
                 has_default=bool(row["has_default"]),
                 default_value=str(row["default_value"]) if row["default_value"] else None,
                 ordinal_position=row["ordinal_position"],
-            )
-            for row in rows
-        ]
-
-    def _get_definition(self, schema_name: str, proc_name: str) -> Optional[str]:
-        """Get procedure definition."""
-        query = """
-            SELECT LISTAGG(text, '') WITHIN GROUP (ORDER BY line) AS definition
-            FROM all_source
-            WHERE owner = :1 AND name = :2 AND type = 'PROCEDURE'
-        """
-        return self.connection.execute_scalar(query, (schema_name, proc_name))
+            ))
+        return parameters
 
 
-class FunctionExtractor(BaseExtractor):
+class FunctionExtractor(OracleBaseExtractor):
     """Extracts function metadata from Oracle."""
 
     def extract(self) -> list[Function]:
         """Extract all functions."""
-        functions = self._get_functions()
+        results = self._run_parallel({
+            "functions": self._get_functions,
+            "definitions": lambda: self._get_sources("FUNCTION"),
+            "parameters": self._get_parameters,
+            "return_types": self._get_return_types,
+        })
+        functions = results["functions"]
+        definitions = results["definitions"]
+        parameters = results["parameters"]
+        return_types = results["return_types"]
         logger.info(f"Found {len(functions)} functions")
 
         for func in functions:
-            func.parameters = self._get_parameters(func.schema_name, func.name)
-            func.definition = self._get_definition(func.schema_name, func.name)
-            func.return_type = self._get_return_type(func.schema_name, func.name)
-
+            key = (func.schema_name, func.name)
+            func.definition = definitions.get(key)
+            func.parameters = parameters.get(key, [])
+            func.return_type = return_types.get(key)
         return functions
 
     def _get_functions(self) -> list[Function]:
         """Get list of all functions."""
-        query = """
+        schema_filter, params = self._schema_filter("owner")
+        query = f"""
             SELECT owner AS schema_name, object_name AS function_name
             FROM all_procedures
             WHERE object_type = 'FUNCTION'
             AND owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
                              'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
                              'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
             ORDER BY owner, object_name
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         return [
             Function(
                 schema_name=row["schema_name"],
@@ -637,13 +722,15 @@ class FunctionExtractor(BaseExtractor):
                 language="PL/SQL",
             )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
-    def _get_parameters(self, schema_name: str, func_name: str) -> list[Parameter]:
-        """Get parameters for a function."""
-        query = """
+    def _get_parameters(self) -> dict[tuple[str, str], list[Parameter]]:
+        """Get parameters for all functions."""
+        schema_filter, params = self._schema_filter("owner")
+        query = f"""
             SELECT
+                owner AS schema_name,
+                object_name AS function_name,
                 argument_name,
                 data_type,
                 data_length AS max_length,
@@ -652,14 +739,18 @@ class FunctionExtractor(BaseExtractor):
                 in_out IN ('OUT', 'IN/OUT') AS is_output,
                 position AS ordinal_position
             FROM all_arguments
-            WHERE owner = :1 AND object_name = :2
+            WHERE package_name IS NULL
             AND argument_name IS NOT NULL
             AND in_out != 'OUT'
-            ORDER BY position
+            AND owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
+                             'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
+                             'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
+            ORDER BY owner, object_name, position
         """
-        rows = self.connection.execute_dict(query, (schema_name, func_name))
-        return [
-            Parameter(
+        parameters: dict[tuple[str, str], list[Parameter]] = defaultdict(list)
+        for row in self.connection.iter_dict(query, params):
+            parameters[(row["schema_name"], row["function_name"])].append(Parameter(
                 name=row["argument_name"],
                 data_type=row["data_type"],
                 max_length=row["max_length"],
@@ -667,30 +758,28 @@ class FunctionExtractor(BaseExtractor):
                 scale=row["scale"],
                 is_output=bool(row["is_output"]),
                 ordinal_position=row["ordinal_position"],
-            )
-            for row in rows
-        ]
-
-    def _get_definition(self, schema_name: str, func_name: str) -> Optional[str]:
-        """Get function definition."""
-        query = """
-            SELECT LISTAGG(text, '') WITHIN GROUP (ORDER BY line) AS definition
-            FROM all_source
-            WHERE owner = :1 AND name = :2 AND type = 'FUNCTION'
-        """
-        return self.connection.execute_scalar(query, (schema_name, func_name))
+            ))
+        return parameters
 
-    def _get_return_type(self, schema_name: str, func_name: str) -> Optional[str]:
-        """Get function return type."""
-        query = """
-            SELECT data_type
+    def _get_return_types(self) -> dict[tuple[str, str], str]:
+        """Get the return type of every function."""
+        schema_filter, params = self._schema_filter("owner")
+        query = f"""
+            SELECT owner, object_name, data_type
             FROM all_arguments
-            WHERE owner = :1 AND object_name = :2 AND position = 0
+            WHERE package_name IS NULL AND position = 0
+            AND owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
+                             'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
+                             'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
         """
-        return self.connection.execute_scalar(query, (schema_name, func_name))
+        return {
+            (owner, name): data_type
+            for owner, name, data_type in self.connection.execute_iter(query, params)
+        }
 
 
-class TriggerExtractor(BaseExtractor):
+class TriggerExtractor(OracleBaseExtractor):
     """Extracts trigger metadata from Oracle."""
 
     def extract(self) -> list[Trigger]:
@@ -701,7 +790,8 @@ class TriggerExtractor(BaseExtractor):
 
     def _get_triggers(self) -> list[Trigger]:
         """Get list of all triggers."""
-        query = """
+        schema_filter, params = self._schema_filter("owner")
+        query = f"""
             SELECT
                 owner AS schema_name,
                 trigger_name,
@@ -715,14 +805,13 @@ class TriggerExtractor(BaseExtractor):
             WHERE owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
                                'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
                                'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
             ORDER BY owner, trigger_name
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         triggers = []
 
         for row in rows:
-            if not self._should_include_schema(row["schema_name"]):
-                continue
             # Parse trigger type
             trigger_type = row["trigger_type"]
             if "BEFORE" in trigger_type.upper():
@@ -752,7 +841,7 @@ class TriggerExtractor(BaseExtractor):
         return triggers
 
 
-class TypeExtractor(BaseExtractor):
+class TypeExtractor(OracleBaseExtractor):
     """Extracts user-defined type metadata from Oracle."""
 
     def extract(self) -> list[UserDefinedType]:
@@ -768,7 +857,8 @@ class TypeExtractor(BaseExtractor):
 
     def _get_types(self) -> list[UserDefinedType]:
         """Get list of all user-defined types."""
-        query = """
+        schema_filter, params = self._schema_filter("owner")
+        query = f"""
             SELECT
                 owner AS schema_name,
                 type_name,
@@ -777,9 +867,10 @@ class TypeExtractor(BaseExtractor):
             WHERE owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
                                'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
                                'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
             ORDER BY owner, type_name
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         return [
             UserDefinedType(
                 schema_name=row["schema_name"],
@@ -787,7 +878,6 @@ class TypeExtractor(BaseExtractor):
                 type_category=row["type_category"],
             )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
     def _get_object_attributes(self, schema_name: str, type_name: str) -> list[TypeColumn]:
@@ -818,7 +908,7 @@ class TypeExtractor(BaseExtractor):
         ]
 
 
-class SequenceExtractor(BaseExtractor):
+class SequenceExtractor(OracleBaseExtractor):
     """Extracts sequence metadata from Oracle."""
 
     def extract(self) -> list[Sequence]:
@@ -829,7 +919,8 @@ class SequenceExtractor(BaseExtractor):
 
     def _get_sequences(self) -> list[Sequence]:
         """Get list of all sequences."""
-        query = """
+        schema_filter, params = self._schema_filter("sequence_owner")
+        query = f"""
             SELECT
                 sequence_owner AS schema_name,
                 sequence_name,
@@ -843,9 +934,10 @@ class SequenceExtractor(BaseExtractor):
             WHERE sequence_owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
                                         'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
                                         'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS')
+            {schema_filter}
             ORDER BY sequence_owner, sequence_name
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         return [
             Sequence(
                 schema_name=row["schema_name"],
@@ -860,11 +952,10 @@ class SequenceExtractor(BaseExtractor):
                 current_value=row["current_value"],
             )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
 
-class SynonymExtractor(BaseExtractor):
+class SynonymExtractor(OracleBaseExtractor):
     """Extracts synonym metadata from Oracle."""
 
     def extract(self) -> list[Synonym]:
@@ -875,7 +966,8 @@ class SynonymExtractor(BaseExtractor):
 
     def _get_synonyms(self) -> list[Synonym]:
         """Get list of all synonyms."""
-        query = """
+        schema_filter, params = self._schema_filter("owner")
+        query = f"""
             SELECT
                 owner AS schema_name,
                 synonym_name,
@@ -886,9 +978,10 @@ class SynonymExtractor(BaseExtractor):
             WHERE owner NOT IN ('SYS', 'SYSTEM', 'OUTLN', 'DIP', 'ORACLE_OCM',
                                'DBSNMP', 'APPQOSSYS', 'WMSYS', 'EXFSYS', 'CTXSYS',
                                'XDB', 'ORDDATA', 'ORDSYS', 'MDSYS', 'OLAPSYS', 'PUBLIC')
+            {schema_filter}
             ORDER BY owner, synonym_name
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         return [
             Synonym(
                 schema_name=row["schema_name"],
@@ -899,5 +992,4 @@ class SynonymExtractor(BaseExtractor):
                 target_database=row["target_database"],
             )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
@@ -1,5 +1,8 @@
 """PostgreSQL backend."""
 
+from types import MappingProxyType
+from typing import Mapping, Optional
+
 from .connection import PostgreSQLConnection
 from .extractors import (
     FunctionExtractor,
@@ -13,19 +16,22 @@ from .extractors import (
 )
 
 
-def get_extractors() -> dict:
+_EXTRACTORS: Mapping[str, Optional[type]] = MappingProxyType({
+    "tables": TableExtractor,
+    "views": ViewExtractor,
+    "procedures": ProcedureExtractor,
+    "functions": FunctionExtractor,
+    "triggers": TriggerExtractor,
+    "types": TypeExtractor,
+    "sequences": SequenceExtractor,
+    "synonyms": None,  # PostgreSQL doesn't have synonyms
+    "security": SecurityExtractor,
+})
+
+
+def get_extractors() -> Mapping[str, Optional[type]]:
     """Get all extractors for PostgreSQL."""
-    return {
-        "tables": TableExtractor,
-        "views": ViewExtractor,
-        "procedures": ProcedureExtractor,
-        "functions": FunctionExtractor,
-        "triggers": TriggerExtractor,
-        "types": TypeExtractor,
-        "sequences": SequenceExtractor,
-        "synonyms": None,  # PostgreSQL doesn't have synonyms
-        "security": SecurityExtractor,
-    }
+    return _EXTRACTORS
 
 
 __all__ = [
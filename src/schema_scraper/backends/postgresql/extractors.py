@@ -1,7 +1,8 @@
 """PostgreSQL schema extractors."""
 
 import logging
-from typing import Any, Optional
+from collections import defaultdict
+from typing import Optional
 
 from ...base import BaseExtractor
 from ...base.models import (
@@ -33,7 +34,11 @@ from ...base.models import (
 logger = logging.getLogger(__name__)
 
 
-class TableExtractor(BaseExtractor):
+class PostgreSQLBaseExtractor(BaseExtractor):
+    """Base extractor with PostgreSQL-specific helpers."""
+
+
+class TableExtractor(PostgreSQLBaseExtractor):
     """Extracts table metadata from PostgreSQL."""
 
     def extract(self) -> list[Table]:
@@ -41,43 +46,89 @@ class TableExtractor(BaseExtractor):
         tables = self._get_tables()
         logger.info(f"Found {len(tables)} tables")
 
+        # Each helper fetches its metadata for every table in one query,
+        # keyed by (schema_name, table_name); they are independent of each other
+        results = self._run_parallel({
+            "columns": self._get_columns,
+            "primary_keys": self._get_primary_keys,
+            "foreign_keys": self._get_foreign_keys,
+            "indexes": self._get_indexes,
+            "check_constraints": self._get_check_constraints,
+            "unique_constraints": self._get_unique_constraints,
+            "triggers": self._get_table_triggers,
+            "partitioned": self._get_partitioned_tables,
+        })
+        columns = results["columns"]
+        primary_keys = results["primary_keys"]
+        foreign_keys = results["foreign_keys"]
+        indexes = results["indexes"]
+        check_constraints = results["check_constraints"]
+        unique_constraints = results["unique_constraints"]
+        triggers = results["triggers"]
+        partitioned = results["partitioned"]
+        referenced_by = self._build_references(foreign_keys)
+
         for table in tables:
-            table.columns = self._get_columns(table.schema_name, table.name)
-            table.primary_key = self._get_primary_key(table.schema_name, table.name)
-            table.foreign_keys = self._get_foreign_keys(table.schema_name, table.name)
-            table.indexes = self._get_indexes(table.schema_name, table.name)
-            table.check_constraints = self._get_check_constraints(table.schema_name, table.name)
-            table.unique_constraints = self._get_unique_constraints(table.schema_name, table.name)
-            table.triggers = self._get_table_triggers(table.schema_name, table.name)
-            table.partitioning = self._get_partitioning(table.schema_name, table.name)
-            table.description = self._get_description(table.schema_name, table.name)
-            stats = self._get_table_stats(table.schema_name, table.name)
-            table.row_count = stats.get("row_count", 0)
-            table.total_space_kb = stats.get("total_space_kb", 0)
-
-        self._build_references(tables)
+            key = (table.schema_name, table.name)
+            table.columns = columns.get(key, [])
+            table.primary_key = primary_keys.get(key)
+            table.foreign_keys = foreign_keys.get(key, [])
+            table.referenced_by = referenced_by.get(key, [])
+            table.indexes = indexes.get(key, [])
+            table.check_constraints = check_constraints.get(key, [])
+            table.unique_constraints = unique_constraints.get(key, [])
+            table.triggers = triggers.get(key, [])
+            # Partition details are only queried for tables that have partitions
+            if key in partitioned:
+                table.partitioning = self._get_partitioning(table.schema_name, table.name)
+            else:
+                table.partitioning = TablePartitioning(is_partitioned=False)
+
         return tables
 
     def _get_tables(self) -> list[Table]:
-        """Get list of all tables."""
-        query = """
-            SELECT table_schema, table_name
-            FROM information_schema.tables
-            WHERE table_type = 'BASE TABLE'
-            AND table_schema NOT IN ('pg_catalog', 'information_schema')
-            ORDER BY table_schema, table_name
+        """Get all tables with their descriptions and, unless disabled, statistics."""
+        schema_filter, params = self._schema_filter("t.table_schema")
+        if self.config.include_stats:
+            stats = (
+                "COALESCE(c.reltuples::bigint, 0) AS row_count, "
+                "COALESCE(pg_total_relation_size(c.oid) / 1024, 0) AS total_space_kb"
+            )
+        else:
+            stats = "NULL AS row_count, NULL AS total_space_kb"
+        query = f"""
+            SELECT
+                t.table_schema,
+                t.table_name,
+                {stats},
+                obj_description(c.oid, 'pg_class') AS description
+            FROM information_schema.tables t
+            JOIN pg_namespace n ON n.nspname = t.table_schema
+            JOIN pg_class c ON c.relnamespace = n.oid AND c.relname = t.table_name
+            WHERE t.table_type = 'BASE TABLE'
+            AND t.table_schema NOT IN ('pg_catalog', 'information_schema')
+            {schema_filter}
+            ORDER BY t.table_schema, t.table_name
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         return [
-            Table(schema_name=row["table_schema"], name=row["table_name"])
+            Table(
+                schema_name=row["table_schema"],
+                name=row["table_name"],
+                row_count=row["row_count"] or 0,
+                total_space_kb=row["total_space_kb"] or 0,
+                description=row["description"],
+            )
             for row in rows
-            if self._should_include_schema(row["table_schema"])
         ]
 
-    def _get_columns(self, schema_name: str, table_name: str) -> list[Column]:
-        """Get columns for a table."""
-        query = """
+    def _get_columns(self) -> dict[tuple[str, str], list[Column]]:
+        """Get columns for all tables."""
+        schema_filter, params = self._schema_filter("c.table_schema")
+        query = f"""
             SELECT
+                c.table_schema,
+                c.table_name,
                 c.column_name,
                 c.data_type,
                 c.character_maximum_length AS max_length,
@@ -86,60 +137,79 @@ class TableExtractor(BaseExtractor):
                 c.is_nullable = 'YES' AS is_nullable,
                 c.column_default AS default_value,
                 c.is_identity = 'YES' AS is_identity,
-                c.identity_generation,
                 c.ordinal_position,
                 c.collation_name,
                 pgd.description
             FROM information_schema.columns c
+            JOIN information_schema.tables t
+                ON c.table_schema = t.table_schema AND c.table_name = t.table_name
             LEFT JOIN pg_catalog.pg_statio_all_tables st
                 ON c.table_schema = st.schemaname AND c.table_name = st.relname
             LEFT JOIN pg_catalog.pg_description pgd
                 ON pgd.objoid = st.relid AND pgd.objsubid = c.ordinal_position
-            WHERE c.table_schema = %s AND c.table_name = %s
-            ORDER BY c.ordinal_position
+            WHERE t.table_type = 'BASE TABLE'
+            AND c.table_schema NOT IN ('pg_catalog', 'information_schema')
+            {schema_filter}
+            ORDER BY c.table_schema, c.table_name, c.ordinal_position
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        return [
-            Column(
-                name=row["column_name"],
-                data_type=row["data_type"],
-                max_length=row["max_length"],
-                precision=row["precision"],
-                scale=row["scale"],
-                is_nullable=row["is_nullable"],
-                default_value=row["default_value"],
-                is_identity=row["is_identity"],
-                collation=row["collation_name"],
-                ordinal_position=row["ordinal_position"],
-                description=row["description"],
+        columns: dict[tuple[str, str], list[Column]] = defaultdict(list)
+        # Streamed plain tuple rows in fetch_batch_size batches: this is the
+        # largest result set, so skip per-row dicts
+        for (
+            schema_name, table_name, column_name, data_type, max_length, precision, scale,
+            is_nullable, default_value, is_identity, ordinal_position, collation_name, description,
+        ) in self.connection.execute_iter(query, params):
+            columns[(schema_name, table_name)].append(
+                Column(
+                    name=column_name,
+                    data_type=data_type,
+                    max_length=max_length,
+                    precision=precision,
+                    scale=scale,
+                    is_nullable=is_nullable,
+                    default_value=default_value,
+                    is_identity=is_identity,
+                    collation=collation_name,
+                    ordinal_position=ordinal_position,
+                    description=description,
+                )
             )
-            for row in rows
-        ]
+        return columns
 
-    def _get_primary_key(self, schema_name: str, table_name: str) -> Optional[PrimaryKey]:
-        """Get primary key for a table."""
-        query = """
+    def _get_primary_keys(self) -> dict[tuple[str, str], PrimaryKey]:
+        """Get primary keys for all tables."""
+        schema_filter, params = self._schema_filter("tc.table_schema")
+        query = f"""
             SELECT
+                tc.table_schema,
+                tc.table_name,
                 tc.constraint_name,
                 array_agg(kcu.column_name ORDER BY kcu.ordinal_position) AS columns
             FROM information_schema.table_constraints tc
             JOIN information_schema.key_column_usage kcu
                 ON tc.constraint_name = kcu.constraint_name
                 AND tc.table_schema = kcu.table_schema
+                AND tc.table_name = kcu.table_name
             WHERE tc.constraint_type = 'PRIMARY KEY'
-            AND tc.table_schema = %s AND tc.table_name = %s
-            GROUP BY tc.constraint_name
+            AND tc.table_schema NOT IN ('pg_catalog', 'information_schema')
+            {schema_filter}
+            GROUP BY tc.table_schema, tc.table_name, tc.constraint_name
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        if not rows:
-            return None
-        row = rows[0]
-        return PrimaryKey(name=row["constraint_name"], columns=row["columns"], is_clustered=False)
-
-    def _get_foreign_keys(self, schema_name: str, table_name: str) -> list[ForeignKey]:
-        """Get foreign keys for a table."""
-        query = """
+        rows = self.connection.execute_dict(query, params)
+        return {
+            (row["table_schema"], row["table_name"]): PrimaryKey(
+                name=row["constraint_name"], columns=row["columns"], is_clustered=False
+            )
+            for row in rows
+        }
+
+    def _get_foreign_keys(self) -> dict[tuple[str, str], list[ForeignKey]]:
+        """Get foreign keys for all tables."""
+        schema_filter, params = self._schema_filter("tc.table_schema")
+        query = f"""
             SELECT
+                tc.table_schema,
+                tc.table_name,
                 tc.constraint_name,
                 array_agg(kcu.column_name ORDER BY kcu.ordinal_position) AS columns,
                 ccu.table_schema AS referenced_schema,
@@ -149,33 +219,41 @@ class TableExtractor(BaseExtractor):
                 rc.update_rule AS on_update
             FROM information_schema.table_constraints tc
             JOIN information_schema.key_column_usage kcu
-                ON tc.constraint_name = kcu.constraint_name AND tc.table_schema = kcu.table_schema
+                ON tc.constraint_name = kcu.constraint_name
+                AND tc.table_schema = kcu.table_schema
+                AND tc.table_name = kcu.table_name
             JOIN information_schema.constraint_column_usage ccu
                 ON tc.constraint_name = ccu.constraint_name AND tc.table_schema = ccu.table_schema
             JOIN information_schema.referential_constraints rc
                 ON tc.constraint_name = rc.constraint_name AND tc.table_schema = rc.constraint_schema
             WHERE tc.constraint_type = 'FOREIGN KEY'
-            AND tc.table_schema = %s AND tc.table_name = %s
-            GROUP BY tc.constraint_name, ccu.table_schema, ccu.table_name, rc.delete_rule, rc.update_rule
+            AND tc.table_schema NOT IN ('pg_catalog', 'information_schema')
+            {schema_filter}
+            GROUP BY tc.table_schema, tc.table_name, tc.constraint_name,
+                ccu.table_schema, ccu.table_name, rc.delete_rule, rc.update_rule
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        return [
-            ForeignKey(
-                name=row["constraint_name"],
-                columns=row["columns"],
-                referenced_schema=row["referenced_schema"],
-                referenced_table=row["referenced_table"],
-                referenced_columns=row["referenced_columns"],
-                on_delete=row["on_delete"],
-                on_update=row["on_update"],
+        foreign_keys: dict[tuple[str, str], list[ForeignKey]] = defaultdict(list)
+        for row in self.connection.execute_dict(query, params):
+            foreign_keys[(row["table_schema"], row["table_name"])].append(
+                ForeignKey(
+                    name=row["constraint_name"],
+                    columns=row["columns"],
+                    referenced_schema=row["referenced_schema"],
+                    referenced_table=row["referenced_table"],
+                    referenced_columns=row["referenced_columns"],
+                    on_delete=row["on_delete"],
+                    on_update=row["on_update"],
+                )
             )
-            for row in rows
-        ]
+        return foreign_keys
 
-    def _get_indexes(self, schema_name: str, table_name: str) -> list[Index]:
-        """Get indexes for a table."""
-        query = """
+    def _get_indexes(self) -> dict[tuple[str, str], list[Index]]:
+        """Get indexes for all tables."""
+        schema_filter, params = self._schema_filter("n.nspname")
+        query = f"""
             SELECT
+                n.nspname AS table_schema,
+                t.relname AS table_name,
                 i.relname AS index_name,
                 ix.indisunique AS is_unique,
                 ix.indisprimary AS is_primary_key,
@@ -188,60 +266,84 @@ class TableExtractor(BaseExtractor):
             JOIN pg_namespace n ON n.oid = t.relnamespace
             JOIN pg_am am ON am.oid = i.relam
             JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ANY(ix.indkey)
-            WHERE n.nspname = %s AND t.relname = %s
-            GROUP BY i.relname, ix.indisunique, ix.indisprimary, am.amname, ix.indpred, ix.indrelid
-            ORDER BY i.relname
+            WHERE t.relkind IN ('r', 'p')
+            AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+            {schema_filter}
+            GROUP BY n.nspname, t.relname, i.relname, ix.indisunique, ix.indisprimary,
+                am.amname, ix.indpred, ix.indrelid
+            ORDER BY n.nspname, t.relname, i.relname
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        return [
-            Index(
-                name=row["index_name"],
-                columns=row["columns"],
-                is_unique=row["is_unique"],
-                is_primary_key=row["is_primary_key"],
-                index_type=row["index_type"].upper(),
-                filter_definition=row["filter_definition"],
+        indexes: dict[tuple[str, str], list[Index]] = defaultdict(list)
+        for row in self.connection.execute_dict(query, params):
+            indexes[(row["table_schema"], row["table_name"])].append(
+                Index(
+                    name=row["index_name"],
+                    columns=row["columns"],
+                    is_unique=row["is_unique"],
+                    is_primary_key=row["is_primary_key"],
+                    index_type=row["index_type"].upper(),
+                    filter_definition=row["filter_definition"],
+                )
             )
-            for row in rows
-        ]
+        return indexes
 
-    def _get_check_constraints(self, schema_name: str, table_name: str) -> list[CheckConstraint]:
-        """Get check constraints for a table."""
-        query = """
+    def _get_check_constraints(self) -> dict[tuple[str, str], list[CheckConstraint]]:
+        """Get check constraints for all tables."""
+        schema_filter, params = self._schema_filter("tc.table_schema")
+        query = f"""
             SELECT
+                tc.table_schema,
+                tc.table_name,
                 tc.constraint_name,
                 cc.check_clause AS definition
             FROM information_schema.table_constraints tc
             JOIN information_schema.check_constraints cc
                 ON tc.constraint_name = cc.constraint_name AND tc.constraint_schema = cc.constraint_schema
             WHERE tc.constraint_type = 'CHECK'
-            AND tc.table_schema = %s AND tc.table_name = %s
+            AND tc.table_schema NOT IN ('pg_catalog', 'information_schema')
+            {schema_filter}
             AND tc.constraint_name NOT LIKE '%%_not_null'
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        return [CheckConstraint(name=row["constraint_name"], definition=row["definition"]) for row in rows]
+        check_constraints: dict[tuple[str, str], list[CheckConstraint]] = defaultdict(list)
+        for row in self.connection.execute_dict(query, params):
+            check_constraints[(row["table_schema"], row["table_name"])].append(
+                CheckConstraint(name=row["constraint_name"], definition=row["definition"])
+            )
+        return check_constraints
 
-    def _get_unique_constraints(self, schema_name: str, table_name: str) -> list[UniqueConstraint]:
-        """Get unique constraints for a table."""
-        query = """
+    def _get_unique_constraints(self) -> dict[tuple[str, str], list[UniqueConstraint]]:
+        """Get unique constraints for all tables."""
+        schema_filter, params = self._schema_filter("tc.table_schema")
+        query = f"""
             SELECT
+                tc.table_schema,
+                tc.table_name,
                 tc.constraint_name,
                 array_agg(kcu.column_name ORDER BY kcu.ordinal_position) AS columns
             FROM information_schema.table_constraints tc
             JOIN information_schema.key_column_usage kcu
                 ON tc.constraint_name = kcu.constraint_name
                 AND tc.table_schema = kcu.table_schema
+                AND tc.table_name = kcu.table_name
             WHERE tc.constraint_type = 'UNIQUE'
-            AND tc.table_schema = %s AND tc.table_name = %s
-            GROUP BY tc.constraint_name
+            AND tc.table_schema NOT IN ('pg_catalog', 'information_schema')
+            {schema_filter}
+            GROUP BY tc.table_schema, tc.table_name, tc.constraint_name
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        return [UniqueConstraint(name=row["constraint_name"], columns=row["columns"]) for row in rows]
+        unique_constraints: dict[tuple[str, str], list[UniqueConstraint]] = defaultdict(list)
+        for row in self.connection.execute_dict(query, params):
+            unique_constraints[(row["table_schema"], row["table_name"])].append(
+                UniqueConstraint(name=row["constraint_name"], columns=row["columns"])
+            )
+        return unique_constraints
 
-    def _get_table_triggers(self, schema_name: str, table_name: str) -> list[Trigger]:
-        """Get triggers for a table."""
-        query = """
+    def _get_table_triggers(self) -> dict[tuple[str, str], list[Trigger]]:
+        """Get triggers for all tables."""
+        schema_filter, params = self._schema_filter("n.nspname")
+        query = f"""
             SELECT
+                n.nspname AS table_schema,
+                c.relname AS table_name,
                 t.tgname AS trigger_name,
                 CASE
                     WHEN t.tgtype & 2 = 2 THEN 'BEFORE'
@@ -257,12 +359,12 @@ class TableExtractor(BaseExtractor):
             JOIN pg_class c ON t.tgrelid = c.oid
             JOIN pg_namespace n ON c.relnamespace = n.oid
             WHERE NOT t.tgisinternal
-            AND n.nspname = %s AND c.relname = %s
+            AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+            {schema_filter}
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        triggers = []
+        triggers: dict[tuple[str, str], list[Trigger]] = defaultdict(list)
 
-        for row in rows:
+        for row in self.connection.execute_dict(query, params):
             events = []
             if row["is_insert"]:
                 events.append("INSERT")
@@ -271,12 +373,12 @@ class TableExtractor(BaseExtractor):
             if row["is_delete"]:
                 events.append("DELETE")
 
-            triggers.append(
+            triggers[(row["table_schema"], row["table_name"])].append(
                 Trigger(
-                    schema_name=schema_name,
+                    schema_name=row["table_schema"],
                     name=row["trigger_name"],
-                    parent_table_schema=schema_name,
-                    parent_table_name=table_name,
+                    parent_table_schema=row["table_schema"],
+                    parent_table_name=row["table_name"],
                     trigger_type=row["trigger_type"],
                     events=events,
                     definition=row["definition"],
@@ -285,57 +387,173 @@ class TableExtractor(BaseExtractor):
             )
         return triggers
 
-    def _get_description(self, schema_name: str, table_name: str) -> Optional[str]:
-        """Get table description from pg_description."""
-        query = """
-            SELECT obj_description(c.oid) AS description
+    def _get_partitioned_tables(self) -> set[tuple[str, str]]:
+        """Get tables that are partitioned or have inheritance children."""
+        schema_filter, params = self._schema_filter("n.nspname")
+        query = f"""
+            SELECT n.nspname AS table_schema, c.relname AS table_name
             FROM pg_class c
-            JOIN pg_namespace n ON n.oid = c.relnamespace
-            WHERE n.nspname = %s AND c.relname = %s
+            JOIN pg_namespace n ON c.relnamespace = n.oid
+            WHERE (
+                c.relkind = 'p'
+                OR EXISTS (
+                    SELECT 1
+                    FROM pg_inherits i
+                    JOIN pg_class pc ON pc.oid = i.inhrelid
+                    WHERE i.inhparent = c.oid AND pc.relkind = 'r'
+                )
+            )
+            AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+            {schema_filter}
         """
-        return self.connection.execute_scalar(query, (schema_name, table_name))
+        rows = self.connection.execute_dict(query, params)
+        return {(row["table_schema"], row["table_name"]) for row in rows}
 
-    def _get_table_stats(self, schema_name: str, table_name: str) -> dict[str, Any]:
-        """Get row count and space statistics."""
-        query = """
+    def _get_partitioning(self, schema_name: str, table_name: str) -> Optional[TablePartitioning]:
+        """Get partitioning information for a table."""
+        # Check if table is partitioned (PostgreSQL 10+ declarative partitioning)
+        partition_query = """
             SELECT
-                COALESCE(c.reltuples::bigint, 0) AS row_count,
-                COALESCE(pg_total_relation_size(c.oid) / 1024, 0) AS total_space_kb
+                CASE
+                    WHEN pt.partstrat = 'r' THEN 'RANGE'
+                    WHEN pt.partstrat = 'l' THEN 'LIST'
+                    WHEN pt.partstrat = 'h' THEN 'HASH'
+                    ELSE 'UNKNOWN'
+                END AS partition_type,
+                pg_get_partkeydef(pt.oid) AS partition_key
             FROM pg_class c
-            JOIN pg_namespace n ON n.oid = c.relnamespace
-            WHERE n.nspname = %s AND c.relname = %s
+            JOIN pg_namespace n ON c.relnamespace = n.oid
+            LEFT JOIN pg_partitioned_table pt ON c.oid = pt.partrelid
+            WHERE n.nspname = %s AND c.relname = %s AND c.relkind = 'p'
         """
-        rows = self.connection.execute_dict(query, (schema_name, table_name))
-        if rows:
-            return {"row_count": rows[0]["row_count"], "total_space_kb": rows[0]["total_space_kb"]}
-        return {"row_count": 0, "total_space_kb": 0}
 
-    def _build_references(self, tables: list[Table]) -> None:
-        """Build the referenced_by list for each table."""
-        query = """
-            SELECT
-                tc.table_schema AS parent_schema,
-                tc.table_name AS parent_table,
-                tc.constraint_name AS fk_name,
-                ccu.table_schema AS referenced_schema,
-                ccu.table_name AS referenced_table
-            FROM information_schema.table_constraints tc
-            JOIN information_schema.constraint_column_usage ccu
-                ON tc.constraint_name = ccu.constraint_name
-            WHERE tc.constraint_type = 'FOREIGN KEY'
+        partition_rows = self.connection.execute_dict(partition_query, (schema_name, table_name))
+        if partition_rows:
+            row = partition_rows[0]
+
+            # Get partition information
+            partitions_query = """
+                SELECT
+                    c.relname AS partition_name,
+                    pg_get_expr(pt.partattrs, pt.partrelid) AS partition_expression,
+                    obj_description(c.oid) AS description
+                FROM pg_class pc
+                JOIN pg_namespace pn ON pc.relnamespace = pn.oid
+                JOIN pg_inherits i ON pc.oid = i.inhrelid
+                JOIN pg_class c ON i.inhparent = c.oid
+                JOIN pg_namespace n ON c.relnamespace = n.oid
+                LEFT JOIN pg_partitioned_table pt ON c.oid = pt.partrelid
+                WHERE n.nspname = %s AND c.relname = %s AND pc.relkind = 'r'
+                ORDER BY pc.relname
+            """
+
+            partitions_rows = self.connection.execute_dict(partitions_query, (schema_name, table_name))
+
+            partitions = []
+            for i, part_row in enumerate(partitions_rows, 1):
+                # Get row count for each partition
+                count_query = f"SELECT COUNT(*) FROM \"{schema_name}\".\"{part_row['partition_name']}\""
+                try:
+                    row_count = self.connection.execute_scalar(count_query) or 0
+                except Exception:
+                    row_count = 0
+
+                partitions.append(Partition(
+                    partition_number=i,
+                    boundary_value=part_row["partition_expression"],
+                    row_count=row_count,
+                ))
+
+            # Extract partition column from key definition
+            partition_column = ""
+            if row["partition_key"]:
+                # Simple regex to extract column name from partition key
+                import re
+                match = re.search(r'(\w+)', row["partition_key"])
+                if match:
+                    partition_column = match.group(1)
+
+            partition_scheme = PartitionScheme(
+                name=f"{table_name}_partitioning",
+                partition_column=partition_column,
+                partition_type=row["partition_type"],
+                partitions=partitions,
+            )
+
+            return TablePartitioning(
+                partition_scheme=partition_scheme,
+                is_partitioned=True,
+            )
+
+        # Check for inheritance-based partitioning (older PostgreSQL)
+        inheritance_query = """
+            SELECT COUNT(*) as child_count
+            FROM pg_class pc
+            JOIN pg_namespace pn ON pc.relnamespace = pn.oid
+            JOIN pg_inherits i ON pc.oid = i.inhrelid
+            JOIN pg_class c ON i.inhparent = c.oid
+            JOIN pg_namespace n ON c.relnamespace = n.oid
+            WHERE n.nspname = %s AND c.relname = %s AND pc.relkind = 'r'
         """
-        rows = self.connection.execute_dict(query)
-        table_map = {(t.schema_name, t.name): t for t in tables}
 
-        for row in rows:
-            ref_key = (row["referenced_schema"], row["referenced_table"])
-            if ref_key in table_map:
-                table_map[ref_key].referenced_by.append(
-                    (row["parent_schema"], row["parent_table"], row["fk_name"])
+        inheritance_rows = self.connection.execute_dict(inheritance_query, (schema_name, table_name))
+        if inheritance_rows and inheritance_rows[0]["child_count"] > 0:
+            # Get child tables (partitions)
+            child_query = """
+                SELECT pc.relname AS partition_name, obj_description(pc.oid) AS description
+                FROM pg_class pc
+                JOIN pg_namespace pn ON pc.relnamespace = pn.oid
+                JOIN pg_inherits i ON pc.oid = i.inhrelid
+                JOIN pg_class c ON i.inhparent = c.oid
+                JOIN pg_namespace n ON c.relnamespace = n.oid
+                WHERE n.nspname = %s AND c.relname = %s AND pc.relkind = 'r'
+                ORDER BY pc.relname
+            """
+
+            child_rows = self.connection.execute_dict(child_query, (schema_name, table_name))
+
+            partitions = []
+            for i, child_row in enumerate(child_rows, 1):
+                # Get row count for each child table
+                count_query = f"SELECT COUNT(*) FROM \"{schema_name}\".\"{child_row['partition_name']}\""
+                try:
+                    row_count = self.connection.execute_scalar(count_query) or 0
+                except Exception:
+                    row_count = 0
+
+                partitions.append(Partition(
+                    partition_number=i,
+                    boundary_value=f"CHECK constraint on {child_row['partition_name']}",
+                    row_count=row_count,
+                ))
+
+            partition_scheme = PartitionScheme(
+                name=f"{table_name}_inheritance",
+                partition_type="INHERITANCE",
+                partitions=partitions,
+            )
+
+            return TablePartitioning(
+                partition_scheme=partition_scheme,
+                is_partitioned=True,
+            )
+
+        return TablePartitioning(is_partitioned=False)
+
+    def _build_references(
+        self, foreign_keys: dict[tuple[str, str], list[ForeignKey]]
+    ) -> dict[tuple[str, str], list[tuple[str, str, str]]]:
+        """Invert foreign keys into (schema, table, fk_name) entries per referenced table."""
+        referenced_by: dict[tuple[str, str], list[tuple[str, str, str]]] = defaultdict(list)
+        for (schema_name, table_name), table_fks in foreign_keys.items():
+            for fk in table_fks:
+                referenced_by[(fk.referenced_schema, fk.referenced_table)].append(
+                    (schema_name, table_name, fk.name)
                 )
+        return referenced_by
 
 
-class ViewExtractor(BaseExtractor):
+class ViewExtractor(PostgreSQLBaseExtractor):
     """Extracts view metadata from PostgreSQL."""
 
     def extract(self) -> list[View]:
@@ -343,36 +561,52 @@ class ViewExtractor(BaseExtractor):
         views = self._get_views()
         logger.info(f"Found {len(views)} views")
 
-        for view in views:
-            view.columns = self._get_columns(view.schema_name, view.name)
-            view.definition = self._get_definition(view.schema_name, view.name)
-            view.description = self._get_description(view.schema_name, view.name)
-
+        self._map_parallel(self._add_details, views)
         return views
 
+    def _add_details(self, view: View) -> None:
+        """Fetch the columns of one view."""
+        view.columns = self._get_columns(view.schema_name, view.name)
+
     def _get_views(self) -> list[View]:
         """Get list of all views."""
-        query = """
+        schema_filter, params = self._schema_filter("v.schemaname")
+        query = f"""
             SELECT
-                schemaname AS schema_name,
-                viewname AS view_name,
-                FALSE AS is_materialized
-            FROM pg_views
-            WHERE schemaname NOT IN ('pg_catalog', 'information_schema')
+                v.schemaname AS schema_name,
+                v.viewname AS view_name,
+                FALSE AS is_materialized,
+                {self._definition_column("v.definition")},
+                obj_description(c.oid, 'pg_class') AS description
+            FROM pg_views v
+            JOIN pg_namespace n ON n.nspname = v.schemaname
+            JOIN pg_class c ON c.relnamespace = n.oid AND c.relname = v.viewname
+            WHERE v.schemaname NOT IN ('pg_catalog', 'information_schema')
+            {schema_filter}
             UNION ALL
             SELECT
-                schemaname AS schema_name,
-                matviewname AS view_name,
-                TRUE AS is_materialized
-            FROM pg_matviews
-            WHERE schemaname NOT IN ('pg_catalog', 'information_schema')
+                v.schemaname AS schema_name,
+                v.matviewname AS view_name,
+                TRUE AS is_materialized,
+                {self._definition_column("v.definition")},
+                obj_description(c.oid, 'pg_class') AS description
+            FROM pg_matviews v
+            JOIN pg_namespace n ON n.nspname = v.schemaname
+            JOIN pg_class c ON c.relnamespace = n.oid AND c.relname = v.matviewname
+            WHERE v.schemaname NOT IN ('pg_catalog', 'information_schema')
+            {schema_filter}
             ORDER BY schema_name, view_name
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params * 2)
         return [
-            View(schema_name=row["schema_name"], name=row["view_name"], is_materialized=row["is_materialized"])
+            View(
+                schema_name=row["schema_name"],
+                name=row["view_name"],
+                is_materialized=row["is_materialized"],
+                definition=row["definition"],
+                description=row["description"],
+            )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
     def _get_columns(self, schema_name: str, view_name: str) -> list[Column]:
@@ -404,29 +638,8 @@ class ViewExtractor(BaseExtractor):
             for row in rows
         ]
 
-    def _get_definition(self, schema_name: str, view_name: str) -> Optional[str]:
-        """Get the SQL definition of a view."""
-        # Try regular view first
-        query = "SELECT definition FROM pg_views WHERE schemaname = %s AND viewname = %s"
-        result = self.connection.execute_scalar(query, (schema_name, view_name))
-        if result:
-            return result
-        # Try materialized view
-        query = "SELECT definition FROM pg_matviews WHERE schemaname = %s AND matviewname = %s"
-        return self.connection.execute_scalar(query, (schema_name, view_name))
-
-    def _get_description(self, schema_name: str, view_name: str) -> Optional[str]:
-        """Get view description."""
-        query = """
-            SELECT obj_description(c.oid) AS description
-            FROM pg_class c
-            JOIN pg_namespace n ON n.oid = c.relnamespace
-            WHERE n.nspname = %s AND c.relname = %s
-        """
-        return self.connection.execute_scalar(query, (schema_name, view_name))
-
 
-class ProcedureExtractor(BaseExtractor):
+class ProcedureExtractor(PostgreSQLBaseExtractor):
     """Extracts stored procedure metadata from PostgreSQL."""
 
     def extract(self) -> list[Procedure]:
@@ -434,32 +647,41 @@ class ProcedureExtractor(BaseExtractor):
         procedures = self._get_procedures()
         logger.info(f"Found {len(procedures)} stored procedures")
 
-        for proc in procedures:
-            proc.parameters = self._get_parameters(proc.schema_name, proc.name)
-            proc.definition = self._get_definition(proc.schema_name, proc.name)
-            proc.description = self._get_description(proc.schema_name, proc.name)
-
+        self._map_parallel(self._add_details, procedures)
         return procedures
 
+    def _add_details(self, proc: Procedure) -> None:
+        """Fetch the parameters of one stored procedure."""
+        proc.parameters = self._get_parameters(proc.schema_name, proc.name)
+
     def _get_procedures(self) -> list[Procedure]:
         """Get list of all stored procedures (PostgreSQL 11+)."""
-        query = """
+        schema_filter, params = self._schema_filter("n.nspname")
+        query = f"""
             SELECT
                 n.nspname AS schema_name,
                 p.proname AS procedure_name,
-                l.lanname AS language
+                l.lanname AS language,
+                {self._definition_column("pg_get_functiondef(p.oid)")},
+                obj_description(p.oid, 'pg_proc') AS description
             FROM pg_proc p
             JOIN pg_namespace n ON p.pronamespace = n.oid
             JOIN pg_language l ON p.prolang = l.oid
             WHERE p.prokind = 'p'
             AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+            {schema_filter}
             ORDER BY n.nspname, p.proname
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         return [
-            Procedure(schema_name=row["schema_name"], name=row["procedure_name"], language=row["language"])
+            Procedure(
+                schema_name=row["schema_name"],
+                name=row["procedure_name"],
+                language=row["language"],
+                definition=row["definition"],
+                description=row["description"],
+            )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
     def _get_parameters(self, schema_name: str, proc_name: str) -> list[Parameter]:
@@ -480,7 +702,6 @@ class ProcedureExtractor(BaseExtractor):
             AND p.specific_name LIKE %s || '%%'
             ORDER BY p.ordinal_position
         """
-        rows = self.connection.execute_dict(query, (schema_name, proc_name))
         return [
             Parameter(
                 name=row["parameter_name"] or f"param{row['ordinal_position']}",
@@ -493,31 +714,11 @@ class ProcedureExtractor(BaseExtractor):
                 default_value=row["default_value"],
                 ordinal_position=row["ordinal_position"],
             )
-            for row in rows
+            for row in self.connection.iter_dict(query, (schema_name, proc_name))
         ]
 
-    def _get_definition(self, schema_name: str, proc_name: str) -> Optional[str]:
-        """Get procedure definition."""
-        query = """
-            SELECT pg_get_functiondef(p.oid) AS definition
-            FROM pg_proc p
-            JOIN pg_namespace n ON p.pronamespace = n.oid
-            WHERE n.nspname = %s AND p.proname = %s AND p.prokind = 'p'
-        """
-        return self.connection.execute_scalar(query, (schema_name, proc_name))
-
-    def _get_description(self, schema_name: str, proc_name: str) -> Optional[str]:
-        """Get procedure description."""
-        query = """
-            SELECT obj_description(p.oid) AS description
-            FROM pg_proc p
-            JOIN pg_namespace n ON p.pronamespace = n.oid
-            WHERE n.nspname = %s AND p.proname = %s AND p.prokind = 'p'
-        """
-        return self.connection.execute_scalar(query, (schema_name, proc_name))
-
 
-class FunctionExtractor(BaseExtractor):
+class FunctionExtractor(PostgreSQLBaseExtractor):
     """Extracts function metadata from PostgreSQL."""
 
     def extract(self) -> list[Function]:
@@ -525,18 +726,23 @@ class FunctionExtractor(BaseExtractor):
         functions = self._get_functions()
         logger.info(f"Found {len(functions)} functions")
 
-        for func in functions:
-            func.parameters = self._get_parameters(func.schema_name, func.name)
-            func.definition = self._get_definition(func.schema_name, func.name)
-            func.description = self._get_description(func.schema_name, func.name)
-            if func.function_type == "TABLE":
-                func.return_columns = self._get_return_columns(func.schema_name, func.name)
-
+        self._map_parallel(self._add_details, functions)
         return functions
 
+    def _add_details(self, func: Function) -> None:
+        """Fetch the parameters and return columns of one function."""
+        func.parameters = self._get_parameters(func.schema_name, func.name)
+        if func.function_type == "TABLE":
+            func.return_columns = self._get_return_columns(func.schema_name, func.name)
+
     def _get_functions(self) -> list[Function]:
         """Get list of all functions."""
-        query = """
+        schema_filter, params = self._schema_filter("n.nspname")
+        # pg_get_functiondef() rejects aggregates
+        definition = self._definition_column(
+            "CASE WHEN p.prokind = 'a' THEN NULL ELSE pg_get_functiondef(p.oid) END"
+        )
+        query = f"""
             SELECT
                 n.nspname AS schema_name,
                 p.proname AS function_name,
@@ -547,15 +753,18 @@ class FunctionExtractor(BaseExtractor):
                     ELSE 'SCALAR'
                 END AS function_type,
                 pg_get_function_result(p.oid) AS return_type,
-                l.lanname AS language
+                l.lanname AS language,
+                {definition},
+                obj_description(p.oid, 'pg_proc') AS description
             FROM pg_proc p
             JOIN pg_namespace n ON p.pronamespace = n.oid
             JOIN pg_language l ON p.prolang = l.oid
             WHERE p.prokind IN ('f', 'a', 'w')
             AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+            {schema_filter}
             ORDER BY n.nspname, p.proname
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         return [
             Function(
                 schema_name=row["schema_name"],
@@ -563,9 +772,10 @@ class FunctionExtractor(BaseExtractor):
                 function_type=row["function_type"],
                 return_type=row["return_type"],
                 language=row["language"],
+                definition=row["definition"],
+                description=row["description"],
             )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
     def _get_parameters(self, schema_name: str, func_name: str) -> list[Parameter]:
@@ -587,7 +797,6 @@ class FunctionExtractor(BaseExtractor):
             AND p.parameter_mode != 'OUT'
             ORDER BY p.ordinal_position
         """
-        rows = self.connection.execute_dict(query, (schema_name, func_name))
         return [
             Parameter(
                 name=row["parameter_name"] or f"param{row['ordinal_position']}",
@@ -600,31 +809,9 @@ class FunctionExtractor(BaseExtractor):
                 default_value=row["default_value"],
                 ordinal_position=row["ordinal_position"],
             )
-            for row in rows
+            for row in self.connection.iter_dict(query, (schema_name, func_name))
         ]
 
-    def _get_definition(self, schema_name: str, func_name: str) -> Optional[str]:
-        """Get function definition."""
-        query = """
-            SELECT pg_get_functiondef(p.oid) AS definition
-            FROM pg_proc p
-            JOIN pg_namespace n ON p.pronamespace = n.oid
-            WHERE n.nspname = %s AND p.proname = %s AND p.prokind IN ('f', 'a', 'w')
-            LIMIT 1
-        """
-        return self.connection.execute_scalar(query, (schema_name, func_name))
-
-    def _get_description(self, schema_name: str, func_name: str) -> Optional[str]:
-        """Get function description."""
-        query = """
-            SELECT obj_description(p.oid) AS description
-            FROM pg_proc p
-            JOIN pg_namespace n ON p.pronamespace = n.oid
-            WHERE n.nspname = %s AND p.proname = %s
-            LIMIT 1
-        """
-        return self.connection.execute_scalar(query, (schema_name, func_name))
-
     def _get_return_columns(self, schema_name: str, func_name: str) -> list[FunctionColumn]:
         """Get return columns for table-valued functions."""
         query = """
@@ -656,139 +843,8 @@ class FunctionExtractor(BaseExtractor):
             for row in rows
         ]
 
-    def _get_partitioning(self, schema_name: str, table_name: str) -> Optional[TablePartitioning]:
-        """Get partitioning information for a table."""
-        # Check if table is partitioned (PostgreSQL 10+ declarative partitioning)
-        partition_query = """
-            SELECT
-                CASE
-                    WHEN pt.partstrat = 'r' THEN 'RANGE'
-                    WHEN pt.partstrat = 'l' THEN 'LIST'
-                    WHEN pt.partstrat = 'h' THEN 'HASH'
-                    ELSE 'UNKNOWN'
-                END AS partition_type,
-                pg_get_partkeydef(pt.oid) AS partition_key
-            FROM pg_class c
-            JOIN pg_namespace n ON c.relnamespace = n.oid
-            LEFT JOIN pg_partitioned_table pt ON c.oid = pt.partrelid
-            WHERE n.nspname = %s AND c.relname = %s AND c.relkind = 'p'
-        """
-
-        partition_rows = self.connection.execute_dict(partition_query, (schema_name, table_name))
-        if partition_rows:
-            row = partition_rows[0]
-
-            # Get partition information
-            partitions_query = """
-                SELECT
-                    c.relname AS partition_name,
-                    pg_get_expr(pt.partattrs, pt.partrelid) AS partition_expression,
-                    obj_description(c.oid) AS description
-                FROM pg_class pc
-                JOIN pg_namespace pn ON pc.relnamespace = pn.oid
-                JOIN pg_inherits i ON pc.oid = i.inhrelid
-                JOIN pg_class c ON i.inhparent = c.oid
-                JOIN pg_namespace n ON c.relnamespace = n.oid
-                LEFT JOIN pg_partitioned_table pt ON c.oid = pt.partrelid
-                WHERE n.nspname = %s AND c.relname = %s AND pc.relkind = 'r'
-                ORDER BY pc.relname
-            """
-
-            partitions_rows = self.connection.execute_dict(partitions_query, (schema_name, table_name))
-
-            partitions = []
-            for i, part_row in enumerate(partitions_rows, 1):
-                # Get row count for each partition
-                count_query = f"SELECT COUNT(*) FROM \"{schema_name}\".\"{part_row['partition_name']}\""
-                try:
-                    row_count = self.connection.execute_scalar(count_query) or 0
-                except Exception:
-                    row_count = 0
-
-                partitions.append(Partition(
-                    partition_number=i,
-                    boundary_value=part_row["partition_expression"],
-                    row_count=row_count,
-                ))
-
-            # Extract partition column from key definition
-            partition_column = ""
-            if row["partition_key"]:
-                # Simple regex to extract column name from partition key
-                import re
-                match = re.search(r'(\w+)', row["partition_key"])
-                if match:
-                    partition_column = match.group(1)
-
-            partition_scheme = PartitionScheme(
-                name=f"{table_name}_partitioning",
-                partition_column=partition_column,
-                partition_type=row["partition_type"],
-                partitions=partitions,
-            )
-
-            return TablePartitioning(
-                partition_scheme=partition_scheme,
-                is_partitioned=True,
-            )
-
-        # Check for inheritance-based partitioning (older PostgreSQL)
-        inheritance_query = """
-            SELECT COUNT(*) as child_count
-            FROM pg_class pc
-            JOIN pg_namespace pn ON pc.relnamespace = pn.oid
-            JOIN pg_inherits i ON pc.oid = i.inhrelid
-            JOIN pg_class c ON i.inhparent = c.oid
-            JOIN pg_namespace n ON c.relnamespace = n.oid
-            WHERE n.nspname = %s AND c.relname = %s AND pc.relkind = 'r'
-        """
-
-        inheritance_rows = self.connection.execute_dict(inheritance_query, (schema_name, table_name))
-        if inheritance_rows and inheritance_rows[0]["child_count"] > 0:
-            # Get child tables (partitions)
-            child_query = """
-                SELECT pc.relname AS partition_name, obj_description(pc.oid) AS description
-                FROM pg_class pc
-                JOIN pg_namespace pn ON pc.relnamespace = pn.oid
-                JOIN pg_inherits i ON pc.oid = i.inhrelid
-                JOIN pg_class c ON i.inhparent = c.oid
-                JOIN pg_namespace n ON c.relnamespace = n.oid
-                WHERE n.nspname = %s AND c.relname = %s AND pc.relkind = 'r'
-                ORDER BY pc.relname
-            """
-
-            child_rows = self.connection.execute_dict(child_query, (schema_name, table_name))
-
-            partitions = []
-            for i, child_row in enumerate(child_rows, 1):
-                # Get row count for each child table
-                count_query = f"SELECT COUNT(*) FROM \"{schema_name}\".\"{child_row['partition_name']}\""
-                try:
-                    row_count = self.connection.execute_scalar(count_query) or 0
-                except Exception:
-                    row_count = 0
-
-                partitions.append(Partition(
-                    partition_number=i,
-                    boundary_value=f"CHECK constraint on {child_row['partition_name']}",
-                    row_count=row_count,
-                ))
-
-            partition_scheme = PartitionScheme(
-                name=f"{table_name}_inheritance",
-                partition_type="INHERITANCE",
-                partitions=partitions,
-            )
-
-            return TablePartitioning(
-                partition_scheme=partition_scheme,
-                is_partitioned=True,
-            )
-
-        return TablePartitioning(is_partitioned=False)
-
 
-class SecurityExtractor(BaseExtractor):
+class SecurityExtractor(PostgreSQLBaseExtractor):
     """Extracts security metadata from PostgreSQL."""
 
     def extract(self) -> dict:
@@ -995,7 +1051,7 @@ class SecurityExtractor(BaseExtractor):
         return mapping.get(char)
 
 
-class TriggerExtractor(BaseExtractor):
+class TriggerExtractor(PostgreSQLBaseExtractor):
     """Extracts trigger metadata from PostgreSQL."""
 
     def extract(self) -> list[Trigger]:
@@ -1006,7 +1062,8 @@ class TriggerExtractor(BaseExtractor):
 
     def _get_triggers(self) -> list[Trigger]:
         """Get list of all triggers."""
-        query = """
+        schema_filter, params = self._schema_filter("n.nspname")
+        query = f"""
             SELECT
                 n.nspname AS schema_name,
                 t.tgname AS trigger_name,
@@ -1028,14 +1085,13 @@ class TriggerExtractor(BaseExtractor):
             JOIN pg_namespace tn ON c.relnamespace = tn.oid
             WHERE NOT t.tgisinternal
             AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+            {schema_filter}
             ORDER BY n.nspname, t.tgname
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         triggers = []
 
         for row in rows:
-            if not self._should_include_schema(row["schema_name"]):
-                continue
             events = []
             if row["is_insert"]:
                 events.append("INSERT")
@@ -1058,7 +1114,7 @@ class TriggerExtractor(BaseExtractor):
         return triggers
 
 
-class TypeExtractor(BaseExtractor):
+class TypeExtractor(PostgreSQLBaseExtractor):
     """Extracts user-defined type metadata from PostgreSQL."""
 
     def extract(self) -> list[UserDefinedType]:
@@ -1076,7 +1132,8 @@ class TypeExtractor(BaseExtractor):
 
     def _get_types(self) -> list[UserDefinedType]:
         """Get list of all user-defined types."""
-        query = """
+        schema_filter, params = self._schema_filter("n.nspname")
+        query = f"""
             SELECT
                 n.nspname AS schema_name,
                 t.typname AS type_name,
@@ -1097,10 +1154,11 @@ class TypeExtractor(BaseExtractor):
             LEFT JOIN pg_constraint con ON con.contypid = t.oid
             WHERE t.typtype IN ('c', 'e', 'd', 'r')
             AND n.nspname NOT IN ('pg_catalog', 'information_schema')
+            {schema_filter}
             AND NOT EXISTS (SELECT 1 FROM pg_class c WHERE c.reltype = t.oid AND c.relkind = 'r')
             ORDER BY n.nspname, t.typname
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         return [
             UserDefinedType(
                 schema_name=row["schema_name"],
@@ -1112,7 +1170,6 @@ class TypeExtractor(BaseExtractor):
                 description=row["description"],
             )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
 
     def _get_composite_columns(self, schema_name: str, type_name: str) -> list[TypeColumn]:
@@ -1155,7 +1212,7 @@ class TypeExtractor(BaseExtractor):
         return [row["enumlabel"] for row in rows]
 
 
-class SequenceExtractor(BaseExtractor):
+class SequenceExtractor(PostgreSQLBaseExtractor):
     """Extracts sequence metadata from PostgreSQL."""
 
     def extract(self) -> list[Sequence]:
@@ -1166,7 +1223,8 @@ class SequenceExtractor(BaseExtractor):
 
     def _get_sequences(self) -> list[Sequence]:
         """Get list of all sequences."""
-        query = """
+        schema_filter, params = self._schema_filter("schemaname")
+        query = f"""
             SELECT
                 schemaname AS schema_name,
                 sequencename AS sequence_name,
@@ -1180,9 +1238,10 @@ class SequenceExtractor(BaseExtractor):
                 last_value AS current_value
             FROM pg_sequences
             WHERE schemaname NOT IN ('pg_catalog', 'information_schema')
+            {schema_filter}
             ORDER BY schemaname, sequencename
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         return [
             Sequence(
                 schema_name=row["schema_name"],
@@ -1197,5 +1256,4 @@ class SequenceExtractor(BaseExtractor):
                 current_value=row["current_value"],
             )
             for row in rows
-            if self._should_include_schema(row["schema_name"])
         ]
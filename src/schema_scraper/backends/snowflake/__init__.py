@@ -1,5 +1,8 @@
 """Snowflake backend."""
 
+from types import MappingProxyType
+from typing import Mapping, Optional
+
 from .connection import SnowflakeConnection
 from .extractors import (
     FunctionExtractor,
@@ -11,19 +14,22 @@ from .extractors import (
 )
 
 
-def get_extractors() -> dict:
+_EXTRACTORS: Mapping[str, Optional[type]] = MappingProxyType({
+    "tables": TableExtractor,
+    "views": ViewExtractor,
+    "procedures": ProcedureExtractor,
+    "functions": FunctionExtractor,
+    "triggers": None,  # Snowflake does not support triggers
+    "types": None,  # Snowflake does not support user-defined types
+    "sequences": SequenceExtractor,
+    "synonyms": None,  # Snowflake does not support synonyms
+    "security": SecurityExtractor,
+})
+
+
+def get_extractors() -> Mapping[str, Optional[type]]:
     """Get all extractors for Snowflake."""
-    return {
-        "tables": TableExtractor,
-        "views": ViewExtractor,
-        "procedures": ProcedureExtractor,
-        "functions": FunctionExtractor,
-        "triggers": None,  # Snowflake does not support triggers
-        "types": None,  # Snowflake does not support user-defined types
-        "sequences": SequenceExtractor,
-        "synonyms": None,  # Snowflake does not support synonyms
-        "security": SecurityExtractor,
-    }
+    return _EXTRACTORS
 
 
 __all__ = [
@@ -24,7 +24,11 @@ from ...base.models import (
 logger = logging.getLogger(__name__)
 
 
-class TableExtractor(BaseExtractor):
+class SnowflakeBaseExtractor(BaseExtractor):
+    """Base extractor with Snowflake-specific helpers."""
+
+
+class TableExtractor(SnowflakeBaseExtractor):
     """Extracts table metadata from Snowflake."""
 
     def extract(self) -> list[Table]:
@@ -44,7 +48,8 @@ class TableExtractor(BaseExtractor):
 
     def _get_tables(self) -> list[Table]:
         """Get all user tables."""
-        query = """
+        schema_filter, params = self._schema_filter("TABLE_SCHEMA")
+        query = f"""
             SELECT
                 TABLE_SCHEMA,
                 TABLE_NAME,
@@ -53,22 +58,20 @@ class TableExtractor(BaseExtractor):
                 COMMENT
             FROM INFORMATION_SCHEMA.TABLES
             WHERE TABLE_TYPE = 'BASE TABLE'
+            {schema_filter}
             ORDER BY TABLE_SCHEMA, TABLE_NAME
         """
-        rows = self.connection.execute_dict(query)
-        tables = []
-        for row in rows:
-            schema_name = row["TABLE_SCHEMA"]
-            if not self._should_include_schema(schema_name):
-                continue
-            tables.append(Table(
-                schema_name=schema_name,
+        rows = self.connection.execute_dict(query, params)
+        return [
+            Table(
+                schema_name=row["TABLE_SCHEMA"],
                 name=row["TABLE_NAME"],
                 row_count=row.get("ROW_COUNT") or 0,
                 total_space_kb=(row.get("BYTES") or 0) // 1024,
                 description=row.get("COMMENT"),
-            ))
-        return tables
+            )
+            for row in rows
+        ]
 
     def _get_columns(self, schema_name: str, table_name: str) -> list[Column]:
         """Get columns for a table."""
@@ -198,7 +201,7 @@ class TableExtractor(BaseExtractor):
                     )
 
 
-class ViewExtractor(BaseExtractor):
+class ViewExtractor(SnowflakeBaseExtractor):
     """Extracts view metadata from Snowflake."""
 
     def extract(self) -> list[View]:
@@ -212,28 +215,28 @@ class ViewExtractor(BaseExtractor):
 
     def _get_views(self) -> list[View]:
         """Get all views."""
-        query = """
+        schema_filter, params = self._schema_filter("TABLE_SCHEMA")
+        query = f"""
             SELECT
                 TABLE_SCHEMA,
                 TABLE_NAME,
-                VIEW_DEFINITION,
+                {self._definition_column("VIEW_DEFINITION")},
                 COMMENT
             FROM INFORMATION_SCHEMA.VIEWS
+            WHERE TABLE_SCHEMA <> 'INFORMATION_SCHEMA'
+            {schema_filter}
             ORDER BY TABLE_SCHEMA, TABLE_NAME
         """
-        rows = self.connection.execute_dict(query)
-        views = []
-        for row in rows:
-            schema_name = row["TABLE_SCHEMA"]
-            if not self._should_include_schema(schema_name):
-                continue
-            views.append(View(
-                schema_name=schema_name,
+        rows = self.connection.execute_dict(query, params)
+        return [
+            View(
+                schema_name=row["TABLE_SCHEMA"],
                 name=row["TABLE_NAME"],
-                definition=row.get("VIEW_DEFINITION"),
+                definition=row.get("DEFINITION"),
                 description=row.get("COMMENT"),
-            ))
-        return views
+            )
+            for row in rows
+        ]
 
     def _get_columns(self, schema_name: str, view_name: str) -> list[Column]:
         """Get columns for a view."""
@@ -270,31 +273,31 @@ class ViewExtractor(BaseExtractor):
         ]
 
 
-class ProcedureExtractor(BaseExtractor):
+class ProcedureExtractor(SnowflakeBaseExtractor):
     """Extracts stored procedure metadata from Snowflake."""
 
     def extract(self) -> list[Procedure]:
         """Extract all stored procedures."""
-        query = """
+        schema_filter, params = self._schema_filter("PROCEDURE_SCHEMA")
+        query = f"""
             SELECT
                 PROCEDURE_SCHEMA,
                 PROCEDURE_NAME,
-                PROCEDURE_DEFINITION,
+                {self._definition_column("PROCEDURE_DEFINITION")},
                 COMMENT,
                 ARGUMENT_SIGNATURE
             FROM INFORMATION_SCHEMA.PROCEDURES
+            WHERE PROCEDURE_SCHEMA <> 'INFORMATION_SCHEMA'
+            {schema_filter}
             ORDER BY PROCEDURE_SCHEMA, PROCEDURE_NAME
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         procedures = []
         for row in rows:
-            schema_name = row["PROCEDURE_SCHEMA"]
-            if not self._should_include_schema(schema_name):
-                continue
             proc = Procedure(
-                schema_name=schema_name,
+                schema_name=row["PROCEDURE_SCHEMA"],
                 name=row["PROCEDURE_NAME"],
-                definition=row.get("PROCEDURE_DEFINITION"),
+                definition=row.get("DEFINITION"),
                 description=row.get("COMMENT"),
                 language="SQL",
             )
@@ -333,38 +336,37 @@ class ProcedureExtractor(BaseExtractor):
         return params
 
 
-class FunctionExtractor(BaseExtractor):
+class FunctionExtractor(SnowflakeBaseExtractor):
     """Extracts user-defined function metadata from Snowflake."""
 
     def extract(self) -> list[Function]:
         """Extract all user-defined functions."""
-        query = """
+        schema_filter, params = self._schema_filter("FUNCTION_SCHEMA")
+        query = f"""
             SELECT
                 FUNCTION_SCHEMA,
                 FUNCTION_NAME,
                 DATA_TYPE,
-                FUNCTION_DEFINITION,
+                {self._definition_column("FUNCTION_DEFINITION")},
                 COMMENT,
                 ARGUMENT_SIGNATURE
             FROM INFORMATION_SCHEMA.FUNCTIONS
+            WHERE FUNCTION_SCHEMA <> 'INFORMATION_SCHEMA'
+            {schema_filter}
             ORDER BY FUNCTION_SCHEMA, FUNCTION_NAME
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         functions = []
         for row in rows:
-            schema_name = row["FUNCTION_SCHEMA"]
-            if not self._should_include_schema(schema_name):
-                continue
-
             return_type = row.get("DATA_TYPE")
             func_type = "TABLE" if return_type and "TABLE" in str(return_type).upper() else "SCALAR"
 
             func = Function(
-                schema_name=schema_name,
+                schema_name=row["FUNCTION_SCHEMA"],
                 name=row["FUNCTION_NAME"],
                 function_type=func_type,
                 return_type=return_type,
-                definition=row.get("FUNCTION_DEFINITION"),
+                definition=row.get("DEFINITION"),
                 description=row.get("COMMENT"),
                 language="SQL",
             )
@@ -402,12 +404,13 @@ class FunctionExtractor(BaseExtractor):
         return params
 
 
-class SequenceExtractor(BaseExtractor):
+class SequenceExtractor(SnowflakeBaseExtractor):
     """Extracts sequence metadata from Snowflake."""
 
     def extract(self) -> list[Sequence]:
         """Extract all sequences."""
-        query = """
+        schema_filter, params = self._schema_filter("SEQUENCE_SCHEMA")
+        query = f"""
             SELECT
                 SEQUENCE_SCHEMA,
                 SEQUENCE_NAME,
@@ -419,15 +422,13 @@ class SequenceExtractor(BaseExtractor):
                 CYCLE_OPTION,
                 COMMENT
             FROM INFORMATION_SCHEMA.SEQUENCES
+            WHERE SEQUENCE_SCHEMA <> 'INFORMATION_SCHEMA'
+            {schema_filter}
             ORDER BY SEQUENCE_SCHEMA, SEQUENCE_NAME
         """
-        rows = self.connection.execute_dict(query)
+        rows = self.connection.execute_dict(query, params)
         sequences = []
         for row in rows:
-            schema_name = row["SEQUENCE_SCHEMA"]
-            if not self._should_include_schema(schema_name):
-                continue
-
             # Parse numeric values safely
             def safe_int(val: Any, default: int = 0) -> int:
                 if val is None:
@@ -438,7 +439,7 @@ class SequenceExtractor(BaseExtractor):
                     return default
 
             sequences.append(Sequence(
-                schema_name=schema_name,
+                schema_name=row["SEQUENCE_SCHEMA"],
                 name=row["SEQUENCE_NAME"],
                 data_type=row.get("DATA_TYPE", "NUMBER"),
                 start_value=safe_int(row.get("START_VALUE"), 1),
@@ -453,7 +454,7 @@ class SequenceExtractor(BaseExtractor):
         return sequences
 
 
-class SecurityExtractor(BaseExtractor):
+class SecurityExtractor(SnowflakeBaseExtractor):
     """Extracts security metadata from Snowflake using SHOW commands."""
 
     def extract(self) -> dict[str, list]:
@@ -1,5 +1,8 @@
 """SQLite backend."""
 
+from types import MappingProxyType
+from typing import Mapping, Optional
+
 from .connection import SQLiteConnection
 from .extractors import (
     TableExtractor,
@@ -8,18 +11,21 @@ from .extractors import (
 )
 
 
-def get_extractors() -> dict:
+_EXTRACTORS: Mapping[str, Optional[type]] = MappingProxyType({
+    "tables": TableExtractor,
+    "views": ViewExtractor,
+    "procedures": None,  # SQLite doesn't have stored procedures
+    "functions": None,  # SQLite functions are application-defined
+    "triggers": TriggerExtractor,
+    "types": None,  # SQLite doesn't have user-defined types
+    "sequences": None,  # SQLite uses AUTOINCREMENT
+    "synonyms": None,  # SQLite doesn't have synonyms
+})
+
+
+def get_extractors() -> Mapping[str, Optional[type]]:
     """Get all extractors for SQLite."""
-    return {
-        "tables": TableExtractor,
-        "views": ViewExtractor,
-        "procedures": None,  # SQLite doesn't have stored procedures
-        "functions": None,  # SQLite functions are application-defined
-        "triggers": TriggerExtractor,
-        "types": None,  # SQLite doesn't have user-defined types
-        "sequences": None,  # SQLite uses AUTOINCREMENT
-        "synonyms": None,  # SQLite doesn't have synonyms
-    }
+    return _EXTRACTORS
 
 
 __all__ = [
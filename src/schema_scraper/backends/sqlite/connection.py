@@ -23,7 +23,9 @@ class SQLiteConnection(BaseConnection):
         try:
             db_path = self.config.database_path or self.config.database
             logger.debug(f"Connecting to SQLite: {db_path}")
-            self._connection = sqlite3.connect(db_path)
+            # Pooled connections may be opened and closed on different threads;
+            # ConnectionPool never shares one between threads at the same time
+            self._connection = sqlite3.connect(db_path, check_same_thread=False)
             self._connection.row_factory = sqlite3.Row
             logger.info(f"Connected to {db_path}")
         except sqlite3.Error as e:
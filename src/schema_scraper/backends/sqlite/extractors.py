@@ -276,7 +276,8 @@ class ViewExtractor(BaseExtractor):
 
         for view in views:
             view.columns = self._get_columns(view.name)
-            view.definition = self._get_definition(view.name)
+            if self.config.include_definitions:
+                view.definition = self._get_definition(view.name)
 
         return views
 
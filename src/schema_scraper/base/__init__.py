@@ -1,7 +1,7 @@
 """Base classes and shared interfaces."""
 
-from .connection import BaseConnection
-from .extractor import BaseExtractor
+from .connection import BaseConnection, ConnectionPool
+from .extractor import BaseExtractor, run_extractors
 from .models import (
     CheckConstraint,
     Column,
@@ -25,7 +25,9 @@ from .models import (
 
 __all__ = [
     "BaseConnection",
+    "ConnectionPool",
     "BaseExtractor",
+    "run_extractors",
     "Database",
     "Schema",
     "Table",
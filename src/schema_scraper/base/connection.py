@@ -1,9 +1,10 @@
 """Abstract base class for database connections."""
 
 import logging
+import threading
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from typing import Any, Generator
+from typing import Any, Generator, Iterator, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +15,7 @@ class BaseConnection(ABC):
     def __init__(self, config: Any):
         self.config = config
         self._connection = None
+        self._pool: Optional["ConnectionPool"] = None
 
     @abstractmethod
     def connect(self) -> None:
@@ -31,6 +33,10 @@ class BaseConnection(ABC):
         """Get the active connection."""
         pass
 
+    def is_connected(self) -> bool:
+        """Check whether a connection is currently open."""
+        return self._connection is not None
+
     @contextmanager
     def cursor(self) -> Generator[Any, None, None]:
         """Get a cursor context manager."""
@@ -46,6 +52,25 @@ class BaseConnection(ABC):
             cur.execute(query, params)
             return cur.fetchall()
 
+    def execute_iter(
+        self, query: str, params: tuple = (), arraysize: Optional[int] = None
+    ) -> Iterator[Any]:
+        """
+        Execute a query and yield its rows, fetching arraysize rows at a time.
+
+        arraysize defaults to config.fetch_batch_size. Only one batch is held
+        in memory. Consume the iterator fully before running another query
+        on this connection.
+        """
+        with self.cursor() as cur:
+            cur.arraysize = arraysize or self.config.fetch_batch_size
+            cur.execute(query, params)
+            while True:
+                rows = cur.fetchmany()
+                if not rows:
+                    break
+                yield from rows
+
     def execute_scalar(self, query: str, params: tuple = ()) -> Any:
         """Execute a query and return a single value."""
         with self.cursor() as cur:
@@ -53,16 +78,103 @@ class BaseConnection(ABC):
             row = cur.fetchone()
             return row[0] if row else None
 
+    def _column_names(self, cur: Any) -> list[str]:
+        """Get the dictionary keys for the cursor's current result set."""
+        return [column[0] for column in cur.description]
+
     def execute_dict(self, query: str, params: tuple = ()) -> list[dict[str, Any]]:
         """Execute a query and return results as dictionaries."""
         with self.cursor() as cur:
             cur.execute(query, params)
-            columns = [column[0] for column in cur.description]
+            columns = self._column_names(cur)
             return [dict(zip(columns, row)) for row in cur.fetchall()]
 
+    def iter_dict(
+        self, query: str, params: tuple = (), arraysize: Optional[int] = None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Execute a query and yield its rows as dictionaries, arraysize at a time.
+
+        The streaming counterpart of execute_dict, with the same caveat as
+        execute_iter: consume it fully before running another query.
+        """
+        with self.cursor() as cur:
+            cur.arraysize = arraysize or self.config.fetch_batch_size
+            cur.execute(query, params)
+            columns = self._column_names(cur)
+            while True:
+                rows = cur.fetchmany()
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(zip(columns, row))
+
+    def execute_multi(
+        self, queries: Sequence[tuple[str, tuple]]
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Execute several queries and return each one's rows as dictionaries.
+
+        Runs the queries one at a time; backends whose drivers can return
+        multiple result sets override this to send them as a single batch.
+        """
+        return [self.execute_dict(query, params) for query, params in queries]
+
+    def pool(self) -> "ConnectionPool":
+        """
+        Get the pool of extra connections used for parallel queries.
+
+        Created on first use and kept until the connection's context exits,
+        so successive parallel steps reuse the same connections.
+        """
+        if self._pool is None:
+            self._pool = ConnectionPool(self)
+        return self._pool
+
     def __enter__(self) -> "BaseConnection":
         self.connect()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
         self.disconnect()
+
+
+class ConnectionPool:
+    """Extra connections opened from an existing connection's config.
+
+    Connections are created on first checkout and reused afterwards, so the
+    pool never holds more connections than the number of concurrent users.
+    """
+
+    def __init__(self, connection: BaseConnection):
+        self._factory = type(connection)
+        self._config = connection.config
+        self._lock = threading.Lock()
+        self._idle: list[BaseConnection] = []
+        self._opened: list[BaseConnection] = []
+
+    @contextmanager
+    def checkout(self) -> Generator[BaseConnection, None, None]:
+        """Borrow a connection, opening a new one if none are idle."""
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = self._factory(self._config)
+            conn.connect()
+            with self._lock:
+                self._opened.append(conn)
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                self._idle.append(conn)
+
+    def close(self) -> None:
+        """Close every connection the pool opened."""
+        with self._lock:
+            opened, self._opened, self._idle = self._opened, [], []
+        for conn in opened:
+            conn.disconnect()
@@ -1,19 +1,34 @@
 """Abstract base class for schema extractors."""
 
 import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Any, Callable, Mapping, Sequence
 
-from .connection import BaseConnection
+from .connection import BaseConnection, ConnectionPool
 
 
 class BaseExtractor(ABC):
     """Abstract base class for extracting schema metadata."""
 
+    # Bind placeholder for the driver's paramstyle, formatted with the
+    # 1-based parameter position (e.g. ":{}" for numbered binds)
+    _placeholder = "%s"
+
     def __init__(self, connection: BaseConnection, config: Any):
-        self.connection = connection
+        self._connection = connection
+        self._local = threading.local()
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__)
+        # schema name -> include/exclude decision, filled by _should_include_schema
+        self._schema_decisions: dict[str, bool] = {}
+
+    @property
+    def connection(self) -> BaseConnection:
+        """Connection for the current thread; a pooled one inside _run_parallel tasks."""
+        return getattr(self._local, "connection", None) or self._connection
 
     @abstractmethod
     def extract(self) -> list[Any]:
@@ -21,5 +36,111 @@ class BaseExtractor(ABC):
         pass
 
     def _should_include_schema(self, schema_name: str) -> bool:
-        """Check if a schema should be included based on config."""
-        return self.config.should_include_schema(schema_name)
+        """
+        Check if a schema should be included based on config.
+
+        Called for every row of some list queries over a handful of distinct
+        schema names, so each name's answer is computed once per extractor.
+        """
+        included = self._schema_decisions.get(schema_name)
+        if included is None:
+            included = self._schema_decisions[schema_name] = self.config.should_include_schema(schema_name)
+        return included
+
+    def _schema_filter(self, column: str) -> tuple[str, tuple[str, ...]]:
+        """SQL predicate and parameters applying the schema include/exclude lists."""
+        if self.config.include_schemas:
+            names = tuple(self.config.include_schemas)
+            operator = "IN"
+        elif self.config.exclude_schemas:
+            names = tuple(self.config.exclude_schemas)
+            operator = "NOT IN"
+        else:
+            return "", ()
+        binds = ", ".join(self._placeholder.format(position) for position in range(1, len(names) + 1))
+        return f"AND {column} {operator} ({binds})", names
+
+    def _definition_column(self, expression: str) -> str:
+        """Select expression AS definition, or NULL when definitions are skipped."""
+        # Selecting NULL also lets the server drop joins only needed for the text
+        return f"{expression} AS definition" if self.config.include_definitions else "NULL AS definition"
+
+    def _run_parallel(self, tasks: dict[str, Callable[[], Any]]) -> dict[str, Any]:
+        """
+        Run independent query helpers and return their results by name.
+
+        With config.max_workers > 1 the tasks run in threads, each on its own
+        pooled connection; otherwise they run in order on the main connection.
+        """
+        workers = min(getattr(self.config, "max_workers", 1), len(tasks))
+        if workers <= 1:
+            return {name: task() for name, task in tasks.items()}
+
+        pool = self._connection.pool()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                name: executor.submit(self._run_pooled, pool, task)
+                for name, task in tasks.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+
+    def _map_parallel(self, func: Callable[[Any], Any], items: Sequence[Any]) -> list[Any]:
+        """
+        Apply a per-object helper to every item and return the results in order.
+
+        Used where objects must still be queried one at a time: with
+        config.max_workers > 1 the calls are spread over that many threads,
+        each querying on a pooled connection.
+        """
+        workers = min(getattr(self.config, "max_workers", 1), len(items))
+        if workers <= 1:
+            return [func(item) for item in items]
+
+        pool = self._connection.pool()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda item: self._run_pooled(pool, lambda: func(item)), items
+            ))
+
+    def _run_pooled(self, pool: ConnectionPool, task: Callable[[], Any]) -> Any:
+        """Run a task with self.connection bound to a pooled connection."""
+        with pool.checkout() as conn:
+            self._local.connection = conn
+            try:
+                return task()
+            finally:
+                self._local.connection = None
+
+
+def run_extractors(
+    connection: BaseConnection, config: Any, extractors: Mapping[str, type]
+) -> dict[str, Any]:
+    """
+    Run several extractors and return their results by object type.
+
+    With config.max_workers > 1 and more than one extractor, the extractors
+    run concurrently on pooled connections and each runs its own queries in
+    order, so at most max_workers pooled connections are open besides the
+    caller's. A lone extractor keeps max_workers and parallelizes its own
+    queries instead.
+    """
+    workers = min(config.max_workers, len(extractors))
+    if workers <= 1:
+        return {
+            obj_type: extractor_class(connection, config).extract()
+            for obj_type, extractor_class in extractors.items()
+        }
+
+    serial_config = replace(config, max_workers=1)
+    pool = connection.pool()
+
+    def run(extractor_class: type) -> Any:
+        with pool.checkout() as conn:
+            return extractor_class(conn, serial_config).extract()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            obj_type: executor.submit(run, extractor_class)
+            for obj_type, extractor_class in extractors.items()
+        }
+        return {obj_type: future.result() for obj_type, future in futures.items()}
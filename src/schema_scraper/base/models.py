@@ -7,7 +7,7 @@ if TYPE_CHECKING:
     from typing import List
 
 
-@dataclass
+@dataclass(slots=True)
 class Column:
     """Represents a table or view column."""
 
@@ -54,7 +54,7 @@ class Column:
         return self.data_type
 
 
-@dataclass
+@dataclass(slots=True)
 class PrimaryKey:
     """Represents a primary key constraint."""
 
@@ -63,7 +63,7 @@ class PrimaryKey:
     is_clustered: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ForeignKey:
     """Represents a foreign key constraint."""
 
@@ -76,7 +76,7 @@ class ForeignKey:
     on_update: str = "NO ACTION"
 
 
-@dataclass
+@dataclass(slots=True)
 class Index:
     """Represents an index."""
 
@@ -90,7 +90,7 @@ class Index:
     index_type: str = "BTREE"
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckConstraint:
     """Represents a check constraint."""
 
@@ -98,7 +98,7 @@ class CheckConstraint:
     definition: str
 
 
-@dataclass
+@dataclass(slots=True)
 class UniqueConstraint:
     """Represents a unique constraint."""
 
@@ -106,7 +106,7 @@ class UniqueConstraint:
     columns: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Partition:
     """Represents a table partition."""
 
@@ -119,7 +119,7 @@ class Partition:
     is_readonly: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class PartitionScheme:
     """Represents a partition scheme/function."""
 
@@ -131,7 +131,7 @@ class PartitionScheme:
     partitions: list[Partition] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TablePartitioning:
     """Represents table partitioning information."""
 
@@ -139,7 +139,7 @@ class TablePartitioning:
     is_partitioned: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """Represents a database user."""
 
@@ -152,7 +152,7 @@ class User:
     modify_date: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Role:
     """Represents a database role."""
 
@@ -164,7 +164,7 @@ class Role:
     modify_date: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Permission:
     """Represents an object-level permission."""
 
@@ -178,7 +178,7 @@ class Permission:
     grantor: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RoleMembership:
     """Represents user-role membership."""
 
@@ -229,7 +229,7 @@ class View:
         return f"{self.schema_name}.{self.name}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Parameter:
     """Represents a stored procedure or function parameter."""
 
@@ -279,7 +279,7 @@ class Procedure:
         return f"{self.schema_name}.{self.name}"
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionColumn:
     """Represents a column returned by a table-valued function."""
 
@@ -349,7 +349,7 @@ class Trigger:
         return f"{self.schema_name}.{self.name}"
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeColumn:
     """Represents a column in a table type."""
 
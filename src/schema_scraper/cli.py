@@ -9,6 +9,7 @@ import click
 
 from . import SUPPORTED_BACKENDS, __version__
 from .backends import get_backend
+from .base import run_extractors
 from .base.models import Database
 from .config import ScraperConfig
 from .exceptions import (
@@ -76,6 +77,13 @@ def cli():
               help="Object types to extract (default: all)")
 @click.option("-v", "--verbose", count=True, help="Increase verbosity (-v info, -vv debug)")
 @click.option("--dry-run", is_flag=True, help="Preview without writing files")
+@click.option("--workers", type=click.IntRange(min=1), default=1,
+              help="Parallel database connections (default: 1)")
+@click.option("--fetch-batch-size", type=click.IntRange(min=1), default=5000,
+              help="Rows fetched per batch when streaming large results (default: 5000)")
+@click.option("--no-definitions", is_flag=True,
+              help="Skip fetching SQL definitions of views, procedures and functions")
+@click.option("--no-stats", is_flag=True, help="Skip fetching table row counts and space usage")
 def scrape(
     db_type: str,
     host: str | None,
@@ -98,6 +106,10 @@ def scrape(
     object_types: tuple[str, ...],
     verbose: int,
     dry_run: bool,
+    workers: int,
+    fetch_batch_size: int,
+    no_definitions: bool,
+    no_stats: bool,
 ) -> None:
     """Extract database schema and generate markdown documentation."""
     setup_logging(verbose)
@@ -149,6 +161,10 @@ def scrape(
             ],
             dry_run=dry_run,
             verbosity=verbose,
+            max_workers=workers,
+            fetch_batch_size=fetch_batch_size,
+            include_definitions=not no_definitions,
+            include_stats=not no_stats,
         )
 
         config.validate()
@@ -168,16 +184,16 @@ def scrape(
             if hasattr(conn, "get_version"):
                 db.version = conn.get_version()
 
-            for obj_type, ExtractorClass in extractors.items():
-                if ExtractorClass is None:
-                    continue
-                if not config.should_extract(obj_type):
-                    continue
-
-                click.echo(f"Extracting {obj_type}...")
-                extractor = ExtractorClass(conn, config)
-                objects = extractor.extract()
+            selected = {
+                obj_type: ExtractorClass
+                for obj_type, ExtractorClass in extractors.items()
+                if ExtractorClass is not None and config.should_extract(obj_type)
+            }
+            # The extractors may run concurrently, so they are announced together
+            click.echo(f"Extracting {', '.join(selected)}...")
+            results = run_extractors(conn, config, selected)
 
+            for obj_type, objects in results.items():
                 if obj_type == "security":
                     # Security extractor returns a dict with multiple object types
                     security_data = objects
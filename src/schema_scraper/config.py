@@ -62,6 +62,10 @@ class ScraperConfig:
     # Behavior
     dry_run: bool = False
     verbosity: int = 0
+    max_workers: int = 1  # Parallel connections per extractor; 1 runs sequentially
+    fetch_batch_size: int = 5000  # Rows per fetchmany() batch when streaming results
+    include_definitions: bool = True  # Fetch SQL bodies of views, procedures and functions
+    include_stats: bool = True  # Fetch row counts and space usage of tables
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
@@ -76,6 +80,12 @@ class ScraperConfig:
         if self.port is None and self.host:
             self.port = self._default_port()
 
+        if self.max_workers < 1:
+            raise ConfigurationError("max_workers must be at least 1")
+
+        if self.fetch_batch_size < 1:
+            raise ConfigurationError("fetch_batch_size must be at least 1")
+
     def _default_excluded_schemas(self) -> list[str]:
         """Get default excluded schemas for the database type."""
         defaults = {
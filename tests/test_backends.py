@@ -0,0 +1,55 @@
+"""Tests for backend resolution."""
+
+import pytest
+from schema_scraper.backends import get_backend
+from schema_scraper.exceptions import ConfigurationError
+
+
+class TestGetBackend:
+    """Tests for get_backend()."""
+
+    def test_sqlite_backend(self):
+        """SQLite backend should always be available."""
+        ConnectionClass, extractors = get_backend("sqlite")
+        assert ConnectionClass.__name__ == "SQLiteConnection"
+        assert extractors["tables"] is not None
+        assert extractors["procedures"] is None
+
+    def test_repeat_calls_are_cached(self):
+        """Repeated lookups should return the same objects."""
+        assert get_backend("sqlite") is get_backend("sqlite")
+
+    def test_db_type_is_case_insensitive(self):
+        """Mixed-case database types should resolve to the same backend."""
+        assert get_backend("SQLite") is get_backend("sqlite")
+
+    def test_unknown_backend(self):
+        """Unknown database types should raise ConfigurationError."""
+        with pytest.raises(ConfigurationError):
+            get_backend("nosuchdb")
+
+    def test_extractors_are_read_only(self):
+        """The shared extractors mapping should not be mutable."""
+        _, extractors = get_backend("sqlite")
+        with pytest.raises(TypeError):
+            extractors["tables"] = None
+
+    def test_plugin_backend(self, monkeypatch):
+        """Backends registered via entry points should resolve lazily."""
+        from importlib.metadata import EntryPoint
+
+        from schema_scraper import backends
+
+        ep = EntryPoint(
+            name="fakedb",
+            value="schema_scraper.backends.sqlite:SQLiteConnection",
+            group=backends.ENTRY_POINT_GROUP,
+        )
+        monkeypatch.setattr(backends, "_plugin_backends", lambda: {"fakedb": ep})
+        backends._load_backend.cache_clear()
+        try:
+            ConnectionClass, extractors = get_backend("fakedb")
+        finally:
+            backends._load_backend.cache_clear()
+        assert ConnectionClass.__name__ == "SQLiteConnection"
+        assert extractors["tables"] is not None
@@ -184,3 +184,25 @@ class TestScraperConfig:
         """MSSQL should default to port 1433."""
         config = ScraperConfig(db_type="mssql", host="localhost")
         assert config.port == 1433
+
+    def test_max_workers_defaults_to_sequential(self):
+        """Extraction should run on a single connection by default."""
+        assert ScraperConfig().max_workers == 1
+
+    def test_max_workers_must_be_positive(self):
+        """A worker count below one should be rejected."""
+        with pytest.raises(ConfigurationError):
+            ScraperConfig(max_workers=0)
+
+    def test_fetch_batch_size_must_be_positive(self):
+        """A fetch batch size below one should be rejected."""
+        with pytest.raises(ConfigurationError):
+            ScraperConfig(fetch_batch_size=0)
+
+    def test_definitions_included_by_default(self):
+        """SQL definitions should be fetched unless disabled."""
+        assert ScraperConfig().include_definitions is True
+
+    def test_stats_included_by_default(self):
+        """Table statistics should be fetched unless disabled."""
+        assert ScraperConfig().include_stats is True
@@ -0,0 +1,237 @@
+"""Tests for the base extractor and connection helpers."""
+
+import threading
+
+import pytest
+from schema_scraper.backends.sqlite import SQLiteConnection
+from schema_scraper.base import BaseExtractor, ConnectionPool, run_extractors
+from schema_scraper.config import ScraperConfig
+
+
+class DummyExtractor(BaseExtractor):
+    """Extractor that only exposes the base helpers."""
+
+    def extract(self) -> list:
+        return []
+
+
+@pytest.fixture
+def connection(tmp_path):
+    config = ScraperConfig(db_type="sqlite", database_path=str(tmp_path / "test.db"))
+    with SQLiteConnection(config) as conn:
+        yield conn
+
+
+class TestConnectionPool:
+    """Tests for ConnectionPool."""
+
+    def test_reuses_idle_connection(self, connection):
+        """A returned connection should be handed out again."""
+        pool = ConnectionPool(connection)
+        with pool.checkout() as first:
+            pass
+        with pool.checkout() as second:
+            assert second is first
+        pool.close()
+        assert not first.is_connected()
+
+    def test_opens_new_connection_when_busy(self, connection):
+        """Nested checkouts should get distinct connections."""
+        pool = ConnectionPool(connection)
+        with pool.checkout() as first, pool.checkout() as second:
+            assert first is not second
+            assert first is not connection
+        pool.close()
+
+    def test_connection_pool_kept_until_exit(self, tmp_path):
+        """The connection's pool should be reused until its context exits."""
+        config = ScraperConfig(db_type="sqlite", database_path=str(tmp_path / "test.db"))
+        with SQLiteConnection(config) as conn:
+            pool = conn.pool()
+            assert conn.pool() is pool
+            with pool.checkout() as pooled:
+                pass
+        assert not pooled.is_connected()
+        assert not conn.is_connected()
+
+
+class TestShouldIncludeSchema:
+    """Tests for BaseExtractor._should_include_schema."""
+
+    def test_decisions_follow_config(self, connection):
+        """Repeated lookups should keep giving the config's answer."""
+        connection.config.exclude_schemas = ["sys"]
+        extractor = DummyExtractor(connection, connection.config)
+        for _ in range(2):
+            assert extractor._should_include_schema("dbo")
+            assert not extractor._should_include_schema("sys")
+
+
+class TestSchemaFilter:
+    """Tests for BaseExtractor._schema_filter."""
+
+    def test_include_list_uses_placeholders(self, connection):
+        """Included schemas should be bound with the extractor's placeholder."""
+        connection.config.include_schemas = ["app", "hr"]
+        extractor = DummyExtractor(connection, connection.config)
+        assert extractor._schema_filter("s.name") == ("AND s.name IN (%s, %s)", ("app", "hr"))
+
+        class NumberedExtractor(DummyExtractor):
+            _placeholder = ":{}"
+
+        extractor = NumberedExtractor(connection, connection.config)
+        assert extractor._schema_filter("owner") == ("AND owner IN (:1, :2)", ("app", "hr"))
+
+    def test_exclude_list_and_no_lists(self, connection):
+        """Excluded schemas should use NOT IN; no lists should add no predicate."""
+        connection.config.include_schemas = []
+        connection.config.exclude_schemas = ["sys"]
+        extractor = DummyExtractor(connection, connection.config)
+        assert extractor._schema_filter("s.name") == ("AND s.name NOT IN (%s)", ("sys",))
+        connection.config.exclude_schemas = []
+        assert extractor._schema_filter("s.name") == ("", ())
+
+
+class TestDefinitionColumn:
+    """Tests for BaseExtractor._definition_column."""
+
+    def test_aliases_expression_or_null(self, connection):
+        """The definition should be selected AS definition, or NULL when skipped."""
+        extractor = DummyExtractor(connection, connection.config)
+        assert extractor._definition_column("m.definition") == "m.definition AS definition"
+        connection.config.include_definitions = False
+        assert extractor._definition_column("m.definition") == "NULL AS definition"
+
+
+class TestRunParallel:
+    """Tests for BaseExtractor._run_parallel."""
+
+    def test_sequential_uses_main_connection(self, connection):
+        """With one worker, tasks should run on the extractor's connection."""
+        extractor = DummyExtractor(connection, connection.config)
+        results = extractor._run_parallel({"a": lambda: extractor.connection})
+        assert results == {"a": connection}
+
+    def test_parallel_uses_pooled_connections(self, connection):
+        """With several workers, each task should query on its own connection."""
+        connection.config.max_workers = 2
+        extractor = DummyExtractor(connection, connection.config)
+        barrier = threading.Barrier(2)
+
+        def task():
+            barrier.wait(timeout=5)
+            return extractor.connection.execute_scalar("SELECT 1"), extractor.connection
+
+        results = extractor._run_parallel({"a": task, "b": task})
+        assert results["a"][0] == results["b"][0] == 1
+        assert results["a"][1] is not results["b"][1]
+        assert connection not in (results["a"][1], results["b"][1])
+        assert extractor.connection is connection
+
+    def test_pooled_connections_reused_across_calls(self, connection):
+        """Successive parallel steps should run on the same pooled connections."""
+        connection.config.max_workers = 2
+        extractor = DummyExtractor(connection, connection.config)
+        barrier = threading.Barrier(2)
+
+        def task():
+            barrier.wait(timeout=5)
+            return extractor.connection
+
+        first = set(extractor._run_parallel({"a": task, "b": task}).values())
+        second = set(extractor._run_parallel({"a": task, "b": task}).values())
+        assert first == second
+        assert all(conn.is_connected() for conn in first)
+
+
+class TestMapParallel:
+    """Tests for BaseExtractor._map_parallel."""
+
+    def test_results_in_item_order(self, connection):
+        """Results should line up with the items whichever way they run."""
+        for workers in (1, 3):
+            connection.config.max_workers = workers
+            extractor = DummyExtractor(connection, connection.config)
+            results = extractor._map_parallel(
+                lambda n: extractor.connection.execute_scalar("SELECT ?", (n,)), range(5)
+            )
+            assert results == [0, 1, 2, 3, 4]
+
+    def test_parallel_uses_pooled_connections(self, connection):
+        """With several workers, items should be queried on pooled connections."""
+        connection.config.max_workers = 2
+        extractor = DummyExtractor(connection, connection.config)
+        barrier = threading.Barrier(2)
+
+        def task(_):
+            barrier.wait(timeout=5)
+            return extractor.connection
+
+        first, second = extractor._map_parallel(task, ["a", "b"])
+        assert first is not second
+        assert connection not in (first, second)
+
+
+class TestExecuteMulti:
+    """Tests for BaseConnection.execute_multi."""
+
+    def test_runs_each_query(self, connection):
+        """The default implementation should return one row list per query."""
+        results = connection.execute_multi([("SELECT 1 AS a", ()), ("SELECT ? AS b", (2,))])
+        assert results == [[{"a": 1}], [{"b": 2}]]
+
+
+class TestExecuteIter:
+    """Tests for BaseConnection.execute_iter."""
+
+    def test_yields_all_rows_across_batches(self, connection):
+        """Rows should be streamed in order regardless of the batch size."""
+        connection.execute("CREATE TABLE t (n INTEGER)")
+        connection.connection.executemany("INSERT INTO t VALUES (?)", [(n,) for n in range(5)])
+        rows = connection.execute_iter("SELECT n FROM t ORDER BY n", arraysize=2)
+        assert [row[0] for row in rows] == [0, 1, 2, 3, 4]
+
+
+class TestIterDict:
+    """Tests for BaseConnection.iter_dict."""
+
+    def test_yields_dicts_across_batches(self, connection):
+        """Rows should be streamed as dictionaries keyed by column name."""
+        connection.execute("CREATE TABLE t (n INTEGER)")
+        connection.connection.executemany("INSERT INTO t VALUES (?)", [(n,) for n in range(3)])
+        rows = connection.iter_dict("SELECT n FROM t ORDER BY n", arraysize=2)
+        assert list(rows) == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+
+class TestRunExtractors:
+    """Tests for run_extractors()."""
+
+    def test_sequential(self, connection):
+        """With one worker, extractors should share the main connection."""
+
+        class ConnectionExtractor(DummyExtractor):
+            def extract(self):
+                return self.connection
+
+        results = run_extractors(
+            connection, connection.config, {"a": ConnectionExtractor, "b": ConnectionExtractor}
+        )
+        assert results == {"a": connection, "b": connection}
+
+    def test_parallel_extractors_run_serially_inside(self, connection):
+        """Concurrent extractors should each get a pooled connection and one worker."""
+        connection.config.max_workers = 2
+        barrier = threading.Barrier(2)
+
+        class BarrierExtractor(DummyExtractor):
+            def extract(self):
+                barrier.wait(timeout=5)
+                return self.connection, self.config.max_workers
+
+        results = run_extractors(
+            connection, connection.config, {"a": BarrierExtractor, "b": BarrierExtractor}
+        )
+        assert results["a"][0] is not results["b"][0]
+        assert connection not in (results["a"][0], results["b"][0])
+        assert results["a"][1] == results["b"][1] == 1
+        assert connection.config.max_workers == 2
@@ -0,0 +1,136 @@
+"""Tests for the MSSQL connection helpers."""
+
+import pytest
+from schema_scraper.backends.mssql.connection import MSSQLConnection
+from schema_scraper.config import ScraperConfig
+
+
+@pytest.fixture
+def conn():
+    return MSSQLConnection(ScraperConfig(db_type="mssql"))
+
+
+class TestMaskConnectionString:
+    """Tests for password masking in log output."""
+
+    def test_masks_password(self, conn):
+        """Should replace the password value."""
+        masked = conn._mask_connection_string("Server=x;UID=sa;PWD=secret;Database=db")
+        assert masked == "Server=x;UID=sa;PWD=***;Database=db"
+
+    def test_masks_lowercase_keyword(self, conn):
+        """Should mask user-supplied strings regardless of keyword case."""
+        masked = conn._mask_connection_string("Server=x;pwd=secret")
+        assert "secret" not in masked
+
+    def test_no_password(self, conn):
+        """Should leave trusted connection strings untouched."""
+        conn_str = "Server=x;Trusted_Connection=yes"
+        assert conn._mask_connection_string(conn_str) == conn_str
+
+
+class TestBuildConnectionString:
+    """Tests for connection string assembly."""
+
+    def test_sql_auth(self):
+        """Should include credentials and omit the default port."""
+        conn = MSSQLConnection(ScraperConfig(
+            db_type="mssql", host="db", database="Sales", username="sa",
+            password="pw", driver="ODBC Driver 17 for SQL Server",
+        ))
+        assert conn._build_connection_string() == (
+            "Driver={ODBC Driver 17 for SQL Server};Server=db;Database=Sales;UID=sa;PWD=pw"
+        )
+
+    def test_trusted_custom_port_driver_18(self):
+        """Should add the port and trust the certificate for Driver 18."""
+        conn = MSSQLConnection(ScraperConfig(
+            db_type="mssql", host="db", port=1500, database="Sales",
+            trusted_connection=True, driver="ODBC Driver 18 for SQL Server",
+        ))
+        assert conn._build_connection_string() == (
+            "Driver={ODBC Driver 18 for SQL Server};Server=db,1500;Database=Sales;"
+            "Trusted_Connection=yes;TrustServerCertificate=yes"
+        )
+
+    def test_explicit_connection_string(self):
+        """Should pass a configured connection string through unchanged."""
+        conn = MSSQLConnection(ScraperConfig(db_type="mssql", connection_string="DSN=x"))
+        assert conn._build_connection_string() == "DSN=x"
+
+
+class TestConnect:
+    """Tests for connection reuse."""
+
+    def test_connect_reuses_open_connection(self, conn):
+        """Should not reconnect when a connection is already open."""
+        sentinel = object()
+        conn._connection = sentinel
+        conn.connect()
+        assert conn.connection is sentinel
+        assert conn.is_connected()
+
+
+class FakeCursor:
+    """Cursor returning canned result sets in order."""
+
+    def __init__(self, result_sets):
+        self._result_sets = list(result_sets)
+        self.executed = []
+
+    def execute(self, query, params):
+        self.executed.append((query, params))
+
+    @property
+    def description(self):
+        return [(name,) for name in self._result_sets[0][0]]
+
+    def fetchall(self):
+        return self._result_sets[0][1]
+
+    def nextset(self):
+        self._result_sets.pop(0)
+        return bool(self._result_sets)
+
+    def close(self):
+        pass
+
+
+class TestExecuteMulti:
+    """Tests for batched query execution."""
+
+    def test_single_batch_multiple_result_sets(self, conn):
+        """Should send one batch and return each result set as dictionaries."""
+        cursor = FakeCursor([
+            (["a"], [(1,), (2,)]),
+            (["b", "c"], [("x", None)]),
+        ])
+        conn._connection = type("FakePyodbc", (), {"cursor": lambda self: cursor})()
+        results = conn.execute_multi([("SELECT a FROM t WHERE k = ?", (5,)), ("SELECT b, c FROM u", ())])
+        assert results == [[{"a": 1}, {"a": 2}], [{"b": "x", "c": None}]]
+        assert cursor.executed == [("SELECT a FROM t WHERE k = ?;\nSELECT b, c FROM u", (5,))]
+
+
+class TestCursorReuse:
+    """Tests for the shared cursor."""
+
+    def test_cursor_reused_until_disconnect(self, conn):
+        """Should hand out one cursor per connection and close it on disconnect."""
+        created = []
+
+        class FakePyodbc:
+            def cursor(self):
+                created.append(FakeCursor([(["a"], [(1,)])] * 3))
+                return created[-1]
+
+            def close(self):
+                pass
+
+        conn._connection = FakePyodbc()
+        with conn.cursor() as first, conn.cursor() as second:
+            assert first is second
+        conn.disconnect()
+        conn._connection = FakePyodbc()
+        with conn.cursor() as third:
+            assert third is not first
+        assert len(created) == 2
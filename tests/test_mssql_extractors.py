@@ -0,0 +1,29 @@
+"""Tests for the MSSQL extractor helpers."""
+
+from schema_scraper.backends.mssql.extractors import _parse_base_object
+
+
+class TestParseBaseObject:
+    """Tests for synonym base object name parsing."""
+
+    def test_single_part(self):
+        """A bare name should only set the object."""
+        assert _parse_base_object("Orders") == (None, None, None, "Orders")
+
+    def test_bracketed_parts(self):
+        """Brackets should be stripped from each part."""
+        assert _parse_base_object("[Sales].[dbo].[Orders]") == (None, "Sales", "dbo", "Orders")
+
+    def test_four_parts(self):
+        """A four-part name should include the linked server."""
+        assert _parse_base_object("srv.Sales.dbo.Orders") == ("srv", "Sales", "dbo", "Orders")
+
+    def test_dots_inside_brackets(self):
+        """Dots within a bracketed part should not split the name."""
+        assert _parse_base_object("[srv.corp.local].Sales.dbo.[Order]]s]") == (
+            "srv.corp.local", "Sales", "dbo", "Order]s"
+        )
+
+    def test_empty_schema(self):
+        """An omitted schema should be kept as an empty part."""
+        assert _parse_base_object("Sales..Orders") == (None, "Sales", "", "Orders")
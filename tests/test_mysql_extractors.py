@@ -0,0 +1,49 @@
+"""Tests for the MySQL extractor helpers."""
+
+import pytest
+
+pytest.importorskip("mysql.connector")
+
+from schema_scraper.backends.mysql.extractors import TableExtractor  # noqa: E402
+from schema_scraper.base.models import Index  # noqa: E402
+from schema_scraper.config import ScraperConfig  # noqa: E402
+
+
+class FakeConnection:
+    """Connection answering SHOW CREATE TABLE the way MySQLConnection does."""
+
+    def __init__(self, create_sql):
+        self.create_sql = create_sql
+        self.queries = []
+
+    def get_version(self):
+        return "8.0.36"
+
+    def execute_dict(self, query, params=()):
+        self.queries.append(query)
+        # MySQLConnection.execute_dict lowercases result keys
+        return [{"table": "orders", "create table": self.create_sql}]
+
+
+class TestAddFilterDefinitions:
+    """Tests for TableExtractor._add_filter_definitions."""
+
+    def test_reads_filter_from_show_create_table(self):
+        """Should fill in the WHERE clause of a non-primary index."""
+        conn = FakeConnection(
+            "CREATE TABLE `orders` (\n"
+            "  `id` int NOT NULL,\n"
+            "  PRIMARY KEY (`id`),\n"
+            "  INDEX `ix_open` (`id`) WHERE status = 'open')"
+        )
+        extractor = TableExtractor(conn, ScraperConfig(db_type="mysql"))
+        indexes = {
+            ("app", "orders"): [
+                Index(name="PRIMARY", columns=["id"], is_primary_key=True),
+                Index(name="ix_open", columns=["id"]),
+            ]
+        }
+        extractor._add_filter_definitions(indexes)
+        assert conn.queries == ["SHOW CREATE TABLE `app`.`orders`"]
+        assert indexes[("app", "orders")][0].filter_definition is None
+        assert indexes[("app", "orders")][1].filter_definition == "WHERE status = 'open'"